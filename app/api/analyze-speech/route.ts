@@ -1,4 +1,5 @@
 import { type NextRequest, NextResponse } from "next/server";
+import { waitForJob } from "@/lib/jobs";
 
 const BACKEND_URL = process.env.NEXT_PUBLIC_API_URL || "http://localhost:8000";
 
@@ -29,8 +30,14 @@ export async function POST(request: NextRequest) {
       throw new Error(`Backend analysis failed: ${errorText}`);
     }
 
-    // Parse the blob (PDF)
-    const pdfBlob = await response.blob();
+    // The backend queues the analysis; wait for it, then fetch the report PDF
+    const submitted = await response.json();
+    const result = await waitForJob<{ pdf_url: string }>(BACKEND_URL, submitted);
+    const pdfResponse = await fetch(`${BACKEND_URL}${result.pdf_url}`);
+    if (!pdfResponse.ok) {
+      throw new Error(`Report download failed: ${pdfResponse.status}`);
+    }
+    const pdfBlob = await pdfResponse.blob();
 
     return new NextResponse(pdfBlob, {
       status: 200,
@@ -1,4 +1,5 @@
 import { type NextRequest, NextResponse } from "next/server";
+import { waitForJob } from "@/lib/jobs";
 
 const BACKEND_URL = process.env.NEXT_PUBLIC_API_URL || "http://localhost:8000";
 
@@ -20,9 +21,9 @@ export async function POST(request: NextRequest) {
 
     console.log("[INFO] Calling Python backend for YouTube transcription...");
 
-    // Setup AbortController with timeout (5 minutes)
+    // Setup AbortController with timeout for queueing the job
     const controller = new AbortController();
-    timeoutId = setTimeout(() => controller.abort(), 300000); // 5 mins
+    timeoutId = setTimeout(() => controller.abort(), 30000);
 
     const response = await fetch(`http://localhost:8000/api/youtube-transcript`, {
       method: "POST",
@@ -39,7 +40,11 @@ export async function POST(request: NextRequest) {
       throw new Error(`Backend error: ${response.status} - ${errorText}`);
     }
 
-    const data = await response.json();
+    // The backend answers right away with a job id; wait for the job to finish
+    const submitted = await response.json();
+    const data = await waitForJob("http://localhost:8000", submitted, (event) =>
+      console.log("[INFO] Transcription stage:", event.stage),
+    );
     console.log("[SUCCESS] Transcription complete");
     return NextResponse.json(data);
   } catch (error: any) {
@@ -49,7 +54,7 @@ export async function POST(request: NextRequest) {
     let status = 500;
 
     if (error.name === "AbortError") {
-      errorMessage = "The transcription request timed out. Try a shorter video.";
+      errorMessage = "The transcription request timed out. Please try again.";
     } else if (
       error.message.includes("ECONNREFUSED") ||
       error.message.includes("Failed to fetch")
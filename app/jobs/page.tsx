@@ -31,7 +31,7 @@ import { GalaxyHover } from "@/components/galaxy-hover"
 import { useSound } from "@/hooks/use-sound"
 
 interface Job {
-  id: number
+  id: string | number
   title: string
   company: string
   location: string
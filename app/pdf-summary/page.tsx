@@ -49,6 +49,43 @@ export default function PDFSummaryPage() {
     null,
   );
   const [error, setError] = useState<string | null>(null);
+  const [sections, setSections] = useState<string[]>([]);
+  const [sectionProgress, setSectionProgress] = useState({
+    completed: 0,
+    total: 0,
+  });
+
+  const countWords = (text: string) =>
+    text.split(/\s+/).filter(Boolean).length;
+
+  // Returns true once the stream is finished (done or error)
+  const handleSummaryEvent = (event: string, data: any): boolean => {
+    if (event === "section") {
+      setSections((previous) => [...previous, data.summary]);
+      setSectionProgress({ completed: data.completed, total: data.total });
+    } else if (event === "token") {
+      setSummaryResult((previous) => ({
+        summary: (previous?.summary ?? "") + data.text,
+        original_word_count: 0,
+        summary_word_count: 0,
+        compression_ratio: 0,
+        pdf_url: "",
+      }));
+    } else if (event === "done") {
+      setSummaryResult({
+        summary: data.summary,
+        original_word_count: data.word_count_original ?? 0,
+        summary_word_count:
+          data.word_count_summary ?? countWords(data.summary),
+        compression_ratio: data.compressed_ratio ?? 0,
+        pdf_url: data.pdf_path ?? "",
+      });
+      return true;
+    } else if (event === "error") {
+      throw new Error(data.detail);
+    }
+    return false;
+  };
 
   const handleFileUpload = async (
     event: React.ChangeEvent<HTMLInputElement>,
@@ -64,30 +101,42 @@ export default function PDFSummaryPage() {
     setIsProcessing(true);
     setError(null);
     setSummaryResult(null);
+    setSections([]);
+    setSectionProgress({ completed: 0, total: 0 });
 
     try {
       const formData = new FormData();
       formData.append("file", file);
-      const response = await fetch("http://127.0.0.1:8000/api/summarize", {
+      // Server-sent events: section summaries as they finish, then the final summary token by token
+      const response = await fetch("http://127.0.0.1:8000/api/summarize/stream", {
         method: "POST",
         body: formData,
       });
 
-      if (!response.ok) {
+      if (!response.ok || !response.body) {
         throw new Error("Summarization failed");
       }
 
-      const result = await response.json();
-      console.log("this is result", result);
-      const responseData: SummaryResult = {
-        summary: result.summary,
-        original_word_count: result.word_count_original,
-        summary_word_count: result.word_count_summary,
-        compression_ratio: result.compressed_ratio,
-        pdf_url: result.pdf_path,
-      };
-      console.log("this is responseDATA", responseData);
-      setSummaryResult(responseData);
+      const reader = response.body.getReader();
+      const decoder = new TextDecoder();
+      let buffer = "";
+      let finished = false;
+      while (!finished) {
+        const { done, value } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+        const events = buffer.split("\n\n");
+        buffer = events.pop() ?? "";
+        for (const block of events) {
+          const event = block.match(/^event: (.*)$/m)?.[1];
+          const data = block.match(/^data: (.*)$/m)?.[1];
+          if (!event || !data) continue;
+          finished = handleSummaryEvent(event, JSON.parse(data)) || finished;
+        }
+      }
+      if (!finished) {
+        throw new Error("Summary stream ended early");
+      }
     } catch (err) {
       setError("Failed to summarize PDF. Please try again.");
       console.error("Summarization error:", err);
@@ -704,6 +753,28 @@ export default function PDFSummaryPage() {
                       />
                     </motion.div>
                   </div>
+
+                  {/* Section summaries stream in as each part of the document is done */}
+                  {sectionProgress.total > 0 && (
+                    <div className="max-w-2xl mx-auto mt-10 text-left">
+                      <p className="text-emerald-300 text-lg font-semibold mb-4 text-center">
+                        Summarized {sectionProgress.completed} of{" "}
+                        {sectionProgress.total} sections
+                      </p>
+                      <div className="space-y-3">
+                        {sections.slice(-3).map((section, index) => (
+                          <motion.p
+                            key={Math.max(sections.length - 3, 0) + index}
+                            initial={{ opacity: 0, y: 10 }}
+                            animate={{ opacity: 1, y: 0 }}
+                            className="text-gray-300 text-sm bg-gray-900/40 rounded-xl p-4 border border-emerald-500/20"
+                          >
+                            {section}
+                          </motion.p>
+                        ))}
+                      </div>
+                    </div>
+                  )}
                 </CardContent>
               </Card>
             </motion.div>
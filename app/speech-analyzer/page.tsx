@@ -39,6 +39,7 @@ import {
 import { Alert, AlertDescription } from "@/components/ui/alert";
 import { motion, AnimatePresence } from "framer-motion";
 import { AuthGuard } from "@/components/auth-guard";
+import { waitForJob } from "@/lib/jobs";
 
 interface AnalysisResult {
   transcript: string;
@@ -79,7 +80,13 @@ export default function SpeechAnalyzerPage() {
         throw new Error("Analysis failed");
       }
 
-      const result = await response.json();
+      // The backend queues the analysis and returns a job id; follow its progress
+      const submitted = await response.json();
+      const result = await waitForJob<AnalysisResult>(
+        "http://127.0.0.1:8000",
+        submitted,
+        (event) => console.log("Analysis stage:", event.stage),
+      );
       setAnalysisResults(result);
     } catch (err) {
       setError("Failed to analyze video. Please try again.");
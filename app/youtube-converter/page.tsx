@@ -30,6 +30,7 @@ import {
 } from "lucide-react";
 import { Alert, AlertDescription } from "@/components/ui/alert";
 import { motion, AnimatePresence } from "framer-motion";
+import { waitForJob } from "@/lib/jobs";
 
 interface TranscriptResult {
   video_info: {
@@ -87,12 +88,19 @@ export default function YouTubeConverterPage() {
         body: JSON.stringify({ url: url.trim() }),
       });
 
-      const result = await response.json();
+      const submitted = await response.json();
 
       if (!response.ok) {
-        throw new Error(result.error || "Transcription failed");
+        throw new Error(submitted.detail || submitted.error || "Transcription failed");
       }
 
+      // The backend queues the work and returns a job id; follow its progress
+      const result = await waitForJob<TranscriptResult>(
+        "http://127.0.0.1:8000",
+        submitted,
+        (event) => console.log("Transcription stage:", event.stage),
+      );
+
       console.log("Transcription successful:", result);
       setTranscriptResult(result);
     } catch (err: any) {
@@ -0,0 +1,77 @@
+export interface JobProgress {
+  id: number
+  stage: string
+  [key: string]: unknown
+}
+
+interface JobState<T> {
+  id: string
+  status: "queued" | "running" | "succeeded" | "failed"
+  stage: string
+  result: T | null
+  error: string | null
+}
+
+const sleep = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms))
+
+async function pollJob<T>(statusUrl: string, onProgress?: (event: JobProgress) => void): Promise<JobState<T>> {
+  let lastStage = ""
+  for (;;) {
+    const response = await fetch(statusUrl)
+    if (!response.ok) {
+      throw new Error(`Job status failed: ${response.status}`)
+    }
+    const job: JobState<T> = await response.json()
+    if (job.stage !== lastStage) {
+      lastStage = job.stage
+      onProgress?.({ id: 0, stage: job.stage })
+    }
+    if (job.status === "succeeded" || job.status === "failed") {
+      return job
+    }
+    await sleep(2000)
+  }
+}
+
+function streamJob<T>(eventsUrl: string, onProgress?: (event: JobProgress) => void): Promise<JobState<T>> {
+  return new Promise((resolve, reject) => {
+    const source = new EventSource(eventsUrl)
+    source.addEventListener("progress", (event) => {
+      onProgress?.(JSON.parse((event as MessageEvent).data))
+    })
+    source.addEventListener("done", (event) => {
+      source.close()
+      resolve(JSON.parse((event as MessageEvent).data))
+    })
+    source.onerror = () => {
+      source.close()
+      reject(new Error("Progress stream closed"))
+    }
+  })
+}
+
+/**
+ * Wait for a backend job returned by POST /api/analyze or /api/youtube-transcript.
+ * Uses the SSE progress stream in the browser and falls back to polling.
+ */
+export async function waitForJob<T>(
+  baseUrl: string,
+  submitted: { job_id: string; status_url: string; events_url: string },
+  onProgress?: (event: JobProgress) => void,
+): Promise<T> {
+  let job: JobState<T>
+  if (typeof EventSource !== "undefined") {
+    try {
+      job = await streamJob<T>(`${baseUrl}${submitted.events_url}`, onProgress)
+    } catch {
+      job = await pollJob<T>(`${baseUrl}${submitted.status_url}`, onProgress)
+    }
+  } else {
+    job = await pollJob<T>(`${baseUrl}${submitted.status_url}`, onProgress)
+  }
+
+  if (job.status === "failed" || !job.result) {
+    throw new Error(job.error || "Job failed")
+  }
+  return job.result
+}
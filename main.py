@@ -1,22 +1,20 @@
 from fastapi import FastAPI, UploadFile, File, HTTPException, Request, Form, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import JSONResponse, FileResponse, HTMLResponse
+from fastapi.responses import JSONResponse, FileResponse, HTMLResponse, StreamingResponse
 from pydantic import BaseModel
-from typing import Optional
+from typing import Dict, List, Optional
 from pathlib import Path
-from PyPDF2 import PdfReader
 import os
-import fitz  # PyMuPDF
-from tempfile import NamedTemporaryFile
 from dotenv import load_dotenv
 load_dotenv()
-from langchain.text_splitter import CharacterTextSplitter
-from langchain_core.prompts import PromptTemplate
-from langchain_groq import ChatGroq
-from langchain.chains.summarize import load_summarize_chain
+import asyncio
+import json
+import math
 import shutil
 import subprocess
+import time
+import uuid
 import sys
 import uvicorn
 app = FastAPI()
@@ -24,91 +22,88 @@ GROQ_API_KEY = os.getenv("GROQ_API_KEY")
 if not GROQ_API_KEY:
     raise ValueError("GROQ_API_KEY environment variable not set")
 
-# --- Load custom modules safely ---
-try:
+from utils.ats_batch import ATS_BATCH_MAX_FILES, batch_workdir, expand_sources, score_batch_stream
+from utils.browser_pool import BROWSER_IDLE_TTL, BROWSER_WARMUP, browser_pool
+from utils.executors import PoolSaturated, cpu_pool, pool_stats, shutdown_pools
+from utils.job_crawler import CRAWL_JOB_WORKERS, JobCrawler
+from utils.job_index import JOB_REFRESH_MAX_AGE, JobIndexRefresher, job_index
+from utils.job_queue import FINISHED as JOB_FINISHED, job_queue
+from utils.model_registry import whisper_registry, warm_up_from_env
+from utils.pdf_text import extract_text
+from utils.rate_limit import scrape_limiter
+from utils.result_cache import result_cache, text_digest
+from utils.services import ServiceUnavailable, services
+from utils.stage_graph import StageError
+from utils.uploads import (MAX_BATCH_BYTES, MAX_PDF_BYTES, MAX_VIDEO_BYTES, MAX_ZIP_BYTES,
+                           UploadLimitMiddleware, save_upload)
+
+# --- Lazily loaded services ---
+# Nothing heavy is imported at boot: each capability loads on first use
+# (or via SERVICES_WARMUP / POST /api/warmup) and /api/health reports it.
+def load_transcriber():
     from utils.transcriber import transcribe_audio
-    print("Transcriber loaded")
-except Exception as e:
-    transcribe_audio = None
-    print(f"Transcriber failed: {e}")
+    return transcribe_audio
 
-try:
+def load_body_language():
     from utils.body_language import analyze_body_language
-    print("Body language analyzer loaded")
-except Exception as e:
-    analyze_body_language = None
-    print(f"Body language analyzer failed: {e}")
+    return analyze_body_language
 
-try:
+def load_speech_analysis():
     from utils.speech_analysis import analyze_speech
-    print("Speech analyzer loaded")
-except Exception as e:
-    analyze_speech = None
-    print(f"Speech analyzer failed: {e}")
+    return analyze_speech
 
-try:
+def load_feedback_generator():
     from utils.feedback_generator import generate_feedback
-    print("Feedback generator loaded")
-except Exception as e:
-    generate_feedback = None
-    print(f"Feedback generator failed: {e}")
+    return generate_feedback
 
-try:
+def load_report_generator():
     from utils.report_generator import generate_pdf_report
-    print("Report generator loaded")
-except Exception as e:
-    generate_pdf_report = None
-    print(f"Report generator failed: {e}")
+    return generate_pdf_report
 
-try:
+def load_analysis_pipeline():
+    for name in ("transcriber", "body_language", "speech_analysis", "feedback_generator"):
+        services.get(name)
+    import pipeline
+    return pipeline
+
+def load_webcam_recorder():
     from webcam_recorder import record_from_webcam
-    print("Webcam recorder loaded")
-except Exception as e:
-    record_from_webcam = None
-    print(f"Webcam recorder failed: {e}")
+    return record_from_webcam
 
-try:
+def load_ats_calculator():
     from utils.ats_calculator import ATSCalculator
-    ats_calculator = ATSCalculator()
-    print("ATS Calculator loaded")
-except Exception as e:
-    ats_calculator = None
-    print(f"ATS Calculator failed: {e}")
+    return ATSCalculator()
 
-try:
+def load_job_scraper():
     from utils.job_scraper import JobScraper
-    job_scraper = JobScraper()
-    print("Job Scraper loaded")
-except Exception as e:
-    job_scraper = None
-    print(f"Job Scraper failed: {e}")
-
-try:
-    from utils.pdf_summarizer import PDFSummarizer
-    pdf_summarizer = PDFSummarizer()
-    print("PDF Summarizer loaded")
-except Exception as e:
-    pdf_summarizer = None
-    print(f"PDF Summarizer failed: {e}")
-
-try:
-    from utils.youtube_converter import YouTubeConverter
+    return JobScraper()
 
-    youtube_converter = YouTubeConverter()
-    
-    print("YouTube Converter loaded")
-except Exception as e:
-    youtube_converter = None
-    print(f"YouTube Converter failed: {e}")
+def load_pdf_summarizer():
+    from utils.pdf_summarizer import pdf_summarizer
+    return pdf_summarizer
 
-try:
-    from pipeline import run_analysis_pipeline
-    print("Pipeline loaded")
-except Exception as e:
-    run_analysis_pipeline = None
-    print(f"Pipeline failed: {e}")
+def load_youtube_converter():
+    from utils.youtube_converter import YouTubeConverter
+    return YouTubeConverter()
+
+services.register("transcriber", load_transcriber)
+services.register("body_language", load_body_language)
+services.register("speech_analysis", load_speech_analysis)
+services.register("feedback_generator", load_feedback_generator)
+services.register("report_generator", load_report_generator)
+services.register("analysis_pipeline", load_analysis_pipeline)
+services.register("webcam_recorder", load_webcam_recorder)
+services.register("ats_calculator", load_ats_calculator)
+services.register("job_scraper", load_job_scraper)
+services.register("pdf_summarizer", load_pdf_summarizer)
+services.register("youtube_converter", load_youtube_converter)
+
+# Keeps the job index filled from the (lazily loaded) scraper
+job_crawler = JobCrawler(job_index, lambda: services.get("job_scraper"))
+job_refresher = JobIndexRefresher(job_index, job_crawler)
 
 # --- Env & Directory Setup ---
+ATS_RANK_MAX_JOBS = int(os.getenv("ATS_RANK_MAX_JOBS", "5000"))
 FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:3000")
 CHAT_URL = os.getenv("CHAT_URL", "http://localhost:5000")
 BACKEND_URL = os.getenv("BACKEND_URL", "http://localhost:8000")
@@ -121,6 +116,15 @@ os.makedirs("static/transcripts", exist_ok=True)
 # --- FastAPI Init ---
 
 
+# Oversized uploads are refused on Content-Length, before the form is parsed
+# (added first so the CORS middleware wraps its 413s)
+app.add_middleware(UploadLimitMiddleware, limits={
+    "/api/analyze": MAX_VIDEO_BYTES,
+    "/score-resume/": MAX_PDF_BYTES,
+    "/api/summarize": MAX_PDF_BYTES,
+    "/api/summarize/stream": MAX_PDF_BYTES,
+    "/api/ats/batch": MAX_BATCH_BYTES,
+})
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # Replace with [FRONTEND_URL] in prod
@@ -136,11 +140,82 @@ if os.path.exists(".next/static"):
 if os.path.exists("public"):
     app.mount("/public", StaticFiles(directory="public"), name="public")
 
+# --- Startup ---
+@app.on_event("startup")
+async def warm_up_models():
+    # Load services and models in the background so the server accepts requests immediately
+    warmup = [name.strip() for name in os.getenv("SERVICES_WARMUP", "").split(",") if name.strip()]
+    if warmup:
+        services.warm_up(None if warmup == ["all"] else warmup)
+    import threading
+    threading.Thread(target=warm_up_from_env, daemon=True).start()
+
+def warm_up_browsers(count: int):
+    try:
+        browser_pool.warm_up(count)
+        print(f"🌐 {count} browser(s) ready")
+    except Exception as e:
+        print(f"⚠️ Browser warm-up failed: {e}")
+
+async def run_periodically(interval: int, fn):
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(fn)
+        except Exception as e:
+            print(f"⚠️ {fn.__qualname__} failed: {e}")
+
+# Idle browsers and Whisper models are otherwise only evicted when another one is checked out
+evictors: List[asyncio.Task] = []
+
+@app.on_event("startup")
+async def start_job_workers():
+    job_queue.start()
+    job_crawler.start()
+    job_refresher.start()
+    if BROWSER_WARMUP:
+        import threading
+        threading.Thread(target=warm_up_browsers, args=(BROWSER_WARMUP,), daemon=True).start()
+    if BROWSER_IDLE_TTL:
+        evictors.append(asyncio.create_task(run_periodically(max(30, BROWSER_IDLE_TTL // 2), browser_pool.evict_idle)))
+    if whisper_registry.idle_ttl:
+        evictors.append(asyncio.create_task(
+            run_periodically(max(30, whisper_registry.idle_ttl // 2), whisper_registry.evict_idle)))
+
+@app.on_event("shutdown")
+async def stop_worker_pools():
+    for task in evictors:
+        task.cancel()
+    job_queue.stop()
+    job_refresher.stop()
+    job_crawler.stop()
+    shutdown_pools()
+    if services.status()["job_scraper"]["state"] == "loaded":
+        services.get("job_scraper").close()
+
+@app.exception_handler(ServiceUnavailable)
+async def service_unavailable_handler(request: Request, exc: ServiceUnavailable):
+    return JSONResponse(status_code=503, content={"detail": str(exc)})
+
+@app.exception_handler(PoolSaturated)
+async def pool_saturated_handler(request: Request, exc: PoolSaturated):
+    return JSONResponse(status_code=503, content={"detail": str(exc)}, headers={"Retry-After": "5"})
+
 # --- Pydantic Models ---
 class ATSRequest(BaseModel):
     resume_text: str
     job_description: str
 
+class ATSRankRequest(BaseModel):
+    resume_text: str
+    jobs: Optional[List[Dict]] = None  # job dicts or {"description": ...}; omitted -> ranked from the job index
+    keyword: str = ""
+    location: str = ""
+    experience: str = ""
+    job_type: str = ""
+    limit: int = 1000
+    top_k: int = 10
+
 class JobSearchRequest(BaseModel):
     keyword: str = "developer"
     location: str = "bangalore"
@@ -149,6 +224,15 @@ class JobSearchRequest(BaseModel):
     page: int = 1
     limit: int = 20
 
+class CrawlTarget(BaseModel):
+    keyword: str
+    location: str
+
+class CrawlRequest(BaseModel):
+    targets: List[CrawlTarget]
+    pages: Optional[int] = None
+    crawl_id: Optional[str] = None  # resume an earlier crawl, skipping its finished targets
+
 class YouTubeRequest(BaseModel):
     url: str
     language: str = "en"
@@ -161,17 +245,22 @@ class AnalysisResult(BaseModel):
     total_score: int
     feedback: str
     pdf_url: str
+    timings: Dict[str, float] = {}
 
 
 # --- Utility ---
 
 
-def extract_text_from_pdf(file: UploadFile) -> str:
-    try:
-        reader = PdfReader(file.file)
-        return "\n".join([page.extract_text() or "" for page in reader.pages])
-    except Exception as e:
-        return f"Error reading PDF: {e}"
+def cached_ats_score(resume_text: str, job_description: str) -> dict:
+    calculator = services.get("ats_calculator")
+    # Scores depend on the model, so a refit corpus model gets fresh cache entries
+    key = text_digest(resume_text, job_description, calculator.model_version)
+    result = result_cache.get("ats", key)
+    if result is None:
+        result = calculator.calculate_ats_score(resume_text, job_description)
+        if "error" not in result:
+            result_cache.set("ats", key, result)
+    return result
 
 # --- Routes ---
 @app.get("/")
@@ -193,16 +282,31 @@ async def root():
 
 @app.get("/api/health")
 async def health_check():
+    scraper_loaded = services.status()["job_scraper"]["state"] == "loaded"
     return {
         "status": "healthy",
-        "services": {
-            "ats_calculator": "active" if ats_calculator else "disabled",
-            "job_scraper": "active" if job_scraper else "disabled",
-            "pdf_summarizer": "active" if pdf_summarizer else "disabled",
-            "youtube_converter": "active" if youtube_converter else "disabled"
-        }
+        "services": services.status(),
+        "whisper": whisper_registry.stats(),
+        "pools": pool_stats(),
+        "scraper": services.get("job_scraper").stats() if scraper_loaded else None,
+        "jobs": job_queue.stats(),
+        "job_index": {**job_index.stats(), "refresher": job_refresher.stats(), "crawler": job_crawler.stats(),
+                      "rate_limit": scrape_limiter.stats()},
+        "cache": result_cache.stats()
     }
 
+class WarmupRequest(BaseModel):
+    services: Optional[List[str]] = None
+
+@app.post("/api/warmup", status_code=202)
+async def warm_up_services(request: WarmupRequest):
+    try:
+        # An explicit warm-up also retries services whose earlier load failed
+        services.warm_up(request.services, retry_failed=True)
+    except KeyError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"status": "warming", "services": services.status()}
+
 @app.get("/chat", response_class=HTMLResponse)
 async def proxy_chat():
     try:
@@ -225,160 +329,332 @@ async def proxy_chat():
 async def score_resume(resume: UploadFile, job_description: str = Form(...)):
     if resume.content_type != "application/pdf":
         return JSONResponse(status_code=400, content={"error": "Only PDF resumes are accepted."})
-    resume_text = extract_text_from_pdf(resume)
-    if "Error" in resume_text:
-        return JSONResponse(status_code=500, content={"error": resume_text})
-    result = ats_calculator.calculate_ats_score(resume_text, job_description)
+    with await save_upload(resume, MAX_PDF_BYTES, suffix=".pdf") as upload:
+        try:
+            resume_text = await cpu_pool.run(extract_text, upload.path)
+        except PoolSaturated:
+            raise
+        except Exception as e:
+            return JSONResponse(status_code=500, content={"error": f"Error reading PDF: {e}"})
+    result = await cpu_pool.run(cached_ats_score, resume_text, job_description)
     return result
 
 @app.post("/ats/score")
 async def ats_score(request: ATSRequest):
-    if not ats_calculator:
-        raise HTTPException(status_code=503, detail="ATS Calculator unavailable")
-    return ats_calculator.calculate_ats_score(request.resume_text, request.job_description)
+    return await cpu_pool.run(cached_ats_score, request.resume_text, request.job_description)
+
+@app.post("/api/ats/batch")
+async def ats_batch(job_description: str = Form(...), files: List[UploadFile] = File(...)):
+    """Score PDFs (or zips of PDFs) against one job description, streamed back as NDJSON"""
+    if not job_description.strip():
+        raise HTTPException(status_code=400, detail="job_description is required")
+    if len(files) > ATS_BATCH_MAX_FILES:
+        raise HTTPException(status_code=400, detail=f"At most {ATS_BATCH_MAX_FILES} files per batch")
+    calculator = await cpu_pool.run(services.get, "ats_calculator")
+
+    # Uploads are spooled to disk before streaming starts; the form closes them after this handler
+    uploads = []
+    try:
+        for file in files:
+            is_zip = (file.filename or "").lower().endswith(".zip")
+            uploads.append(await save_upload(file, MAX_ZIP_BYTES if is_zip else MAX_PDF_BYTES))
+    except BaseException:
+        for upload in uploads:
+            upload.cleanup()
+        raise
+    workdir = batch_workdir()
+
+    def results():
+        try:
+            sources = expand_sources([(upload.filename, upload.path) for upload in uploads], workdir)
+            for item in score_batch_stream(calculator, job_description, sources):
+                yield json.dumps(item) + "\n"
+        finally:
+            for upload in uploads:
+                upload.cleanup()
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    return StreamingResponse(results(), media_type="application/x-ndjson")
+
+@app.post("/api/ats/rank")
+async def ats_rank(request: ATSRankRequest):
+    if not request.resume_text.strip():
+        raise HTTPException(status_code=400, detail="resume_text is required")
+    limit = max(1, min(request.limit, ATS_RANK_MAX_JOBS))
+    top_k = max(1, min(request.top_k, 100))
+
+    def rank():
+        calculator = services.get("ats_calculator")
+        start = time.perf_counter()
+        if request.jobs is not None:
+            jobs = request.jobs[:limit]
+        else:
+            jobs = job_index.candidates(request.keyword, request.location, request.experience,
+                                        request.job_type, limit)
+        results = calculator.rank_jobs(request.resume_text, jobs, top_k)
+        return {"success": True, "ranked": len(jobs), "results": results,
+                "seconds": round(time.perf_counter() - start, 3)}
+
+    return await cpu_pool.run(rank)
+
+@app.post("/api/jobs")
+async def search_jobs(request: JobSearchRequest):
+    # Served from the local index; unseen or stale searches are scraped in the background
+    def search():
+        # All SQLite work runs off the event loop: tracking a search is a write that
+        # can wait on the refresher's upserts
+        result = job_index.query(request.keyword, request.location, request.experience,
+                                 request.job_type, request.page, request.limit)
+        refreshed_at = job_index.search_refreshed_at(request.keyword, request.location)
+        refreshing = bool(request.keyword.strip()) and (
+            refreshed_at is None or time.time() - refreshed_at > JOB_REFRESH_MAX_AGE
+        )
+        if request.keyword.strip():
+            job_refresher.request(request.keyword, request.location, refresh=refreshing)
+        return result, refreshed_at, refreshing
 
-@app.post("/api/analyze", response_model=AnalysisResult)
+    result, refreshed_at, refreshing = await cpu_pool.run(search)
+    return {
+        "success": True,
+        **result,
+        "totalPages": math.ceil(result["total"] / result["limit"]),
+        "indexed_at": refreshed_at,
+        "refreshing": refreshing,
+    }
+
+@app.post("/api/jobs/crawl", status_code=202)
+async def crawl_jobs(request: CrawlRequest):
+    if not request.targets:
+        raise HTTPException(status_code=400, detail="No crawl targets given")
+    crawl_id = request.crawl_id or uuid.uuid4().hex
+    job_id = job_queue.submit("crawl", {
+        "crawl_id": crawl_id,
+        "targets": [[target.keyword, target.location] for target in request.targets],
+        "pages": request.pages,
+    })
+    return {**job_response(job_id), "crawl_id": crawl_id}
+
+def run_crawl_job(payload: Dict, progress) -> Dict:
+    # A restart requeues this job with the same crawl id, so finished targets are skipped
+    summary = job_crawler.crawl(payload["targets"], crawl_id=payload["crawl_id"],
+                                pages=payload.get("pages"), progress=progress)
+    if summary["remaining"]:
+        raise RuntimeError(f"Crawl {payload['crawl_id']} stopped with {summary['remaining']} targets left; "
+                           "resubmit with the same crawl_id to resume")
+    return summary
+
+@app.post("/api/analyze", status_code=202)
 async def analyze_video(file: UploadFile = File(...)):
     print("HELLO ANALYSER")
-    os.makedirs("temp", exist_ok=True)
+    # Loading the analyzers imports torch/MediaPipe; do it off the event loop
+    await cpu_pool.run(services.get, "analysis_pipeline")
+    # A full queue is refused before the upload is stored
+    await cpu_pool.run(job_queue.check_capacity, "analyze")
+    # Stream to a unique temp path; the job worker removes it when done
+    upload = await save_upload(file, MAX_VIDEO_BYTES)
+    print("filename", upload.path)
+    try:
+        job_id = job_queue.submit("analyze", {
+            "file_path": upload.path,
+            "filename": upload.filename,
+            "sha256": upload.sha256,
+        })
+    except PoolSaturated:
+        os.remove(upload.path)
+        raise
+    return job_response(job_id)
+
+def run_analysis_job(payload: Dict, progress) -> Dict:
+    from utils.media_ingest import ingest_media
+
+    pipeline = services.get("analysis_pipeline")
+    file_path = payload["file_path"]
+    filename = payload["filename"]
     os.makedirs("static/reports", exist_ok=True)
-    # Extract safe filename
-    filename = Path(file.filename).name
-    file_path = os.path.join("temp", filename)
-
-    # Delete old temp file if it exists
-    if os.path.exists(file_path):
-        os.remove(file_path)
-
-    print("filename", file_path)
-    with open(file_path, "wb") as f:
-        shutil.copyfileobj(file.file, f)
-        try:
-            transcript = transcribe_audio(file_path)
-            print("✅ Transcript done")
-        except Exception as e:
-            print("❌ Error in transcribe_audio:", e)
-            raise HTTPException(status_code=500, detail=f"transcribe_audio error: {e}")
-        try:
-            speech_score = analyze_speech(file_path)
-            print("✅ Speech analysis done")
-        except Exception as e:
-            print("❌ Error in analyze_speech:", e)
-            raise HTTPException(status_code=500, detail=f"analyze_speech error: {e}")
-
-        try:
-            body_language_score = analyze_body_language(file_path)
-            print("✅ Body language analysis done")
-        except Exception as e:
-            print("❌ Error in analyze_body_language:", e)
-            raise HTTPException(status_code=500, detail=f"body_language_score error: {e}")
-
-        try:
-            feedback = generate_feedback(transcript, speech_score, body_language_score)
-            print("✅ Feedback generation done")
-        except Exception as e:
-            print("❌ Error in generate_feedback:", e)
-            raise HTTPException(status_code=500, detail=f"generate_feedback error: {e}")
-
     try:
-        pdf_filename = filename.replace(".mp4", "_report.pdf")
-        pdf_path = os.path.join("static", "reports", pdf_filename)
-        if os.path.exists(pdf_path):
-            os.remove(pdf_path)
-        generate_pdf_report(transcript, speech_score, body_language_score, feedback, pdf_path)
+        # Probe once, then run the independent analyzers concurrently
+        progress("decoding")
+        media = ingest_media(file_path, digest=payload.get("sha256"))
+        cached = result_cache.get("analysis", media.digest)
+        if cached is not None and os.path.exists(cached["pdf_url"].lstrip("/")):
+            progress("cached")
+            return cached
+        analysis = pipeline.run_analysis_stages(media, progress=progress)
+        print("✅ Analysis done", analysis["timings"])
+    except StageError as e:
+        print(f"❌ Error in {e.stage}:", e.error)
+        raise
+    except Exception as e:
+        print("❌ Error in ingest_media:", e)
+        raise RuntimeError(f"ingest_media error: {e}")
+    finally:
+        if os.path.exists(file_path):
+            os.remove(file_path)
+
+    transcript = analysis["transcript"]
+    speech_score = analysis["speech_score"]
+    body_language_score = analysis["body_language_score"]
+    feedback = analysis["feedback"]
+
+    progress("rendering")
+    pdf_filename = f"{Path(filename).stem}_{Path(file_path).name[:8]}_report.pdf"
+    pdf_path = os.path.join("static", "reports", pdf_filename)
+    try:
+        services.get("report_generator")(transcript, speech_score, body_language_score, feedback, pdf_path)
         print("✅ PDF generation done")
     except Exception as e:
         print("❌ Error in generate_pdf_report:", e)
-    #raise HTTPException(status_code=500, detail=f"generate_pdf_report error: {e}"
-    print("This is transcript",transcript,"\n")
-    print("This is speech_score",speech_score,"\n")
-    print("This is feedback",feedback,"\n")
-    print("This is body_language_score",body_language_score,"\n")
-    
-    return AnalysisResult(
+
+    result = AnalysisResult(
         transcript=transcript,
         speech_score=speech_score,
         body_language_score=body_language_score,
         total_score=speech_score + body_language_score,
         feedback=feedback,
-        pdf_url=f"/static/reports/{pdf_filename}"
-    )
+        pdf_url=f"/static/reports/{pdf_filename}",
+        timings=analysis["timings"]
+    ).model_dump()
+    if os.path.exists(pdf_path):
+        result_cache.set("analysis", media.digest, result)
+    return result
 
 
 class YouTubeRequest(BaseModel):
     url: str
 
-@app.post("/api/youtube-transcript")
+@app.post("/api/youtube-transcript", status_code=202)
 async def convert_youtube(request: YouTubeRequest):
     print("This is youtube url", request.url)
-    if not youtube_converter:
-        raise HTTPException(status_code=503, detail="YouTube Converter service not available")
-    try:
-        result = youtube_converter.youtube_to_transcript(request.url)
-        print("This is resulttttt",result)
-        return result
-    except Exception as e:
-        print("This is error block",f"YouTube conversion failed: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"YouTube conversion failed: {str(e)}")
+    await cpu_pool.run(services.get, "youtube_converter")
+    job_id = job_queue.submit("youtube", {"url": request.url})
+    return job_response(job_id)
+
+def run_youtube_job(payload: Dict, progress) -> Dict:
+    result = services.get("youtube_converter").youtube_to_transcript(payload["url"], progress=progress)
+    print("This is resulttttt", result)
+    if not result.get("success"):
+        raise RuntimeError(f"YouTube conversion failed: {result.get('error')}")
+    return result
 
-@app.post("/api/summarize")
-async def summarize_pdf(file: UploadFile = File(...)):
-    print("Mai function ko hit toh kar raha hu")
-    llm = ChatGroq(
-        groq_api_key=GROQ_API_KEY,
-        model_name="llama3-8b-8192"
-    )
-    SUMMARY_PROMPT = PromptTemplate.from_template("""
-    Summarize the following content clearly and concisely:
-
-    "{text}"
-
-    Summary:
-    """)
-    if not file.filename.endswith(".pdf"):
-        raise HTTPException(status_code=400, detail="Only PDF files are allowed.")
+# --- Background jobs ---
+def job_response(job_id: str) -> Dict:
+    return {
+        "job_id": job_id,
+        "status": "queued",
+        "status_url": f"/api/jobs/{job_id}",
+        "events_url": f"/api/jobs/{job_id}/events",
+    }
 
-    try:
-        print("Save uploaded PDF temporarily")
-        with NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-            tmp.write(await file.read())
-            tmp_path = tmp.name
+job_queue.register("analyze", run_analysis_job)
+job_queue.register("youtube", run_youtube_job)
+# Crawls hold a worker for minutes; their own lane keeps analyses from queueing behind them
+job_queue.add_lane("crawl", CRAWL_JOB_WORKERS)
+job_queue.register("crawl", run_crawl_job, lane="crawl")
+
+@app.get("/api/jobs/{job_id}")
+async def get_job(job_id: str):
+    job = job_queue.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+@app.get("/api/jobs/{job_id}/events")
+async def job_events(job_id: str, request: Request):
+    if not job_queue.get(job_id):
+        raise HTTPException(status_code=404, detail="Job not found")
+    last_id = int(request.headers.get("last-event-id") or 0)
+
+    async def stream():
+        nonlocal last_id
+        idle = 0.0
+        while not await request.is_disconnected():
+            for event in job_queue.events(job_id, last_id):
+                last_id = event["id"]
+                yield f"id: {last_id}\nevent: progress\ndata: {json.dumps(event)}\n\n"
+                idle = 0.0
+            job = job_queue.get(job_id)
+            if job["status"] in JOB_FINISHED:
+                yield f"event: done\ndata: {json.dumps(job)}\n\n"
+                return
+            if idle >= 15:
+                yield ": keep-alive\n\n"
+                idle = 0.0
+            await asyncio.sleep(0.5)
+            idle += 0.5
+
+    return StreamingResponse(stream(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+def summary_counts(text: str, summary: str) -> Dict:
+    original, summarized = len(text.split()), len(summary.split())
+    return {
+        "word_count_original": original,
+        "word_count_summary": summarized,
+        "compressed_ratio": round(summarized / original * 100, 1) if original else 0.0,
+    }
 
-        
-        text = ""
-        with fitz.open(tmp_path) as doc:
-            print("Extract text from PDF using PyMuPDF")
-            for page in doc:
-                text += page.get_text()
-                print("Extract text from PDF using PyMuPDF, this is text", text)
+async def read_pdf_for_summary(file: UploadFile):
+    """Validated upload -> (summarizer, cache key, cached result or None, extracted text or None)"""
+    if not file.filename.endswith(".pdf"):
+        raise HTTPException(status_code=400, detail="Only PDF files are allowed.")
+    summarizer = await cpu_pool.run(services.get, "pdf_summarizer")
+    with await save_upload(file, MAX_PDF_BYTES, suffix=".pdf") as upload:
+        # Salted like the chunk memo, so a new model or prompt does not serve old summaries
+        cache_key = text_digest(summarizer.memo_salt, upload.sha256)
+        cached = result_cache.get("summary", cache_key)
+        if cached is not None:
+            return summarizer, cache_key, cached, None
+        try:
+            text = await cpu_pool.run(extract_text, upload.path)
+        except PoolSaturated:
+            raise
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+    if not text.strip():
+        raise HTTPException(status_code=400, detail="No readable text found in PDF.")
+    return summarizer, cache_key, None, text
 
+@app.post("/api/summarize")
+async def summarize_pdf(file: UploadFile = File(...)):
+    summarizer, cache_key, cached, text = await read_pdf_for_summary(file)
+    if cached is not None:
+        return JSONResponse({**cached, "cached": True})
 
-        os.remove(tmp_path)  # Clean up
+    try:
+        chunks = await cpu_pool.run(summarizer.split, text)
+        result = await summarizer.summarize(chunks)
+        result = {**result, **summary_counts(text, result["summary"])}
+        result_cache.set("summary", cache_key, result)
+        return JSONResponse(result)
+
+    except PoolSaturated:
+        raise
+    except Exception as e:
+        print(f"❌ Summarization failed: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
 
-        if not text.strip():
-            raise HTTPException(status_code=400, detail="No readable text found in PDF.")
+@app.post("/api/summarize/stream")
+async def summarize_pdf_stream(file: UploadFile = File(...)):
+    """Server-sent events: "section" per chunk summary, "token" per piece of the final summary, then "done" """
+    summarizer, cache_key, cached, text = await read_pdf_for_summary(file)
 
-        # Split large text into chunks
-        splitter = CharacterTextSplitter.from_tiktoken_encoder(
-            chunk_size=1500,
-            chunk_overlap=200
-        )
-        docs = splitter.create_documents([text])
-
-        
-        chain = load_summarize_chain(
-            llm=llm,
-            chain_type="map_reduce",
-            map_prompt=SUMMARY_PROMPT,
-            combine_prompt=SUMMARY_PROMPT
-        )
-        summary_result = chain.invoke(docs)
-        print("Create summarization chain", summary_result)
-        return JSONResponse({"summary": summary_result['output_text']})
+    async def stream():
+        if cached is not None:
+            yield f"event: done\ndata: {json.dumps({**cached, 'cached': True})}\n\n"
+            return
+        try:
+            chunks = await cpu_pool.run(summarizer.split, text)
+            async for event, data in summarizer.summarize_events(chunks):
+                if event == "done":
+                    data = {**data, **summary_counts(text, data["summary"])}
+                    result_cache.set("summary", cache_key, data)
+                yield f"event: {event}\ndata: {json.dumps(data)}\n\n"
+        except Exception as e:
+            print(f"❌ Summarization failed: {e}")
+            yield f"event: error\ndata: {json.dumps({'detail': str(e)})}\n\n"
 
-    except Exception as e:
-        print("NOTA", e)
-        raise HTTPException(status_code=500, detail=str(e))
+    return StreamingResponse(stream(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
 
 @app.get("/{path:path}")
 async def catch_all(path: str):
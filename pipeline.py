@@ -1,16 +1,60 @@
+import os
+from typing import Callable, Dict, Optional, Union
+
+from utils.media_ingest import MediaBundle, as_media
 from utils.transcriber import transcribe_audio
 from utils.body_language import analyze_body_language
 from utils.speech_analysis import analyze_speech
 from utils.feedback_generator import generate_feedback
 from utils.report_generator import generate_pdf_report
+from utils.stage_graph import StageGraph
+
+ANALYSIS_WORKERS = int(os.getenv("ANALYSIS_WORKERS", "3"))
+
+# Job progress stage reported for each analysis stage
+PROGRESS_STAGES = {
+    "transcribe_audio": "transcribing",
+    "analyze_speech": "scoring",
+    "analyze_body_language": "scoring",
+    "generate_feedback": "feedback",
+}
+
+def run_analysis_stages(video_path: Union[str, MediaBundle], progress: Optional[Callable] = None) -> Dict:
+    """Run the independent analyzers in parallel and join them for feedback"""
+    media = as_media(video_path)
+
+    def on_event(stage, status, seconds=None):
+        if progress:
+            info = {"step": stage, "status": status}
+            if seconds is not None:
+                info["seconds"] = round(seconds, 3)
+            progress(PROGRESS_STAGES.get(stage, stage), **info)
+
+    graph = StageGraph()
+    graph.add("transcribe_audio", lambda: transcribe_audio(media))
+    graph.add("analyze_speech", lambda: analyze_speech(media))
+    graph.add("analyze_body_language", lambda: analyze_body_language(media))
+    graph.add(
+        "generate_feedback",
+        lambda transcribe_audio, analyze_speech, analyze_body_language:
+            generate_feedback(transcribe_audio, analyze_speech, analyze_body_language),
+        deps=["transcribe_audio", "analyze_speech", "analyze_body_language"],
+    )
+    results, timings = graph.run(max_workers=ANALYSIS_WORKERS, on_event=on_event)
+
+    return {
+        "transcript": results["transcribe_audio"],
+        "speech_score": results["analyze_speech"],
+        "body_language_score": results["analyze_body_language"],
+        "feedback": results["generate_feedback"],
+        "timings": {name: round(seconds, 3) for name, seconds in timings.items()},
+    }
 
 def run_analysis_pipeline(video_path: str) -> str:
-    transcript = transcribe_audio(video_path)
-    speech_score = analyze_speech(video_path)
-    body_score = analyze_body_language(video_path)
-    feedback = generate_feedback(transcript, speech_score, body_score)
+    result = run_analysis_stages(video_path)
 
     output_path = "static/reports/analysis_report.pdf"
-    generate_pdf_report(transcript, speech_score, body_score, feedback, output_path)
+    generate_pdf_report(result["transcript"], result["speech_score"], result["body_language_score"],
+                        result["feedback"], output_path)
 
-    return output_path
\ No newline at end of file
+    return output_path
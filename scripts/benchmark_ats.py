@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Micro-benchmark ATSCalculator.calculate_ats_score against the previous multi-pass implementation.
+
+Usage:
+    python scripts/benchmark_ats.py [--runs 200] [--resume-words 600] [--jd-words 350]
+
+The previous implementation preprocessed each document twice and fitted
+three TfidfVectorizers per call; it is reproduced here as the baseline.
+Synthetic documents are drawn from a tech vocabulary mixed with filler
+prose, at typical resume / job description lengths.
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+
+from utils.ats_calculator import ATSCalculator
+from utils.ats_text import VECTORIZER_PARAMS
+
+SKILLS = ("python django flask fastapi react angular node javascript typescript java spring kotlin sql "
+          "postgresql mysql mongodb redis kafka spark hadoop airflow aws azure gcp docker kubernetes terraform "
+          "jenkins git linux pandas numpy tensorflow pytorch scikit rest graphql microservices agile scrum").split()
+PROSE = ("experience building scalable reliable services with strong ownership collaborating across product design "
+         "and engineering teams delivering features mentoring engineers improving performance monitoring testing "
+         "deployment pipelines customers stakeholders requirements analysis communication problem solving").split()
+
+
+def synthetic_document(words: int, rng: random.Random) -> str:
+    sentences, sentence = [], []
+    for _ in range(words):
+        sentence.append(rng.choice(SKILLS) if rng.random() < 0.3 else rng.choice(PROSE))
+        if len(sentence) >= rng.randint(8, 16):
+            sentences.append(" ".join(sentence).capitalize() + ".")
+            sentence = []
+    sentences.append(" ".join(sentence))
+    return " ".join(sentences)
+
+
+def legacy_extract_keywords(calculator, text, top_n):
+    processed_text = calculator.preprocess(text)
+    vectorizer = TfidfVectorizer(max_features=top_n, **VECTORIZER_PARAMS)
+    tfidf_matrix = vectorizer.fit_transform([processed_text])
+    keyword_scores = sorted(zip(vectorizer.get_feature_names_out(), tfidf_matrix.toarray()[0]),
+                            key=lambda x: x[1], reverse=True)
+    return [keyword for keyword, score in keyword_scores if score > 0]
+
+
+def legacy_calculate_ats_score(calculator, resume_text, job_description):
+    resume_clean = calculator.preprocess(resume_text)
+    job_desc_clean = calculator.preprocess(job_description)
+    vectorizer = TfidfVectorizer(**VECTORIZER_PARAMS)
+    vectors = vectorizer.fit_transform([resume_clean, job_desc_clean])
+    similarity_score = cosine_similarity(vectors[0:1], vectors[1:2])[0][0]
+    job_keywords = legacy_extract_keywords(calculator, job_description, calculator.TOP_JOB_KEYWORDS)
+    resume_keywords = legacy_extract_keywords(calculator, resume_text, calculator.TOP_RESUME_KEYWORDS)
+    job_keywords_set = set(job_keywords[:calculator.KEYWORDS_TO_MATCH])
+    matched_keywords = job_keywords_set & set(resume_keywords)
+    keyword_match_score = (len(matched_keywords) / len(job_keywords_set)) * 100 if job_keywords_set else 0
+    return round((similarity_score * 0.6 + (keyword_match_score / 100) * 0.4) * 100, 2)
+
+
+def time_calls(fn, pairs):
+    timings = []
+    results = []
+    for resume, job in pairs:
+        start = time.perf_counter()
+        results.append(fn(resume, job))
+        timings.append(time.perf_counter() - start)
+    return timings, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument("--resume-words", type=int, default=600)
+    parser.add_argument("--jd-words", type=int, default=350)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    pairs = [(synthetic_document(args.resume_words, rng), synthetic_document(args.jd_words, rng))
+             for _ in range(args.runs)]
+    calculator = ATSCalculator(mode="pair")
+
+    # Warm up imports and caches before timing
+    calculator.calculate_ats_score(*pairs[0])
+    legacy_calculate_ats_score(calculator, *pairs[0])
+
+    legacy_times, legacy_scores = time_calls(lambda r, j: legacy_calculate_ats_score(calculator, r, j), pairs)
+    new_times, new_results = time_calls(calculator.calculate_ats_score, pairs)
+    new_scores = [result["overall_score"] for result in new_results]
+
+    legacy_ms = statistics.median(legacy_times) * 1000
+    new_ms = statistics.median(new_times) * 1000
+    drift = max(abs(a - b) for a, b in zip(legacy_scores, new_scores))
+
+    print(f"📊 calculate_ats_score, {args.runs} calls ({args.resume_words}-word resume, {args.jd_words}-word JD)")
+    print(f"   previous    : {legacy_ms:7.2f} ms/call (median)")
+    print(f"   single-pass : {new_ms:7.2f} ms/call (median)")
+    print(f"   speedup     : {legacy_ms / new_ms:7.2f}x")
+    print(f"   max score difference: {drift:.2f} points")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Benchmark the ATS tokenizer against the previous regex/split preprocessing.
+
+Usage:
+    python scripts/benchmark_tokenizer.py [--documents 10000] [--words 600]
+
+Runs both over a synthetic resume corpus containing symbol-bearing skills
+(C++, C#, Node.js, "5+ years", ...) and reports throughput and how many of
+those skills survive preprocessing.
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+from typing import List, Tuple
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.ats_text import STOP_WORDS, preprocess
+
+WORDS = ("Python Django Flask React Angular JavaScript TypeScript Java Spring Kotlin SQL PostgreSQL MongoDB "
+         "Redis Kafka Spark AWS Azure GCP Docker Kubernetes Terraform Jenkins Git Linux pandas NumPy "
+         "TensorFlow PyTorch REST GraphQL microservices agile scrum").split()
+# Symbol-bearing skills and the tokens they should become
+SYMBOL_SKILLS = {"C++": ["c++"], "C#": ["c#"], "Node.js": ["node.js"], ".NET": [".net"], "ASP.NET": ["asp.net"],
+                 "CI/CD": ["ci", "cd"], "R": ["r"], "UI/UX": ["ui", "ux"], "React.js": ["react.js"]}
+SKILL_TOKENS = {token for tokens in SYMBOL_SKILLS.values() for token in tokens}
+PROSE = ("experience building scalable reliable services with strong ownership, collaborating across product "
+         "design and engineering teams; delivering features, mentoring engineers and improving performance "
+         "(monitoring, testing, deployment pipelines) for customers and stakeholders.").split()
+
+
+def synthetic_resume(words: int, rng: random.Random) -> Tuple[str, int]:
+    """A resume and how many skill tokens it should yield"""
+    tokens, expected = [], 0
+    for _ in range(words):
+        roll = rng.random()
+        if roll < 0.01:
+            tokens.append(f"{rng.randint(2, 9)}+ years")
+            expected += 1
+        elif roll < 0.05:
+            skill = rng.choice(list(SYMBOL_SKILLS))
+            tokens.append(skill + rng.choice(["", ",", ".", ")"]))
+            expected += len(SYMBOL_SKILLS[skill])
+        elif roll < 0.3:
+            tokens.append(rng.choice(WORDS))
+        else:
+            tokens.append(rng.choice(PROSE))
+    return " ".join(tokens), expected
+
+
+def legacy_preprocess(text: str) -> str:
+    """ATSCalculator.preprocess before the tokenizer rewrite"""
+    if not text:
+        return ""
+    text = text.lower()
+    text = re.sub(r'[^a-zA-Z\s]', '', text)
+    text = ' '.join(text.split())
+    tokens = text.split()
+    tokens = [word for word in tokens if word not in STOP_WORDS and len(word) > 2]
+    return ' '.join(tokens)
+
+
+def kept_skills(processed: List[str]) -> int:
+    return sum(token in SKILL_TOKENS or token.endswith("+") for doc in processed for token in doc.split())
+
+
+def run(fn, corpus):
+    start = time.perf_counter()
+    processed = [fn(doc) for doc in corpus]
+    return time.perf_counter() - start, processed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--documents", type=int, default=10_000)
+    parser.add_argument("--words", type=int, default=600)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    corpus, expected = zip(*(synthetic_resume(args.words, rng) for _ in range(args.documents)))
+    expected = sum(expected)
+
+    run(preprocess, corpus[:100])  # warm up
+    legacy_seconds, legacy_docs = run(legacy_preprocess, corpus)
+    new_seconds, new_docs = run(preprocess, corpus)
+
+    print(f"📊 preprocess, {args.documents} synthetic resumes of {args.words} words")
+    print(f"   previous  : {legacy_seconds:6.2f}s ({args.documents / legacy_seconds:8.0f} docs/s), "
+          f"{kept_skills(legacy_docs)}/{expected} skill tokens kept")
+    print(f"   tokenizer : {new_seconds:6.2f}s ({args.documents / new_seconds:8.0f} docs/s), "
+          f"{kept_skills(new_docs)}/{expected} skill tokens kept")
+    print(f"   speedup   : {legacy_seconds / new_seconds:6.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
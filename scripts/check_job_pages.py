@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""Check the HTTP job parser against saved results pages.
+
+Usage:
+    python scripts/check_job_pages.py saved_results_page.html [...]
+
+Saved pages (e.g. from `curl https://www.naukri.com/python-developer-jobs-in-bangalore`)
+are parsed as-is, which is how to check the selectors against live markup.
+The built-in sample page is covered by tests/test_job_parsing.py.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.job_parsing import parse_naukri_listing
+
+
+def parse_saved_pages(paths):
+    for path in paths:
+        with open(path, "r", encoding="utf-8", errors="ignore") as f:
+            jobs, next_url, needs_js = parse_naukri_listing(f.read())
+        print(f"📄 {path}: {len(jobs)} jobs, next page: {next_url or '-'}, needs JS: {needs_js}")
+        for job in jobs[:5]:
+            print(f"   • {job['title']} @ {job['company']} ({job['location']})")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    parse_saved_pages(sys.argv[1:])
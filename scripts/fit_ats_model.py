@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Fit the corpus TF-IDF model used by ATS_MODE=corpus from the job index.
+
+Usage:
+    python scripts/fit_ats_model.py [--min-df 2] [--max-features 200000] [--keep 5]
+    python scripts/fit_ats_model.py --list
+    python scripts/fit_ats_model.py --activate v20250101-120000
+
+Each fit writes a new versioned artifact under ATS_MODEL_DIR and points
+CURRENT at it; running servers pick the new version up on their next
+request. --activate rolls back (or forward) to an existing version.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.ats_calculator import ATSCalculator
+from utils.ats_model import (ATS_MODEL_DIR, ATS_MODEL_MAX_DF, ATS_MODEL_MAX_FEATURES, ATS_MODEL_MIN_DF,
+                             activate_version, current_version, fit_corpus_model, list_versions,
+                             prune_versions, save_corpus_model)
+from utils.job_index import job_index
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--min-df", type=int, default=ATS_MODEL_MIN_DF)
+    parser.add_argument("--max-df", type=float, default=ATS_MODEL_MAX_DF)
+    parser.add_argument("--max-features", type=int, default=ATS_MODEL_MAX_FEATURES)
+    parser.add_argument("--limit", type=int, default=1_000_000, help="most recent jobs to fit on")
+    parser.add_argument("--keep", type=int, default=5, help="artifacts to keep after fitting (0 keeps all)")
+    parser.add_argument("--no-activate", action="store_true", help="write the artifact without switching to it")
+    parser.add_argument("--list", action="store_true", help="list model versions and exit")
+    parser.add_argument("--activate", metavar="VERSION", help="switch CURRENT to an existing version and exit")
+    args = parser.parse_args()
+
+    if args.list:
+        current = current_version()
+        for metadata in list_versions():
+            marker = "*" if metadata["version"] == current else " "
+            print(f"{marker} {metadata['version']}  {metadata['documents']:>8} docs  {metadata['vocabulary']:>8} terms")
+        return 0
+    if args.activate:
+        activate_version(args.activate)
+        print(f"✅ {args.activate} is now the current ATS model")
+        return 0
+
+    calculator = ATSCalculator(mode="pair")
+    start = time.perf_counter()
+    jobs = job_index.candidates(limit=args.limit)
+    documents = [doc for doc in (calculator.preprocess(calculator.job_text(job)) for job in jobs) if doc]
+    if len(documents) < max(args.min_df, 2):
+        print(f"❌ Only {len(documents)} usable jobs in the index; crawl more before fitting")
+        return 1
+    print(f"📚 Fitting on {len(documents)} jobs...")
+
+    vectorizer = fit_corpus_model(documents, args.min_df, args.max_df, args.max_features)
+    metadata = save_corpus_model(vectorizer, len(documents), activate=not args.no_activate)
+    print(f"✅ {metadata['version']}: {metadata['vocabulary']} terms in {time.perf_counter() - start:.1f}s "
+          f"-> {ATS_MODEL_DIR}")
+    if args.keep:
+        removed = prune_versions(args.keep)
+        if removed:
+            print(f"🧹 Removed old versions: {', '.join(removed)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Compare sampled posture scores against full-frame scores on reference clips.
+
+Usage:
+    python scripts/posture_sampling_report.py clips/ [more clips or dirs] [--json report.json]
+
+Every clip is scored once at full resolution on every frame (the baseline)
+and once per sampler configuration; the last configuration also splits
+clips longer than POSE_PARALLEL_MIN_SECONDS across worker processes. The
+report shows each configuration's score error and speedup against the
+baseline.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.body_language import analyze_body_language
+from utils.media_ingest import ingest_media
+
+VIDEO_EXTENSIONS = (".mp4", ".mov", ".mkv", ".webm", ".avi")
+
+# (label, sample_fps, max_side, keyframes_only, workers)
+CONFIGS = [
+    ("full", 0, 0, False, 1),
+    ("640px", 0, 640, False, 1),
+    ("15fps", 15, 0, False, 1),
+    ("10fps+640px", 10, 640, False, 1),
+    ("5fps+480px", 5, 480, False, 1),
+    ("keyframes+640px", 0, 640, True, 1),
+    ("10fps+640px xN", 10, 640, False, os.cpu_count() or 1),
+]
+
+
+def find_clips(paths):
+    clips = []
+    for path in paths:
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                if name.lower().endswith(VIDEO_EXTENSIONS):
+                    clips.append(os.path.join(path, name))
+        else:
+            clips.append(path)
+    return clips
+
+
+def run_report(clips):
+    rows = []
+    for clip in clips:
+        media = ingest_media(clip)
+        row = {"clip": os.path.basename(clip), "duration": round(media.info["duration"], 1), "results": {}}
+        for label, fps, max_side, keyframes_only, workers in CONFIGS:
+            start = time.perf_counter()
+            score = analyze_body_language(media, sample_fps=fps, max_side=max_side,
+                                          keyframes_only=keyframes_only, workers=workers, use_cache=False)
+            row["results"][label] = {"score": score, "seconds": round(time.perf_counter() - start, 2)}
+        rows.append(row)
+        print(f"scored {row['clip']}")
+    return rows
+
+
+def summarize(rows):
+    summary = {}
+    for label, *_ in CONFIGS:
+        errors = [abs(row["results"][label]["score"] - row["results"]["full"]["score"]) for row in rows]
+        base_time = sum(row["results"]["full"]["seconds"] for row in rows)
+        time_taken = sum(row["results"][label]["seconds"] for row in rows)
+        summary[label] = {
+            "mean_abs_error": round(sum(errors) / len(errors), 2),
+            "max_abs_error": max(errors),
+            "speedup": round(base_time / time_taken, 2) if time_taken else 0.0,
+        }
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="+", help="reference clips or directories of clips")
+    parser.add_argument("--json", help="also write the full report to this file")
+    args = parser.parse_args()
+
+    clips = find_clips(args.paths)
+    if not clips:
+        print("❌ No reference clips found")
+        return 1
+
+    rows = run_report(clips)
+    summary = summarize(rows)
+
+    print(f"\n📊 Posture sampling report ({len(rows)} clips)")
+    print(f"{'config':<18}{'mean err':>10}{'max err':>10}{'speedup':>10}")
+    for label, stats in summary.items():
+        print(f"{label:<18}{stats['mean_abs_error']:>10}{stats['max_abs_error']:>10}{stats['speedup']:>9}x")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"clips": rows, "summary": summary}, f, indent=2)
+        print(f"\n📝 Report written to {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Profile backend cold start: import time of main.py and load time of each service.
+
+Usage:
+    python scripts/profile_imports.py [--top 25] [--services ats_calculator,youtube_converter]
+
+Each measurement runs in a fresh interpreter so earlier imports do not
+hide later ones. ``-X importtime`` is used for the per-module breakdown.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SERVICE_SNIPPET = """
+import time
+start = time.perf_counter()
+import main
+boot = time.perf_counter() - start
+start = time.perf_counter()
+ok = main.services.available({name!r})
+load = time.perf_counter() - start
+state = main.services.status()[{name!r}]
+print(f"{{boot:.3f}} {{load:.3f}} {{state['state']}}")
+"""
+
+
+def run_python(args, env):
+    return subprocess.run([sys.executable] + args, cwd=ROOT, env=env,
+                          stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+
+
+def import_profile(env, top):
+    proc = run_python(["-X", "importtime", "-c", "import main"], env)
+    total = 0
+    direct = []
+    for line in proc.stderr.splitlines():
+        # "import time:  self_us |  cumulative_us | <2 spaces per nesting level>name"
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = line.split("|", 2)
+        name = name[1:]
+        if name == "main":
+            total = int(cumulative_us)
+        elif name.startswith("  ") and not name.startswith("    "):
+            direct.append((int(cumulative_us), name.strip()))
+    # Children of main are logged before it, so this only lists imports main.py triggers
+    return total, sorted(direct, reverse=True)[:top], proc.returncode, proc.stderr
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--top", type=int, default=20, help="how many top-level imports to list")
+    parser.add_argument("--services", default="", help="comma separated services to time (default: all)")
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    env.setdefault("GROQ_API_KEY", "profile-only")
+
+    total, rows, code, stderr = import_profile(env, args.top)
+    if code != 0:
+        print(stderr[-2000:])
+        return 1
+
+    print(f"⏱️  import main: {total / 1e6:.3f}s (cumulative, -X importtime)")
+    for cumulative, name in rows:
+        print(f"   {cumulative / 1e3:9.1f} ms  {name}")
+
+    sys.path.insert(0, ROOT)
+    os.environ.setdefault("GROQ_API_KEY", "profile-only")
+    import main as backend
+
+    names = [n.strip() for n in args.services.split(",") if n.strip()] or list(backend.services.status())
+    print("\n🧩 Service load times (fresh interpreter each)")
+    print(f"   {'service':<22}{'boot s':>9}{'load s':>9}  state")
+    for name in names:
+        proc = run_python(["-c", SERVICE_SNIPPET.format(name=name)], env)
+        try:
+            boot, load, state = proc.stdout.strip().splitlines()[-1].split()
+        except (IndexError, ValueError):
+            print(f"   {name:<22}{'-':>9}{'-':>9}  error: {proc.stderr.strip().splitlines()[-1:]}")
+            continue
+        print(f"   {name:<22}{float(boot):>9.3f}{float(load):>9.3f}  {state}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
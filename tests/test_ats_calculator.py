@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+
+from utils.ats_calculator import ATSCalculator
+from utils.ats_text import VECTORIZER_PARAMS, preprocess
+
+JOB = """Senior Python Developer. Build REST APIs with Django and FastAPI, deploy on AWS with
+Docker and Kubernetes, 5+ years of experience with PostgreSQL, CI/CD and Node.js services."""
+
+RESUMES = [
+    "Python developer, 6 years. Django, FastAPI and PostgreSQL APIs on AWS; Docker, Kubernetes, CI/CD.",
+    "Frontend engineer: React.js, Next.js, TypeScript, CSS, Figma. Some Node.js and Express.js.",
+    "Data scientist skilled in Python, pandas, scikit-learn, NLP and ML model deployment with Docker.",
+    "Chef with 10 years of experience in Italian cuisine and kitchen management.",
+]
+
+
+def pairwise_score(resume: str, job: str) -> float:
+    """The original scoring: a TF-IDF fitted on just the two documents"""
+    vectors = TfidfVectorizer(**VECTORIZER_PARAMS).fit_transform([preprocess(resume), preprocess(job)])
+    return float(cosine_similarity(vectors[0], vectors[1])[0, 0])
+
+
+def test_pair_similarities_match_a_per_pair_tfidf_fit():
+    documents = [preprocess(text) for text in RESUMES] + [preprocess(JOB)]
+    counts = CountVectorizer(**VECTORIZER_PARAMS).fit_transform(documents).tocsr()
+
+    similarities = ATSCalculator.pair_similarities(counts[:-1], counts[-1])
+
+    expected = [pairwise_score(resume, JOB) for resume in RESUMES]
+    np.testing.assert_allclose(similarities, expected, rtol=1e-9, atol=1e-12)
+    assert similarities.argmax() == 0
+
+
+def test_score_batch_matches_single_scores():
+    calculator = ATSCalculator(mode="pair")
+    batch = calculator.score_batch(RESUMES + [""], JOB)
+
+    for resume, result in zip(RESUMES, batch):
+        single = calculator.calculate_ats_score(resume, JOB)
+        assert result == single
+        assert result["similarity_score"] == pytest.approx(round(pairwise_score(resume, JOB) * 100, 2))
+    assert batch[-1]["overall_score"] == 0
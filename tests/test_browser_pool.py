@@ -0,0 +1,117 @@
+import threading
+import time
+
+import pytest
+
+from utils.browser_pool import BrowserPool
+from utils.executors import PoolSaturated
+
+
+class FakeDriver:
+    def __init__(self):
+        self.alive = True
+        self.quit_called = threading.Event()
+
+    def execute_script(self, script):
+        if not self.alive:
+            raise RuntimeError("chrome not reachable")
+        return 1
+
+    def quit(self):
+        self.quit_called.set()
+
+
+def make_pool(**kwargs):
+    drivers = []
+
+    def factory():
+        drivers.append(FakeDriver())
+        return drivers[-1]
+
+    options = {"max_sessions": 2, "max_pages": 0, "idle_ttl": 0, "checkout_timeout": 0.1}
+    options.update(kwargs)
+    return BrowserPool(factory=factory, **options), drivers
+
+
+def test_checked_in_session_is_reused():
+    pool, drivers = make_pool()
+    with pool.session() as first:
+        pass
+    with pool.session() as second:
+        assert second is first
+    assert len(drivers) == 1
+    assert pool.stats()["checkouts"] == 2 and pool.stats()["idle"] == 1
+
+
+def test_session_is_recycled_after_max_pages():
+    pool, drivers = make_pool(max_pages=2)
+    with pool.session() as session:
+        session.mark_page(2)
+    assert drivers[0].quit_called.wait(1)
+    with pool.session() as session:
+        assert session.driver is drivers[1]
+    assert pool.stats()["recycled"] == 1
+
+
+def test_unhealthy_idle_session_is_replaced_on_checkout():
+    pool, drivers = make_pool()
+    with pool.session():
+        pass
+    drivers[0].alive = False
+    with pool.session() as session:
+        assert session.driver is drivers[1]
+    assert drivers[0].quit_called.wait(1)
+
+
+def test_failure_inside_session_retires_a_dead_browser():
+    pool, drivers = make_pool()
+    with pytest.raises(ValueError):
+        with pool.session():
+            drivers[0].alive = False
+            raise ValueError("page layout changed")
+    assert pool.stats()["idle"] == 0 and pool.stats()["recycled"] == 1
+
+
+def test_full_pool_waits_then_raises_pool_saturated():
+    pool, _ = make_pool(max_sessions=1)
+    held = pool.checkout()
+    with pytest.raises(PoolSaturated):
+        pool.checkout(timeout=0.05)
+
+    # A waiting caller gets the session as soon as it is checked in
+    threading.Timer(0.05, pool.checkin, args=(held,)).start()
+    assert pool.checkout(timeout=2) is held
+
+
+def test_evict_idle_quits_sessions_past_ttl():
+    pool, drivers = make_pool(idle_ttl=0.05)
+    pool.warm_up()
+    assert pool.stats()["idle"] == 2
+    time.sleep(0.1)
+    pool.evict_idle()
+    assert pool.stats()["idle"] == 0
+    assert all(driver.quit_called.wait(1) for driver in drivers)
+
+
+def test_factory_failure_frees_the_slot():
+    def factory():
+        raise RuntimeError("chromedriver missing")
+
+    pool = BrowserPool(max_sessions=1, checkout_timeout=0.1, factory=factory)
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            pool.checkout()
+    assert pool.stats()["starting"] == 0
+
+
+def test_close_quits_idle_sessions_and_refuses_checkouts():
+    pool, drivers = make_pool()
+    held = pool.checkout()
+    with pool.session():
+        pass
+    pool.close()
+    assert drivers[1].quit_called.is_set()
+    pool.checkin(held)
+    assert drivers[0].quit_called.wait(1)
+    with pytest.raises(RuntimeError):
+        pool.checkout()
@@ -0,0 +1,136 @@
+import sqlite3
+import time
+
+import pytest
+
+from utils import job_index as index_module
+from utils.job_index import JobIndex, JobIndexRefresher, experience_range, fts_query
+
+
+def job(job_id, title, experience="", location="Bangalore", job_type="Full Time", skills=()):
+    return {"id": job_id, "title": title, "company": "Acme", "location": location, "experience": experience,
+            "skills": list(skills), "job_type": job_type, "description": f"{title} role"}
+
+
+@pytest.fixture
+def index(tmp_path):
+    return JobIndex(str(tmp_path / "job_index.db"))
+
+
+def test_experience_range():
+    assert experience_range("2-5 Yrs") == (2, 5)
+    assert experience_range("5+ years") == (5, None)
+    assert experience_range("3 years") == (3, 3)
+    assert experience_range("Fresher") == (None, None)
+
+
+def test_fts_query_quotes_user_input():
+    assert fts_query('C++ "NEAR" OR dev*') == '"c"* "near"* "or"* "dev"*'
+    assert fts_query("!!") == ""
+
+
+def test_upsert_counts_and_keyword_search(index):
+    assert index.upsert([job("a", "Python Developer", skills=["django"]),
+                         job("b", "Java Developer")]) == {"inserted": 2, "updated": 0}
+    assert index.upsert([job("a", "Senior Python Developer", skills=["django"])]) == {"inserted": 0, "updated": 1}
+
+    result = index.query("pyth")  # prefix match
+    assert [j["id"] for j in result["jobs"]] == ["a"]
+    assert result["jobs"][0]["title"] == "Senior Python Developer"
+    assert index.query("developer")["total"] == 2
+    # FTS syntax in user input is matched as words, not parsed
+    assert index.query('python" OR "java')["total"] == 0
+    assert index.query("", location="pune")["total"] == 0
+    assert index.query("django")["jobs"][0]["skills"] == ["django"]
+
+
+def test_experience_filter_keeps_overlapping_and_unstated_ranges(index):
+    index.upsert([job("junior", "Dev", "0-2 Yrs"), job("mid", "Dev", "2-5 Yrs"),
+                  job("senior", "Dev", "6-10 Yrs"), job("open", "Dev", "5+ years"), job("any", "Dev")])
+
+    def ids(experience):
+        return sorted(j["id"] for j in index.query(experience=experience)["jobs"])
+
+    assert ids("3-4 Yrs") == ["any", "mid"]
+    assert ids("7 years") == ["any", "open", "senior"]
+    assert ids("5+") == ["any", "mid", "open", "senior"]
+    assert len(ids("any")) == 5
+
+
+def test_pagination(index):
+    index.upsert([job(str(i), f"Dev {i}") for i in range(5)])
+    page = index.query(page=2, limit=2)
+    assert page["total"] == 5 and len(page["jobs"]) == 2 and page["page"] == 2
+
+
+def test_failed_refresh_keeps_refreshed_at_and_backs_off(index):
+    index.record_search("Python", "Pune", 10)
+    refreshed_at = index.search_refreshed_at("python", "pune")
+    index.record_search("Python", "Pune", error="blocked")
+
+    assert index.search_refreshed_at("python", "pune") == refreshed_at
+    assert index.stats()["failing"] == 1
+    # Due by age, but skipped until the retry delay passes
+    assert index.stale_searches(max_age=0, retry_after=600) == []
+    assert index.stale_searches(max_age=0, retry_after=0) == [("python", "pune")]
+
+    index.record_search("Python", "Pune", 12)
+    assert index.stats()["failing"] == 0
+    assert index.stale_searches(max_age=3600) == []
+
+
+def test_tracked_searches_are_stale_until_scraped(index):
+    index.track_search("  Data  Scientist ", "Mumbai")
+    assert index.stale_searches(max_age=3600) == [("data scientist", "mumbai")]
+    assert index.search_refreshed_at("data scientist", "mumbai") is None
+
+
+def test_prune_drops_unrequested_searches_and_unseen_jobs(index, monkeypatch):
+    index.upsert([job("old", "Dev")])
+    index.track_search("old search", "")
+    now = time.time()
+    monkeypatch.setattr(index_module.time, "time", lambda: now + 100)
+    index.track_search("new search", "")
+    index.upsert([job("new", "Dev")])
+
+    index.prune(max_age=50, search_ttl=50)
+    assert [j["id"] for j in index.query()["jobs"]] == ["new"]
+    assert index.stale_searches(max_age=0) == [("new search", "")]
+
+
+def test_migrate_adds_columns_to_an_old_database(tmp_path):
+    path = str(tmp_path / "old.db")
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE searches (keyword TEXT NOT NULL, location TEXT NOT NULL, refreshed_at REAL,
+                               job_count INTEGER NOT NULL DEFAULT 0, error TEXT, PRIMARY KEY (keyword, location));
+        INSERT INTO searches (keyword, location, refreshed_at) VALUES ('scraped', 'x', 1000.0), ('tracked', 'y', NULL);
+    """)
+    conn.commit()
+    conn.close()
+
+    index = JobIndex(path)
+    rows = {row["keyword"]: dict(row) for row in index._conn().execute("SELECT * FROM searches")}
+    assert rows["scraped"]["last_requested_at"] == 1000.0
+    assert rows["tracked"]["last_requested_at"] is not None
+    assert rows["scraped"]["failed_at"] is None
+    JobIndex(path)  # a second start finds the columns in place
+
+
+def test_refresher_survives_a_failed_run(index):
+    class BrokenCrawler:
+        def crawl(self, targets, crawl_id=None):
+            raise sqlite3.OperationalError("database is locked")
+
+    index.track_search("python", "")
+    refresher = JobIndexRefresher(index, BrokenCrawler(), interval=1)
+    refresher.start()
+    try:
+        deadline = time.time() + 5
+        while refresher.last_error is None and time.time() < deadline:
+            time.sleep(0.02)
+        stats = refresher.stats()
+        assert "database is locked" in stats["last_error"]
+        assert stats["running"]
+    finally:
+        refresher.stop()
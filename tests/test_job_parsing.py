@@ -0,0 +1,44 @@
+from utils.job_parsing import parse_naukri_listing
+
+SAMPLE_PAGE = """
+<html><body>
+<article class="jobTuple bgWhite br4 mb-8">
+  <a class="title fw500 ellipsis" href="/job-listings-python-developer-acme-bangalore-2-5-years-1">Python Developer</a>
+  <a class="subTitle ellipsis fleft">Acme Labs</a>
+  <li class="fleft grey-text br2 placeHolderLi experience"><span class="ellipsis fleft fs12 lh16 expwdth">2-5 Yrs</span></li>
+  <li class="fleft grey-text br2 placeHolderLi salary"><span class="ellipsis fleft fs12 lh16">10-15 Lacs PA</span></li>
+  <li class="fleft grey-text br2 placeHolderLi location"><span class="ellipsis fleft fs12 lh16 locWdth">Bangalore/Bengaluru</span></li>
+  <ul class="tags has-description"><li class="fleft fs12 grey-text lh16 dot">python</li><li class="fleft fs12 grey-text lh16 dot">django</li></ul>
+  <div class="type br2 fleft grey"><span>3 Days Ago</span></div>
+</article>
+<div class="srp-jobtuple-wrapper">
+  <div class="cust-job-tuple">
+    <a class="title" href="https://www.naukri.com/job-listings-backend-engineer-remote-2">Backend Engineer (Remote)</a>
+    <a class="comp-name">Globex</a>
+    <span class="exp"><span class="expwdth">3-6 Yrs</span></span>
+    <span class="loc"><span class="locWdth">Remote</span></span>
+    <ul class="tags-gt"><li>go</li><li>kubernetes</li></ul>
+    <span class="job-post-day">Just Now</span>
+  </div>
+</div>
+<a class="fright fs14 btn-secondary br2" href="/python-developer-jobs-in-bangalore-2">Next</a>
+</body></html>
+"""
+
+JS_SHELL_PAGE = '<html><body><div id="root"></div><script>window.__INITIAL_STATE__={}</script></body></html>'
+
+
+def test_sample_page():
+    jobs, next_url, needs_js = parse_naukri_listing(SAMPLE_PAGE, "https://www.naukri.com/python-developer-jobs-in-bangalore")
+    assert len(jobs) == 2, jobs
+    assert jobs[0]["title"] == "Python Developer" and jobs[0]["company"] == "Acme Labs"
+    assert jobs[0]["salary"] == "10-15 Lacs PA" and jobs[0]["skills"] == ["python", "django"]
+    assert jobs[0]["job_url"].startswith("https://www.naukri.com/job-listings-")
+    assert jobs[1]["salary"] == "Not disclosed" and jobs[1]["remote"] == "hybrid"
+    assert next_url == "https://www.naukri.com/python-developer-jobs-in-bangalore-2"
+    assert not needs_js
+
+
+def test_js_shell_needs_a_browser():
+    jobs, next_url, needs_js = parse_naukri_listing(JS_SHELL_PAGE)
+    assert jobs == [] and next_url is None and needs_js
@@ -0,0 +1,119 @@
+import threading
+import time
+
+import pytest
+
+from utils.executors import PoolSaturated
+from utils.job_queue import FAILED, QUEUED, RUNNING, SUCCEEDED, JobQueue
+
+
+@pytest.fixture
+def queue(tmp_path):
+    # No worker threads: the tests drive claims by hand
+    queue = JobQueue(str(tmp_path / "jobs.db"), workers=0)
+    queue.register("echo", lambda payload, progress: {"echo": payload["n"]})
+    return queue
+
+
+def test_claim_takes_the_oldest_queued_job_once(queue):
+    first = queue.submit("echo", {"n": 1})
+    time.sleep(0.01)
+    second = queue.submit("echo", {"n": 2})
+
+    claimed = queue._claim()
+    assert claimed["id"] == first
+    assert queue.get(first)["status"] == RUNNING
+
+    assert queue._claim()["id"] == second
+    assert queue._claim() is None
+
+
+def test_run_records_result_and_failure(queue):
+    def fail(payload, progress):
+        progress("working", step=1)
+        raise RuntimeError("boom")
+
+    queue.register("fail", fail)
+    ok = queue.submit("echo", {"n": 7})
+    bad = queue.submit("fail", {})
+
+    queue._run_one(queue._claim())
+    queue._run_one(queue._claim())
+
+    assert queue.get(ok)["status"] == SUCCEEDED
+    assert queue.get(ok)["result"] == {"echo": 7}
+    assert queue.get(bad)["status"] == FAILED
+    assert queue.get(bad)["error"] == "boom"
+    assert [event["stage"] for event in queue.events(bad)] == [QUEUED, "working", FAILED]
+
+
+def test_start_requeues_jobs_interrupted_by_a_restart(queue, tmp_path):
+    job_id = queue.submit("echo", {"n": 3})
+    queue._claim()  # the process dies while the job is running
+
+    restarted = JobQueue(str(tmp_path / "jobs.db"), workers=0)
+    restarted.register("echo", lambda payload, progress: {"echo": payload["n"]})
+    restarted.start()
+    assert restarted.get(job_id)["status"] == QUEUED
+
+    restarted._run_one(restarted._claim())
+    assert restarted.get(job_id)["result"] == {"echo": 3}
+
+
+def test_submit_rejects_unknown_kinds(queue):
+    with pytest.raises(ValueError):
+        queue.submit("missing", {})
+
+
+def test_lanes_only_claim_their_own_kinds(queue):
+    queue.add_lane("crawl", 1)
+    queue.register("crawl", lambda payload, progress: {}, lane="crawl")
+    crawl = queue.submit("crawl", {})
+    time.sleep(0.01)
+    analysis = queue.submit("echo", {"n": 1})
+
+    # The older crawl does not hold up the default lane
+    assert queue._claim()["id"] == analysis
+    assert queue._claim() is None
+    assert queue._claim("crawl")["id"] == crawl
+    assert queue.stats()["workers"] == {"default": 0, "crawl": 1}
+
+
+def test_workers_drain_every_lane(tmp_path):
+    queue = JobQueue(str(tmp_path / "jobs.db"), workers=1)
+    queue.add_lane("crawl", 1)
+    release = threading.Event()
+    queue.register("crawl", lambda payload, progress: {"done": release.wait(5)}, lane="crawl")
+    queue.register("echo", lambda payload, progress: {"echo": payload["n"]})
+    queue.start()
+    try:
+        crawl = queue.submit("crawl", {})
+        analysis = queue.submit("echo", {"n": 2})
+        deadline = time.time() + 5
+        while queue.get(analysis)["status"] != SUCCEEDED and time.time() < deadline:
+            time.sleep(0.02)
+        # The analysis finished while the crawl was still running
+        assert queue.get(analysis)["status"] == SUCCEEDED
+        assert queue.get(crawl)["status"] == RUNNING
+        release.set()
+    finally:
+        release.set()
+        queue.stop()
+
+
+def test_full_lane_refuses_new_jobs(tmp_path):
+    queue = JobQueue(str(tmp_path / "jobs.db"), workers=0, max_queued=2)
+    queue.register("echo", lambda payload, progress: {})
+    queue.add_lane("crawl", 0)
+    queue.register("crawl", lambda payload, progress: {}, lane="crawl")
+    queue.submit("echo", {})
+    queue.submit("echo", {})
+
+    with pytest.raises(PoolSaturated):
+        queue.check_capacity("echo")
+    with pytest.raises(PoolSaturated):
+        queue.submit("echo", {})
+    queue.submit("crawl", {})  # other lanes have their own limit
+
+    queue._claim()  # a running job no longer counts
+    queue.submit("echo", {})
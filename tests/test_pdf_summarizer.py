@@ -0,0 +1,107 @@
+import asyncio
+import os
+from types import SimpleNamespace
+
+import pytest
+
+for module in ("groq", "tiktoken", "langchain", "langchain_groq"):
+    pytest.importorskip(module)
+
+os.environ.setdefault("GROQ_API_KEY", "test-key")  # checked at import; no request is sent
+
+from utils import pdf_summarizer as summarizer_module  # noqa: E402
+from utils.rate_limit import TokenBucket  # noqa: E402
+from utils.result_cache import ResultCache, text_digest  # noqa: E402
+
+SUMMARIES = [f"Section {i} covers topic {i * 7 % 13} and its examples in detail." for i in range(40)]
+
+
+class FakeLLM:
+    """Answers every prompt with a digest of it, so equal inputs give equal summaries"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def answer(self, prompt: str) -> str:
+        self.calls += 1
+        return f"summary-{text_digest(prompt)[:12]}"
+
+    async def ainvoke(self, prompt: str):
+        return SimpleNamespace(content=self.answer(prompt))
+
+    async def astream(self, prompt: str):
+        answer = self.answer(prompt)
+        for piece in (answer[:8], answer[8:]):
+            yield SimpleNamespace(content=piece)
+
+
+@pytest.fixture
+def summarizer():
+    return summarizer_module.pdf_summarizer
+
+
+@pytest.fixture
+def fake_llm(summarizer, monkeypatch, tmp_path):
+    llm = FakeLLM()
+    monkeypatch.setattr(summarizer, "llm", llm)
+    monkeypatch.setattr(summarizer_module, "result_cache", ResultCache(str(tmp_path / "cache")))
+    monkeypatch.setattr(summarizer_module, "llm_limiter", TokenBucket(rate=1000, burst=1000))
+    return llm
+
+
+def test_reduce_groups_keep_order_and_token_budget(summarizer):
+    groups = summarizer.reduce_groups(SUMMARIES)
+
+    assert [summary for group in groups for summary in group] == SUMMARIES
+    assert 1 < len(groups) < len(SUMMARIES)
+    assert all(len(group) >= 2 for group in groups[:-1])
+    for group in groups:
+        assert sum(summarizer.count_tokens(summary) for summary in group) <= summarizer_module.SUMMARY_REDUCE_TOKENS
+
+
+def test_reduce_groups_split_long_inputs_by_tokens(summarizer, monkeypatch):
+    monkeypatch.setattr(summarizer_module, "SUMMARY_REDUCE_TOKENS", 40)
+    groups = summarizer.reduce_groups(SUMMARIES)
+
+    assert [summary for group in groups for summary in group] == SUMMARIES
+    for group in groups:
+        # A group only goes over budget when its first two summaries already do
+        tokens = sum(summarizer.count_tokens(summary) for summary in group)
+        assert tokens <= 40 or len(group) == 2
+
+
+def test_reduce_group_boundaries_follow_content(summarizer):
+    groups = summarizer.reduce_groups(SUMMARIES)
+    for group in groups[:-1]:
+        assert int(text_digest(group[-1])[:8], 16) % summarizer_module.SUMMARY_REDUCE_FANOUT == 0
+
+    # Editing the first summary changes its own group only
+    edited = ["Section 0 covers topic 5 and its examples in detail."] + SUMMARIES[1:]
+    assert summarizer.reduce_groups(edited)[1:] == groups[1:]
+
+
+def test_unchanged_document_is_served_from_the_memo(summarizer, fake_llm):
+    chunks = [f"Chunk {i}: " + "lorem ipsum dolor sit amet " * 20 for i in range(12)]
+
+    first = asyncio.run(summarizer.summarize(chunks))
+    assert first["stats"]["llm_calls"] == fake_llm.calls > len(chunks)
+    assert first["stats"]["memo"]["map"]["hits"] == 0
+
+    calls = fake_llm.calls
+    second = asyncio.run(summarizer.summarize(chunks))
+    assert second["summary"] == first["summary"]
+    assert fake_llm.calls == calls and second["stats"]["llm_calls"] == 0
+    assert second["stats"]["memo"]["map"]["hit_ratio"] == 1.0
+    assert second["stats"]["memo"]["reduce"]["hit_ratio"] == 1.0
+
+
+def test_edited_chunk_resummarizes_only_its_path(summarizer, fake_llm):
+    chunks = [f"Chunk {i}: " + "lorem ipsum dolor sit amet " * 20 for i in range(12)]
+    first = asyncio.run(summarizer.summarize(chunks))
+
+    edited = ["Chunk 0 was rewritten. " + chunks[0]] + chunks[1:]
+    second = asyncio.run(summarizer.summarize(edited))
+
+    assert second["stats"]["memo"]["map"] == {"hits": 11, "calls": 12, "hit_ratio": round(11 / 12, 3)}
+    assert 1 < second["stats"]["llm_calls"] < first["stats"]["llm_calls"]
+    assert second["summary"] != first["summary"]
@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+
+from utils import rate_limit
+from utils.rate_limit import DomainRateLimiter, TokenBucket
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Frozen monotonic clock; advance it by adding to ``clock[0]``"""
+    clock = [1000.0]
+    monkeypatch.setattr(rate_limit.time, "monotonic", lambda: clock[0])
+    return clock
+
+
+def test_burst_is_free_then_callers_queue(clock):
+    bucket = TokenBucket(rate=2.0, burst=3)
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    # Each further caller waits one more token interval behind the previous one
+    assert bucket.reserve() == pytest.approx(0.5)
+    assert bucket.reserve() == pytest.approx(1.0)
+
+
+def test_tokens_refill_at_rate_up_to_burst(clock):
+    bucket = TokenBucket(rate=2.0, burst=2)
+    bucket.reserve()
+    bucket.reserve()
+    clock[0] += 0.5
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.5)
+
+    clock[0] += 60
+    assert [bucket.reserve() for _ in range(3)][-1] == pytest.approx(0.5)
+
+
+def test_acquire_async_sleeps_for_the_reserved_delay(clock, monkeypatch):
+    slept = []
+
+    async def fake_sleep(delay):
+        slept.append(delay)
+
+    monkeypatch.setattr(rate_limit.asyncio, "sleep", fake_sleep)
+    bucket = TokenBucket(rate=4.0, burst=1)
+
+    async def acquire_three():
+        for _ in range(3):
+            await bucket.acquire_async()
+
+    asyncio.run(acquire_three())
+    assert slept == [pytest.approx(0.25), pytest.approx(0.5)]
+
+
+def test_domains_get_separate_buckets(clock):
+    limiter = DomainRateLimiter(rate=1.0, burst=1, jitter=0)
+    assert limiter.reserve("https://www.naukri.com/python-jobs") == 0.0
+    assert limiter.reserve("naukri.com") == pytest.approx(1.0)
+    assert limiter.reserve("https://example.com/") == 0.0
+    assert limiter.stats()["domains"] == ["example.com", "naukri.com"]
@@ -0,0 +1,66 @@
+import os
+import time
+
+import pytest
+
+from utils import result_cache as cache_module
+from utils.result_cache import ResultCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResultCache(str(tmp_path / "cache"), memory_entries=8, disk_max_mb=1)
+
+
+def test_values_survive_a_new_process(cache, tmp_path):
+    cache.set("ats", "k", {"score": 80})
+    assert cache.get("ats", "k") == {"score": 80}
+
+    reopened = ResultCache(str(tmp_path / "cache"))
+    assert reopened.get("ats", "k") == {"score": 80}
+    assert reopened.stats()["namespaces"]["ats"]["disk_hits"] == 1
+
+
+def test_expired_entries_are_misses_in_both_tiers(cache, monkeypatch):
+    cache.set("ats", "k", 1, ttl=60)
+    path = cache._path("ats", "k")
+    later = time.time() + 61
+    monkeypatch.setattr(cache_module.time, "time", lambda: later)
+
+    assert cache.get("ats", "k", "missing") == "missing"
+    assert not os.path.exists(path)
+    assert cache.stats()["namespaces"]["ats"]["misses"] == 1
+
+
+def test_namespace_ttls_apply_by_default(cache, monkeypatch):
+    cache.set("ats", "short", 1)  # one day
+    cache.set("summary", "long", 2)  # thirty days
+    later = time.time() + 2 * cache_module.DAY
+    monkeypatch.setattr(cache_module.time, "time", lambda: later)
+
+    assert cache.get("ats", "short") is None
+    assert cache.get("summary", "long") == 2
+
+
+def test_disk_cap_evicts_least_recently_used_files(tmp_path):
+    # No memory tier, so every read goes to disk
+    cache = ResultCache(str(tmp_path / "cache"), memory_entries=0, disk_max_mb=1)
+    blob = "x" * 400 * 1024
+    cache.set("summary", "old", blob)
+    cache.set("summary", "recent", blob)
+    stale = time.time() - 100
+    os.utime(cache._path("summary", "old"), (stale, stale))
+
+    cache.set("summary", "new", blob)  # 1.2 MB on disk, over the 1 MB cap
+
+    assert cache.get("summary", "old") is None
+    assert cache.get("summary", "recent") == blob
+    assert cache.get("summary", "new") == blob
+    assert cache.stats()["disk_mb"] <= 1.0
+
+
+def test_memory_tier_is_bounded(cache):
+    for i in range(20):
+        cache.set("ats", str(i), i)
+    assert cache.stats()["memory_entries"] == 8
+    assert cache.get("ats", "0") == 0  # still on disk
@@ -0,0 +1,58 @@
+import threading
+import time
+
+import pytest
+
+from utils.stage_graph import StageError, StageGraph
+
+
+def test_stages_receive_dependency_results():
+    graph = StageGraph()
+    graph.add("audio", lambda: "wav")
+    graph.add("pose", lambda: 3)
+    graph.add("transcript", lambda audio: f"text from {audio}", deps=["audio"])
+    graph.add("report", lambda transcript, pose: (transcript, pose), deps=["transcript", "pose"])
+
+    results, timings = graph.run()
+    assert results["report"] == ("text from wav", 3)
+    assert set(timings) == {"audio", "pose", "transcript", "report", "total"}
+
+
+def test_unknown_dependency_is_rejected():
+    with pytest.raises(ValueError):
+        StageGraph().add("report", lambda audio: audio, deps=["audio"])
+
+
+def test_independent_stages_run_in_parallel():
+    barrier = threading.Barrier(2, timeout=2)
+    graph = StageGraph()
+    graph.add("a", barrier.wait)
+    graph.add("b", barrier.wait)
+    graph.run()  # would raise BrokenBarrierError if run one after another
+
+
+def test_failure_waits_for_running_stages_and_skips_dependents():
+    slow_finished = threading.Event()
+    started = []
+
+    def slow():
+        time.sleep(0.2)
+        slow_finished.set()
+
+    def fail():
+        raise RuntimeError("no audio track")
+
+    graph = StageGraph()
+    graph.add("pose", slow)
+    graph.add("audio", fail)
+    graph.add("transcript", lambda audio: started.append("transcript"), deps=["audio"])
+
+    events = []
+    with pytest.raises(StageError) as info:
+        graph.run(on_event=lambda stage, event, seconds=None: events.append((stage, event)))
+
+    assert info.value.stage == "audio"
+    assert isinstance(info.value.error, RuntimeError)
+    assert slow_finished.is_set()
+    assert started == []
+    assert ("transcript", "started") not in events
@@ -0,0 +1,59 @@
+from fastapi import FastAPI, File, UploadFile
+from fastapi.testclient import TestClient
+
+from utils import uploads
+from utils.uploads import FORM_OVERHEAD_BYTES, UploadLimitMiddleware
+
+LIMIT = 1024
+
+
+def make_client(tmp_path, monkeypatch):
+    monkeypatch.setattr(uploads, "UPLOAD_DIR", str(tmp_path / "uploads"))
+    app = FastAPI()
+    parsed = []
+
+    @app.post("/upload")
+    async def upload(file: UploadFile = File(...)):
+        parsed.append(file.filename)
+        with await uploads.save_upload(file, LIMIT) as saved:
+            return {"size": saved.size}
+
+    @app.post("/other")
+    async def other(file: UploadFile = File(...)):
+        return {"ok": True}
+
+    app.add_middleware(UploadLimitMiddleware, limits={"/upload": LIMIT})
+    return TestClient(app), parsed
+
+
+def test_small_upload_is_saved(tmp_path, monkeypatch):
+    client, parsed = make_client(tmp_path, monkeypatch)
+    response = client.post("/upload", files={"file": ("a.pdf", b"x" * 100)})
+    assert response.status_code == 200 and response.json() == {"size": 100}
+    assert parsed == ["a.pdf"]
+
+
+def test_declared_oversize_is_refused_before_parsing(tmp_path, monkeypatch):
+    client, parsed = make_client(tmp_path, monkeypatch)
+    response = client.post("/upload", files={"file": ("big.pdf", b"x" * (LIMIT + FORM_OVERHEAD_BYTES + 1))})
+    assert response.status_code == 413
+    assert parsed == []
+
+
+def test_undeclared_oversize_is_cut_off_while_streaming(tmp_path, monkeypatch):
+    client, parsed = make_client(tmp_path, monkeypatch)
+
+    def body():
+        for _ in range(4):
+            yield b"x" * (LIMIT + FORM_OVERHEAD_BYTES)
+
+    response = client.post("/upload", content=body(),
+                           headers={"content-type": "multipart/form-data; boundary=b"})
+    assert response.status_code == 413
+    assert parsed == []
+
+
+def test_unlisted_routes_are_untouched(tmp_path, monkeypatch):
+    client, _ = make_client(tmp_path, monkeypatch)
+    response = client.post("/other", files={"file": ("big.pdf", b"x" * (LIMIT + FORM_OVERHEAD_BYTES + 1))})
+    assert response.status_code == 200
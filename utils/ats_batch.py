@@ -0,0 +1,129 @@
+import os
+import shutil
+import time
+import uuid
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, wait
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from utils.executors import process_pool
+from utils.pdf_text import extract_text
+from utils.uploads import MAX_PDF_BYTES, UPLOAD_DIR
+
+ATS_BATCH_WORKERS = int(os.getenv("ATS_BATCH_WORKERS", str(os.cpu_count() or 2)))
+ATS_BATCH_SIZE = int(os.getenv("ATS_BATCH_SIZE", "32"))
+ATS_BATCH_MAX_FILES = int(os.getenv("ATS_BATCH_MAX_FILES", "1000"))
+
+
+def extract_resume_text(path: str) -> str:
+    """Runs in a worker process; raises on unreadable PDFs"""
+    return extract_text(path, parallel=False)
+
+
+class BatchSource:
+    """One resume in a batch: where its PDF is on disk and what to call it"""
+
+    def __init__(self, index: int, filename: str, path: Optional[str] = None, error: Optional[str] = None,
+                 temporary: bool = False):
+        self.index = index
+        self.filename = filename
+        self.path = path
+        self.error = error
+        self.temporary = temporary  # unpacked from a zip; removed once its text is extracted
+
+
+def expand_sources(paths: Iterable[Tuple[str, str]], workdir: str) -> Iterator[BatchSource]:
+    """PDFs as they are, zip archives member by member, written to ``workdir`` one at a time"""
+    index = 0
+    for filename, path in paths:
+        if not zipfile.is_zipfile(path):
+            yield BatchSource(index, filename, path)
+            index += 1
+            continue
+        with zipfile.ZipFile(path) as archive:
+            for member in archive.infolist():
+                name = member.filename
+                if member.is_dir() or not name.lower().endswith(".pdf") or "__MACOSX" in name:
+                    continue
+                if index >= ATS_BATCH_MAX_FILES:
+                    return
+                if member.file_size > MAX_PDF_BYTES:
+                    yield BatchSource(index, name, error=f"File too large (limit {MAX_PDF_BYTES // (1024 * 1024)} MB)")
+                else:
+                    target = os.path.join(workdir, f"{uuid.uuid4().hex}.pdf")
+                    with archive.open(member) as src, open(target, "wb") as out:
+                        shutil.copyfileobj(src, out, 1024 * 1024)
+                    yield BatchSource(index, name, target, temporary=True)
+                index += 1
+        if index >= ATS_BATCH_MAX_FILES:
+            return
+
+
+def score_batch_stream(calculator, job_description: str, sources: Iterator[BatchSource],
+                       batch_size: int = ATS_BATCH_SIZE, workers: int = ATS_BATCH_WORKERS) -> Iterator[Dict]:
+    """Yield one result per resume as soon as its scoring batch is done, then a summary
+
+    At most ``2 * workers`` PDFs are being extracted and ``batch_size``
+    texts are held for scoring at any time, so memory does not grow with
+    the number of resumes.
+    """
+    started = time.perf_counter()
+    pool = process_pool("ats_batch", workers)
+    in_flight: Dict = {}
+    ready: List[Tuple[BatchSource, str]] = []
+    scored = failed = 0
+    exhausted = False
+
+    def flush():
+        texts = [text for _, text in ready]
+        for (source, _), result in zip(ready, calculator.score_batch(texts, job_description)):
+            yield {"type": "result", "index": source.index, "filename": source.filename, **result}
+        ready.clear()
+
+    while not exhausted or in_flight:
+        while not exhausted and len(in_flight) < 2 * workers:
+            source = next(sources, None)
+            if source is None:
+                exhausted = True
+                break
+            if source.error:
+                failed += 1
+                yield {"type": "error", "index": source.index, "filename": source.filename, "error": source.error}
+                continue
+            in_flight[pool.submit(extract_resume_text, source.path)] = source
+
+        if not in_flight:
+            break
+        done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+        for future in done:
+            source = in_flight.pop(future)
+            if source.temporary:
+                os.remove(source.path)
+            try:
+                text = future.result()
+            except Exception as e:
+                failed += 1
+                yield {"type": "error", "index": source.index, "filename": source.filename,
+                       "error": f"Error reading PDF: {e}"}
+                continue
+            if not text.strip():
+                failed += 1
+                yield {"type": "error", "index": source.index, "filename": source.filename,
+                       "error": "No extractable text (scanned PDF?)"}
+                continue
+            ready.append((source, text))
+            if len(ready) >= batch_size:
+                scored += len(ready)
+                yield from flush()
+
+    if ready:
+        scored += len(ready)
+        yield from flush()
+    yield {"type": "summary", "scored": scored, "failed": failed,
+           "seconds": round(time.perf_counter() - started, 2)}
+
+
+def batch_workdir() -> str:
+    path = os.path.join(UPLOAD_DIR, "batch", uuid.uuid4().hex)
+    os.makedirs(path, exist_ok=True)
+    return path
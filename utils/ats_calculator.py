@@ -1,45 +1,60 @@
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-import nltk
-import string
-import re
+from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
+import numpy as np
 import logging
-from typing import Dict, List, Tuple
+import os
+from typing import Dict, List, Optional, Tuple
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+from utils.ats_model import LoadedModel, corpus_model
+from utils.ats_text import STOP_WORDS, VECTORIZER_PARAMS, preprocess
 
-# Ensure NLTK stopwords are available
-def ensure_nltk_data():
-    try:
-        nltk.data.find('corpora/stopwords')
-    except LookupError:
-        nltk.download('stopwords')
+ATS_MODE = os.getenv("ATS_MODE", "pair")
 
-ensure_nltk_data()
-
-from nltk.corpus import stopwords
+# Configure logging
+logging.basicConfig(level=logging.INFO)
 
 class ATSCalculator:
-    def __init__(self):
-        self.stop_words = set(stopwords.words('english'))
+    def __init__(self, mode: str = ATS_MODE):
+        # "pair" fits TF-IDF on the two documents being compared; "corpus" uses the
+        # offline-fitted job-index model (scripts/fit_ats_model.py) when one exists
+        if mode not in ("pair", "corpus"):
+            raise ValueError(f"Unknown ATS mode: {mode}")
+        self.mode = mode
+        self.stop_words = STOP_WORDS
         self.TOP_JOB_KEYWORDS = 30
         self.TOP_RESUME_KEYWORDS = 50
         self.KEYWORDS_TO_MATCH = 20
 
     def preprocess(self, text: str) -> str:
-        """Clean and preprocess text for ATS analysis"""
-        if not text:
-            return ""
-
-        text = text.lower()
-        text = re.sub(r'[^a-zA-Z\s]', '', text)
-        text = ' '.join(text.split())
-
-        tokens = text.split()
-        tokens = [word for word in tokens if word not in self.stop_words and len(word) > 2]
-
-        return ' '.join(tokens)
+        """Clean and preprocess text for ATS analysis (keeps terms like C++, C#, Node.js and 5+)"""
+        return preprocess(text)
+
+    def corpus(self) -> Optional[LoadedModel]:
+        return corpus_model.get() if self.mode == "corpus" else None
+
+    @property
+    def model_version(self) -> str:
+        """Identifies the scoring model, e.g. for cache keys"""
+        loaded = self.corpus()
+        return loaded.version if loaded else "pair"
+
+    def vectorize(self, documents: List[str]):
+        """L2-normalized TF-IDF rows and their feature names, from the corpus model or a per-call fit"""
+        loaded = self.corpus()
+        if loaded is not None:
+            return loaded.vectorizer.transform(documents), loaded.feature_names
+        vectorizer = TfidfVectorizer(**VECTORIZER_PARAMS)
+        return vectorizer.fit_transform(documents), vectorizer.get_feature_names_out()
+
+    @staticmethod
+    def top_terms(counts, feature_names, top_n: int) -> List[str]:
+        """Highest-count terms of one sparse count row (columns in vocabulary order)
+
+        Selection mirrors CountVectorizer's max_features cut, then ties are
+        listed alphabetically, so results match a per-document fit.
+        """
+        selected = np.argsort(-counts.data)[:top_n]
+        order = sorted(selected, key=lambda i: (-counts.data[i], counts.indices[i]))
+        return [feature_names[counts.indices[i]] for i in order]
 
     def extract_keywords(self, text: str, top_n: int = 20) -> List[str]:
         """Extract top keywords from text"""
@@ -48,73 +63,178 @@ class ATSCalculator:
         if not processed_text:
             return []
 
-        vectorizer = TfidfVectorizer(max_features=top_n, ngram_range=(1, 2), stop_words='english')
         try:
-            tfidf_matrix = vectorizer.fit_transform([processed_text])
-            feature_names = vectorizer.get_feature_names_out()
-            scores = tfidf_matrix.toarray()[0]
-
-            keyword_scores = list(zip(feature_names, scores))
-            keyword_scores.sort(key=lambda x: x[1], reverse=True)
-
-            return [keyword for keyword, score in keyword_scores if score > 0]
+            counter = CountVectorizer(**VECTORIZER_PARAMS)
+            counts = counter.fit_transform([processed_text]).tocsr()
+            counts.sort_indices()
+            return self.top_terms(counts[0], counter.get_feature_names_out(), top_n)
         except Exception as e:
             logging.error(f"Keyword extraction error: {e}")
             return []
 
     def calculate_ats_score(self, resume_text: str, job_description: str) -> Dict:
         """Calculate comprehensive ATS score between resume and job description"""
-        resume_clean = self.preprocess(resume_text)
-        job_desc_clean = self.preprocess(job_description)
+        return self.score_batch([resume_text], job_description)[0]
 
-        if not resume_clean or not job_desc_clean:
-            return {
-                "overall_score": 0,
-                "keyword_match": 0,
-                "missing_keywords": [],
-                "matched_keywords": [],
-                "recommendations": ["Please provide valid resume and job description text."]
-            }
+    def score_batch(self, resume_texts: List[str], job_description: str) -> List[Dict]:
+        """Score many resumes against one job description with a single tokenize/count pass
 
-        try:
-            vectorizer = TfidfVectorizer(ngram_range=(1, 2), stop_words='english')
-            vectors = vectorizer.fit_transform([resume_clean, job_desc_clean])
-            similarity_score = cosine_similarity(vectors[0:1], vectors[1:2])[0][0]
+        Each result equals calculate_ats_score for that resume on its own.
+        """
+        resumes_clean = [self.preprocess(text) for text in resume_texts]
+        job_desc_clean = self.preprocess(job_description)
 
-            job_keywords = self.extract_keywords(job_description, self.TOP_JOB_KEYWORDS)
-            resume_keywords = self.extract_keywords(resume_text, self.TOP_RESUME_KEYWORDS)
+        invalid = {
+            "overall_score": 0,
+            "keyword_match": 0,
+            "missing_keywords": [],
+            "matched_keywords": [],
+            "recommendations": ["Please provide valid resume and job description text."]
+        }
+        if not job_desc_clean:
+            return [dict(invalid) for _ in resume_texts]
+        valid = [i for i, clean in enumerate(resumes_clean) if clean]
+        results = [dict(invalid) for _ in resume_texts]
+        if not valid:
+            return results
 
+        try:
+            # Tokenize and count n-grams once; similarity and both keyword lists share the counts.
+            # Keywords are the most frequent terms of each document, which is what a TF-IDF
+            # fitted on that single document ranks by (its IDF is constant).
+            documents = [resumes_clean[i] for i in valid] + [job_desc_clean]
+            counter = CountVectorizer(**VECTORIZER_PARAMS)
+            counts = counter.fit_transform(documents).tocsr()
+            counts.sort_indices()
+            feature_names = counter.get_feature_names_out()
+            resume_counts, job_counts = counts[:-1], counts[-1]
+
+            loaded = self.corpus()
+            if loaded is not None:
+                vectors = loaded.vectorizer.transform(documents)
+                similarities = np.asarray((vectors[:-1] @ vectors[-1].T).todense()).ravel()
+            else:
+                similarities = self.pair_similarities(resume_counts, job_counts)
+
+            job_keywords = self.top_terms(job_counts, feature_names, self.TOP_JOB_KEYWORDS)
             job_keywords_set = set(job_keywords[:self.KEYWORDS_TO_MATCH])
-            resume_keywords_set = set(resume_keywords)
-
-            matched_keywords = list(job_keywords_set & resume_keywords_set)
-            missing_keywords = list(job_keywords_set - resume_keywords_set)
-
-            keyword_match_score = (len(matched_keywords) / len(job_keywords_set)) * 100 if job_keywords_set else 0
-            overall_score = (similarity_score * 0.6 + (keyword_match_score / 100) * 0.4) * 100
 
-            recommendations = self.generate_recommendations(
-                overall_score, missing_keywords, matched_keywords
-            )
-  
-            return {
-                "overall_score": round(overall_score, 2),
-                "similarity_score": round(similarity_score * 100, 2),
-                "keyword_match": round(keyword_match_score, 2),
-                "matched_keywords": matched_keywords[:10],
-                "missing_keywords": missing_keywords[:10],
-                "recommendations": recommendations,
-                "job_keywords": job_keywords[:15],
-                "resume_keywords": resume_keywords[:15]
-            }
+            for row, i in enumerate(valid):
+                similarity_score = float(similarities[row])
+                resume_keywords = self.top_terms(resume_counts[row], feature_names, self.TOP_RESUME_KEYWORDS)
+                resume_keywords_set = set(resume_keywords)
+
+                matched_keywords = list(job_keywords_set & resume_keywords_set)
+                missing_keywords = list(job_keywords_set - resume_keywords_set)
+
+                keyword_match_score = (len(matched_keywords) / len(job_keywords_set)) * 100 if job_keywords_set else 0
+                overall_score = (similarity_score * 0.6 + (keyword_match_score / 100) * 0.4) * 100
+
+                recommendations = self.generate_recommendations(
+                    overall_score, missing_keywords, matched_keywords
+                )
+
+                results[i] = {
+                    "overall_score": round(overall_score, 2),
+                    "similarity_score": round(similarity_score * 100, 2),
+                    "keyword_match": round(keyword_match_score, 2),
+                    "matched_keywords": matched_keywords[:10],
+                    "missing_keywords": missing_keywords[:10],
+                    "recommendations": recommendations,
+                    "job_keywords": job_keywords[:15],
+                    "resume_keywords": resume_keywords[:15]
+                }
+            return results
 
         except Exception as e:
             logging.error(f"Error calculating ATS score: {e}")
-            return {
+            return [{
                 "overall_score": 0,
                 "error": f"Error calculating ATS score: {str(e)}",
                 "recommendations": ["Please check your input text and try again."]
+            } for _ in resume_texts]
+
+    @staticmethod
+    def pair_similarities(resume_counts, job_counts) -> np.ndarray:
+        """Cosine of each resume with the job under a TF-IDF fitted on just that pair
+
+        For two documents the smoothed IDF is 1 for shared terms and
+        ln(3/2) + 1 for the rest, so every pair's score follows from the
+        shared counts with sparse matrix operations, no per-pair fit.
+        """
+        other = np.log(1.5) + 1
+        job = job_counts.toarray().ravel().astype(np.float64)
+        shared = resume_counts.multiply(job > 0).tocsr()
+        shared_mask = shared.copy()
+        shared_mask.data[:] = 1.0
+
+        dot = shared @ job
+        resume_norm2 = (other ** 2) * np.asarray(resume_counts.power(2).sum(axis=1)).ravel() \
+            - (other ** 2 - 1) * np.asarray(shared.power(2).sum(axis=1)).ravel()
+        job_norm2 = (other ** 2) * float(job @ job) - (other ** 2 - 1) * (shared_mask @ (job ** 2))
+        denominator = np.sqrt(resume_norm2 * job_norm2)
+        return np.divide(dot, denominator, out=np.zeros_like(dot, dtype=np.float64), where=denominator > 0)
+
+    @staticmethod
+    def job_text(job) -> str:
+        """Text scored for a job: a plain description, or a job dict's title, description, skills and company"""
+        if isinstance(job, str):
+            return job
+        skills = job.get("skills") or []
+        if isinstance(skills, list):
+            skills = " ".join(skills)
+        return " ".join(part for part in (job.get("title", ""), job.get("description", ""), skills,
+                                          job.get("company", "")) if part)
+
+    def rank_jobs(self, resume_text: str, jobs: List, top_k: int = 10) -> List[Dict]:
+        """Rank many jobs against one resume in a single vectorized pass
+
+        All documents share one TF-IDF vocabulary (the corpus model's, or one
+        fitted on this batch); cosine similarity for every
+        job is one sparse matrix-vector product (rows are L2-normalized).
+        The best candidates by similarity are then re-ranked by the same
+        60/40 similarity/keyword blend as calculate_ats_score.
+        """
+        resume_clean = self.preprocess(resume_text)
+        job_docs = [self.preprocess(self.job_text(job)) for job in jobs]
+        if not resume_clean or not any(job_docs):
+            return []
+
+        matrix, feature_names = self.vectorize([resume_clean] + job_docs)
+        matrix = matrix.tocsr()
+        resume_vector, job_matrix = matrix[0], matrix[1:]
+        similarity = np.asarray((job_matrix @ resume_vector.T).todense()).ravel()
+
+        shortlist_size = min(len(jobs), max(top_k * 5, 50))
+        shortlist = np.argpartition(-similarity, shortlist_size - 1)[:shortlist_size]
+
+        resume_terms = set(resume_vector.indices)
+        ranked = []
+        for i in shortlist:
+            start, end = job_matrix.indptr[i], job_matrix.indptr[i + 1]
+            terms, weights = job_matrix.indices[start:end], job_matrix.data[start:end]
+            # A job's keywords are its highest-weighted terms
+            job_terms = terms[np.argsort(-weights)[:self.KEYWORDS_TO_MATCH]]
+            matched = [feature_names[t] for t in job_terms if t in resume_terms]
+            missing = [feature_names[t] for t in job_terms if t not in resume_terms]
+            keyword_match_score = len(matched) / len(job_terms) * 100 if len(job_terms) else 0
+            overall_score = (similarity[i] * 0.6 + (keyword_match_score / 100) * 0.4) * 100
+            ranked.append((overall_score, i, keyword_match_score, matched, missing))
+
+        ranked.sort(key=lambda item: (-item[0], item[1]))
+        return [
+            {
+                "rank": position + 1,
+                "index": int(i),
+                "job": jobs[i],
+                "overall_score": round(float(overall_score), 2),
+                "similarity_score": round(float(similarity[i]) * 100, 2),
+                "keyword_match": round(keyword_match_score, 2),
+                "matched_keywords": matched[:10],
+                "missing_keywords": missing[:10],
             }
+            for position, (overall_score, i, keyword_match_score, matched, missing) in enumerate(ranked[:top_k])
+        ]
 
     def generate_recommendations(self, score: float, missing_keywords: List[str], matched_keywords: List[str]) -> List[str]:
         """Generate personalized recommendations based on ATS analysis"""
@@ -0,0 +1,127 @@
+import json
+import os
+import threading
+import time
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+import joblib
+import numpy as np
+import sklearn
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from utils.ats_text import VECTORIZER_PARAMS
+
+ATS_MODEL_DIR = os.getenv("ATS_MODEL_DIR", os.path.join("models", "ats"))
+ATS_MODEL_MIN_DF = int(os.getenv("ATS_MODEL_MIN_DF", "2"))
+ATS_MODEL_MAX_DF = float(os.getenv("ATS_MODEL_MAX_DF", "0.9"))
+ATS_MODEL_MAX_FEATURES = int(os.getenv("ATS_MODEL_MAX_FEATURES", "200000"))
+CURRENT_FILE = "CURRENT"
+
+
+class LoadedModel(NamedTuple):
+    version: str
+    vectorizer: TfidfVectorizer
+    feature_names: np.ndarray
+
+
+def _artifact(model_dir: str, version: str) -> str:
+    return os.path.join(model_dir, f"tfidf-{version}.joblib")
+
+
+def fit_corpus_model(documents: Iterable[str], min_df: int = ATS_MODEL_MIN_DF, max_df: float = ATS_MODEL_MAX_DF,
+                     max_features: int = ATS_MODEL_MAX_FEATURES) -> TfidfVectorizer:
+    """Fit the corpus TF-IDF on already preprocessed documents"""
+    vectorizer = TfidfVectorizer(**VECTORIZER_PARAMS, min_df=min_df, max_df=max_df, max_features=max_features)
+    vectorizer.fit(documents)
+    return vectorizer
+
+
+def save_corpus_model(vectorizer: TfidfVectorizer, n_documents: int, model_dir: str = ATS_MODEL_DIR,
+                      activate: bool = True) -> Dict:
+    """Write a new versioned artifact (+ metadata) and optionally point CURRENT at it"""
+    os.makedirs(model_dir, exist_ok=True)
+    version = time.strftime("v%Y%m%d-%H%M%S")
+    path = _artifact(model_dir, version)
+    joblib.dump(vectorizer, path)
+    metadata = {
+        "version": version,
+        "fitted_at": time.time(),
+        "documents": n_documents,
+        "vocabulary": len(vectorizer.vocabulary_),
+        "params": {key: vectorizer.get_params()[key] for key in ("ngram_range", "min_df", "max_df", "max_features")},
+        "sklearn": sklearn.__version__,
+    }
+    with open(os.path.join(model_dir, f"tfidf-{version}.json"), "w") as f:
+        json.dump(metadata, f, indent=2)
+    if activate:
+        activate_version(version, model_dir)
+    return metadata
+
+
+def activate_version(version: str, model_dir: str = ATS_MODEL_DIR):
+    if not os.path.exists(_artifact(model_dir, version)):
+        raise FileNotFoundError(f"No ATS model artifact for {version}")
+    tmp_path = os.path.join(model_dir, f"{CURRENT_FILE}.tmp")
+    with open(tmp_path, "w") as f:
+        f.write(version)
+    os.replace(tmp_path, os.path.join(model_dir, CURRENT_FILE))
+
+
+def current_version(model_dir: str = ATS_MODEL_DIR) -> Optional[str]:
+    try:
+        with open(os.path.join(model_dir, CURRENT_FILE)) as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+def list_versions(model_dir: str = ATS_MODEL_DIR) -> List[Dict]:
+    versions = []
+    if not os.path.isdir(model_dir):
+        return versions
+    for name in sorted(os.listdir(model_dir)):
+        if name.startswith("tfidf-") and name.endswith(".json"):
+            with open(os.path.join(model_dir, name)) as f:
+                versions.append(json.load(f))
+    return versions
+
+
+def prune_versions(keep: int, model_dir: str = ATS_MODEL_DIR) -> List[str]:
+    """Delete all but the newest ``keep`` artifacts, never the current one"""
+    current = current_version(model_dir)
+    removed = []
+    for metadata in list_versions(model_dir)[:-keep or None]:
+        version = metadata["version"]
+        if version == current:
+            continue
+        for path in (_artifact(model_dir, version), os.path.join(model_dir, f"tfidf-{version}.json")):
+            if os.path.exists(path):
+                os.remove(path)
+        removed.append(version)
+    return removed
+
+
+class CorpusModel:
+    """The active corpus vectorizer, loaded once per process and reloaded when CURRENT changes"""
+
+    def __init__(self, model_dir: str = ATS_MODEL_DIR):
+        self.model_dir = model_dir
+        self._loaded: Optional[LoadedModel] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> Optional["LoadedModel"]:
+        version = current_version(self.model_dir)
+        if version is None:
+            return None
+        loaded = self._loaded
+        if loaded is None or loaded.version != version:
+            with self._lock:
+                if self._loaded is None or self._loaded.version != version:
+                    vectorizer = joblib.load(_artifact(self.model_dir, version))
+                    self._loaded = LoadedModel(version, vectorizer, vectorizer.get_feature_names_out())
+                    print(f"Loaded ATS corpus model {version} ({len(vectorizer.vocabulary_)} terms)")
+                loaded = self._loaded
+        return loaded
+
+
+corpus_model = CorpusModel()
@@ -0,0 +1,63 @@
+import re
+import string
+from typing import List
+
+import nltk
+from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+
+
+# Ensure NLTK stopwords are available
+def ensure_nltk_data():
+    try:
+        nltk.data.find('corpora/stopwords')
+    except LookupError:
+        nltk.download('stopwords')
+
+ensure_nltk_data()
+
+from nltk.corpus import stopwords
+
+# Tech terms that the generic rules below would drop: too short, or only meaningful with their symbols
+SKILL_TERMS = frozenset("""
+    c c++ c# f# r .net asp.net vb.net ai ml nlp ui ux qa bi js ts os db ci cd ios sql
+    node.js react.js vue.js next.js nuxt.js angular.js express.js nest.js d3.js three.js ember.js
+""".split())
+
+# NLTK's and scikit-learn's English lists, so vectorizers need no stop word pass of their own
+STOP_WORDS = frozenset(stopwords.words('english')) | ENGLISH_STOP_WORDS | frozenset({"e.g", "i.e", "etc"})
+
+# Apostrophes and hyphens join words ("don't", "full-stack"); other punctuation separates them.
+# '+', '#' and '.' are kept for tokens like c++, c# and node.js.
+_KEEP = "+#."
+_JOIN = "'-‘’"
+_TRANSLATION = str.maketrans({
+    **{ch: " " for ch in string.punctuation if ch not in _KEEP + _JOIN},
+    **{ch: None for ch in _JOIN},
+    **{ch: " " for ch in "–—…•·▪◦●■►→✓✔|“”\u00a0"},
+})
+# A dot stays only inside a token (node.js, v2.0) or in front of one (.net), not at sentence ends or in ellipses
+_STRAY_DOTS = re.compile(r"\.(?:\.+|(?![a-z0-9]))")
+_YEARS = re.compile(r"\d+\+")  # "5+ years"
+_NUMBER = re.compile(r"[\d.]+")
+
+# Tokens produced by tokenize() are final: vectorizers only split on spaces and build n-grams
+VECTORIZER_PARAMS = dict(ngram_range=(1, 2), tokenizer=str.split, token_pattern=None, lowercase=False)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase tokens of ``text`` with stop words, noise and bare numbers removed"""
+    return [
+        token for token in _STRAY_DOTS.sub(" ", text.lower().translate(_TRANSLATION)).split()
+        if token in SKILL_TERMS or (token not in STOP_WORDS and (
+            len(token) > 2 if token[0] > "9" else _keep_numeric(token)))
+    ]
+
+
+def _keep_numeric(token: str) -> bool:
+    """Tokens starting with a digit or symbol: keep "5+" and "10k", drop bare numbers"""
+    return bool(_YEARS.fullmatch(token)) or (len(token) > 2 and not _NUMBER.fullmatch(token))
+
+
+def preprocess(text: str) -> str:
+    """Space-joined tokens, the form the ATS vectorizers consume"""
+    return " ".join(tokenize(text)) if text else ""
@@ -1,19 +1,32 @@
+import os
 import cv2
 import mediapipe as mp
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+from utils.executors import process_pool
+from utils.media_ingest import MediaBundle, as_media, downscale_frame
+from utils.result_cache import result_cache
 
-def analyze_body_language(video_path: str) -> int:
-    mp_pose = mp.solutions.pose
-    pose = mp_pose.Pose()
-    cap = cv2.VideoCapture(video_path)
+# Frame sampler settings. The defaults score every frame at full resolution;
+# sampling and downscaling are opt-in until scripts/posture_sampling_report.py
+# has measured their score error on reference clips.
+POSE_SAMPLE_FPS = float(os.getenv("POSE_SAMPLE_FPS", "0"))  # 0 -> every frame
+POSE_MAX_SIDE = int(os.getenv("POSE_MAX_SIDE", "0"))  # 0 -> full resolution
+POSE_KEYFRAMES_ONLY = os.getenv("POSE_KEYFRAMES_ONLY", "false") == "true"
+
+# Recordings at least this long are split into time ranges and scored in
+# a shared pool of POSE_WORKERS processes, each range with its own Pose instance
+POSE_WORKERS = int(os.getenv("POSE_WORKERS", str(os.cpu_count() or 1)))
+POSE_PARALLEL_MIN_SECONDS = float(os.getenv("POSE_PARALLEL_MIN_SECONDS", "60"))
+POSE_MIN_CHUNK_SECONDS = 10.0
 
+mp_pose = mp.solutions.pose
+
+def score_frames(frames: Iterable, pose) -> Tuple[int, int]:
+    """Return (frames with level shoulders, frames with a detected pose)"""
     posture_score = 0
     total_frames = 0
 
-    while cap.isOpened():
-        ret, frame = cap.read()
-        if not ret:
-            break
-
+    for frame in frames:
         frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
         result = pose.process(frame_rgb)
 
@@ -25,13 +38,86 @@ def analyze_body_language(video_path: str) -> int:
             if abs(left_shoulder.y - right_shoulder.y) < 0.05:
                 posture_score += 1
 
-    cap.release()
-    pose.close()
+    return posture_score, total_frames
 
+def posture_percentage(posture_score: int, total_frames: int) -> int:
     if total_frames == 0:
         return 50
+    return int((posture_score / total_frames) * 100)
+
+def _range_frames(cap, start_ms: float, end_ms: float, sample_fps: float, max_side: int) -> Iterator:
+    """Yield sampled frames whose timestamps fall in [start_ms, end_ms)"""
+    cap.set(cv2.CAP_PROP_POS_MSEC, start_ms)
+    interval = 1000.0 / sample_fps if sample_fps else 0.0
+    next_ms = start_ms
+    while cap.grab():
+        position = cap.get(cv2.CAP_PROP_POS_MSEC)
+        if position >= end_ms:
+            break
+        if position + 1e-3 < next_ms:
+            continue
+        ret, frame = cap.retrieve()
+        if not ret:
+            break
+        next_ms = max(next_ms, position) + interval
+        yield downscale_frame(frame, max_side)
+
+def analyze_range(video_path: str, start_ms: float, end_ms: float, sample_fps: float, max_side: int) -> Tuple[int, int]:
+    """Score one time range of a video; runs inside a worker process"""
+    cap = cv2.VideoCapture(video_path)
+    pose = mp_pose.Pose()
+    try:
+        return score_frames(_range_frames(cap, start_ms, end_ms, sample_fps, max_side), pose)
+    finally:
+        pose.close()
+        cap.release()
+
+def split_ranges(duration: float, workers: int) -> List[Tuple[float, float]]:
+    """Split [0, duration) into about two ranges per worker, none shorter than the minimum"""
+    chunks = max(1, min(workers * 2, int(duration // POSE_MIN_CHUNK_SECONDS)))
+    size = duration * 1000.0 / chunks
+    ranges = [(i * size, (i + 1) * size) for i in range(chunks)]
+    # The container duration can be slightly short; let the last range run to the end
+    ranges[-1] = (ranges[-1][0], float("inf"))
+    return ranges
+
+def analyze_body_language_parallel(media: MediaBundle, sample_fps: float, max_side: int,
+                                   workers: int = POSE_WORKERS) -> Tuple[int, int]:
+    ranges = split_ranges(media.info["duration"], workers)
+    pool = process_pool("pose", workers)
+    futures = [
+        pool.submit(analyze_range, media.path, start_ms, end_ms, sample_fps, max_side)
+        for start_ms, end_ms in ranges
+    ]
+    counts = [future.result() for future in futures]
+    return sum(c[0] for c in counts), sum(c[1] for c in counts)
+
+def analyze_body_language(video_path: Union[str, MediaBundle], sample_fps: Optional[float] = None,
+                          max_side: Optional[int] = None, keyframes_only: Optional[bool] = None,
+                          workers: Optional[int] = None, use_cache: bool = True) -> int:
+    media = as_media(video_path)
+    sample_fps = POSE_SAMPLE_FPS if sample_fps is None else sample_fps
+    max_side = POSE_MAX_SIDE if max_side is None else max_side
+    keyframes_only = POSE_KEYFRAMES_ONLY if keyframes_only is None else keyframes_only
+    workers = POSE_WORKERS if workers is None else workers
+
+    # The score depends on the sampler settings, not on how the work is split
+    cache_key = f"{media.digest}:{sample_fps}:{max_side}:{int(keyframes_only)}"
+    cached = result_cache.get("posture", cache_key) if use_cache else None
+    if cached is not None:
+        return cached
 
-    percentage = (posture_score / total_frames) * 100
-    print(int(percentage), "ye dekh $$$$$$$$$$")
-    return int(percentage)
+    if workers > 1 and not keyframes_only and media.info["duration"] >= POSE_PARALLEL_MIN_SECONDS:
+        posture_score, total_frames = analyze_body_language_parallel(media, sample_fps, max_side, workers)
+    else:
+        frames = media.frames(fps=sample_fps, max_side=max_side, keyframes_only=keyframes_only)
+        pose = mp_pose.Pose()
+        try:
+            posture_score, total_frames = score_frames(frames, pose)
+        finally:
+            pose.close()
 
+    percentage = posture_percentage(posture_score, total_frames)
+    print(percentage, "ye dekh $$$$$$$$$$")
+    result_cache.set("posture", cache_key, percentage)
+    return percentage
@@ -0,0 +1,224 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+from utils.executors import PoolSaturated
+
+BROWSER_POOL_SIZE = int(os.getenv("BROWSER_POOL_SIZE", "2"))
+BROWSER_MAX_PAGES = int(os.getenv("BROWSER_MAX_PAGES", "50"))
+BROWSER_IDLE_TTL = int(os.getenv("BROWSER_IDLE_TTL", "600"))
+BROWSER_CHECKOUT_TIMEOUT = float(os.getenv("BROWSER_CHECKOUT_TIMEOUT", "60"))
+BROWSER_WARMUP = int(os.getenv("BROWSER_WARMUP", "0"))  # browsers to start with the API
+CHROMEDRIVER_PATH = os.getenv("CHROMEDRIVER_PATH", "")
+
+_driver_path_lock = threading.Lock()
+_driver_path: Optional[str] = None
+
+
+def chromedriver_path(driver_path: Optional[str] = None) -> str:
+    """Explicit path, CHROMEDRIVER_PATH, or a ChromeDriverManager download resolved once per process"""
+    global _driver_path
+    if driver_path or CHROMEDRIVER_PATH:
+        return driver_path or CHROMEDRIVER_PATH
+    with _driver_path_lock:
+        if _driver_path is None:
+            from webdriver_manager.chrome import ChromeDriverManager
+            _driver_path = ChromeDriverManager().install()
+        return _driver_path
+
+
+def create_chrome_driver(driver_path: Optional[str] = None):
+    # Selenium is imported here so the pool and its settings load without it
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--log-level=3")
+    return webdriver.Chrome(service=Service(chromedriver_path(driver_path)), options=chrome_options)
+
+
+class BrowserSession:
+    """A live WebDriver plus the bookkeeping the pool uses to recycle it"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+        self.pages = 0
+        self.broken = False
+
+    def mark_page(self, count: int = 1):
+        """Record page loads; the session is recycled after BROWSER_MAX_PAGES"""
+        self.pages += count
+
+    def healthy(self) -> bool:
+        if self.broken:
+            return False
+        try:
+            self.driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    def quit(self):
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
+
+
+class BrowserPool:
+    """Warm headless browsers shared by scrapers, with a cap on concurrent sessions
+
+    Sessions are health-checked on checkout, recycled after ``max_pages``
+    page loads or ``idle_ttl`` seconds unused, and callers wait (up to
+    ``checkout_timeout``) when every session is busy.
+    """
+
+    def __init__(self, max_sessions: int = BROWSER_POOL_SIZE, max_pages: int = BROWSER_MAX_PAGES,
+                 idle_ttl: int = BROWSER_IDLE_TTL, checkout_timeout: float = BROWSER_CHECKOUT_TIMEOUT,
+                 factory: Optional[Callable] = None):
+        self.max_sessions = max_sessions
+        self.max_pages = max_pages
+        self.idle_ttl = idle_ttl
+        self.checkout_timeout = checkout_timeout
+        self.factory = factory or create_chrome_driver
+        self._idle: List[BrowserSession] = []
+        self._in_use = 0
+        self._starting = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self.created = 0
+        self.recycled = 0
+        self.checkouts = 0
+        self.wait_seconds = 0.0
+
+    def _expired(self, session: BrowserSession) -> bool:
+        if self.max_pages and session.pages >= self.max_pages:
+            return True
+        return bool(self.idle_ttl) and time.monotonic() - session.last_used > self.idle_ttl
+
+    def _retire(self, session: BrowserSession):
+        self.recycled += 1
+        threading.Thread(target=session.quit, daemon=True).start()
+
+    def checkout(self, timeout: Optional[float] = None) -> BrowserSession:
+        timeout = self.checkout_timeout if timeout is None else timeout
+        started = time.monotonic()
+        deadline = started + timeout
+        while True:
+            with self._cond:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("Browser pool is closed")
+                    if self._idle:
+                        session = self._idle.pop()  # most recently used first
+                        self._in_use += 1
+                        break
+                    if self._in_use + self._starting < self.max_sessions:
+                        session = None
+                        self._starting += 1
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise PoolSaturated("browser")
+                    self._cond.wait(remaining)
+
+            if session is None:
+                try:
+                    session = BrowserSession(self.factory())
+                except Exception:
+                    with self._cond:
+                        self._starting -= 1
+                        self._cond.notify()
+                    raise
+                with self._cond:
+                    self._starting -= 1
+                    self._in_use += 1
+                    self.created += 1
+            elif self._expired(session) or not session.healthy():
+                with self._cond:
+                    self._in_use -= 1
+                    self._retire(session)
+                    self._cond.notify()
+                continue
+
+            with self._cond:
+                self.checkouts += 1
+                self.wait_seconds += time.monotonic() - started
+            return session
+
+    def checkin(self, session: BrowserSession, broken: bool = False):
+        session.last_used = time.monotonic()
+        session.broken = session.broken or broken
+        with self._cond:
+            self._in_use -= 1
+            if self._closed or session.broken or self._expired(session):
+                self._retire(session)
+            else:
+                self._idle.append(session)
+            self._cond.notify()
+
+    @contextmanager
+    def session(self, timeout: Optional[float] = None):
+        session = self.checkout(timeout)
+        try:
+            yield session
+        except BaseException:
+            # The page state is unknown after a failure; let the health check decide on reuse
+            self.checkin(session, broken=not session.healthy())
+            raise
+        else:
+            self.checkin(session)
+
+    def warm_up(self, count: Optional[int] = None):
+        """Start up to ``count`` browsers now so the first searches skip Chrome startup"""
+        count = min(count or self.max_sessions, self.max_sessions)
+        sessions = []
+        try:
+            for _ in range(count):
+                sessions.append(self.checkout())
+        finally:
+            for session in sessions:
+                self.checkin(session)
+
+    def evict_idle(self):
+        """Quit idle sessions past ``idle_ttl`` or ``max_pages``; called periodically by the API"""
+        with self._cond:
+            keep = []
+            for session in self._idle:
+                if self._expired(session):
+                    self._retire(session)
+                else:
+                    keep.append(session)
+            self._idle = keep
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+        for session in idle:
+            session.quit()
+
+    def stats(self) -> Dict:
+        with self._cond:
+            return {
+                "max_sessions": self.max_sessions,
+                "idle": len(self._idle),
+                "in_use": self._in_use,
+                "starting": self._starting,
+                "created": self.created,
+                "recycled": self.recycled,
+                "checkouts": self.checkouts,
+                "avg_wait_seconds": round(self.wait_seconds / self.checkouts, 3) if self.checkouts else 0.0,
+            }
+
+
+browser_pool = BrowserPool()
@@ -0,0 +1,134 @@
+import asyncio
+import functools
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Dict, Tuple
+
+
+class PoolSaturated(Exception):
+    """Raised when a pool's queue is full; the API maps it to 503"""
+
+    def __init__(self, pool: str):
+        super().__init__(f"The {pool} worker pool is busy, please retry shortly")
+        self.pool = pool
+
+
+class BoundedPool:
+    """Thread pool with a concurrency limit, a queue-depth limit and counters"""
+
+    def __init__(self, name: str, max_workers: int, max_queue: int):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"{name}-pool")
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.active = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.busy_seconds = 0.0
+        self.wait_seconds = 0.0
+
+    def _call(self, submitted_at: float, fn: Callable):
+        started = time.perf_counter()
+        with self._lock:
+            self.queued -= 1
+            self.active += 1
+            self.wait_seconds += started - submitted_at
+        try:
+            result = fn()
+            with self._lock:
+                self.completed += 1
+            return result
+        except Exception:
+            with self._lock:
+                self.failed += 1
+            raise
+        finally:
+            with self._lock:
+                self.active -= 1
+                self.busy_seconds += time.perf_counter() - started
+
+    async def run(self, fn: Callable, *args, **kwargs):
+        """Run a blocking callable on this pool without blocking the event loop"""
+        with self._lock:
+            if self.queued >= self.max_queue:
+                self.rejected += 1
+                raise PoolSaturated(self.name)
+            self.queued += 1
+        call = functools.partial(fn, *args, **kwargs)
+        loop = asyncio.get_running_loop()
+        try:
+            future = loop.run_in_executor(self._executor, self._call, time.perf_counter(), call)
+        except RuntimeError:
+            # Executor already shut down: the job never started
+            with self._lock:
+                self.queued -= 1
+            raise
+        return await future
+
+    def stats(self) -> Dict:
+        with self._lock:
+            finished = self.completed + self.failed
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "queued": self.queued,
+                "active": self.active,
+                "completed": self.completed,
+                "failed": self.failed,
+                "rejected": self.rejected,
+                "avg_wait_ms": round(self.wait_seconds / finished * 1000, 1) if finished else 0.0,
+                "avg_run_ms": round(self.busy_seconds / finished * 1000, 1) if finished else 0.0,
+            }
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+# cpu: short CPU work like PDF parsing and ATS scoring. Long media
+# analyses run on the job queue's workers, not here.
+cpu_pool = BoundedPool(
+    "cpu",
+    int(os.getenv("CPU_WORKERS", str(os.cpu_count() or 2))),
+    int(os.getenv("CPU_MAX_QUEUE", "64")),
+)
+
+POOLS = {pool.name: pool for pool in (cpu_pool,)}
+
+
+def pool_stats() -> Dict:
+    return {name: pool.stats() for name, pool in POOLS.items()}
+
+
+_process_pools: Dict[Tuple[str, int], ProcessPoolExecutor] = {}
+_process_lock = threading.Lock()
+
+
+def process_pool(name: str, workers: int) -> ProcessPoolExecutor:
+    """Shared process pool ``name`` of ``workers`` processes, started on first use and replaced if a worker died
+
+    Callers asking for another worker count (e.g. a benchmark) get a pool of their own.
+    """
+    key = (name, workers)
+    with _process_lock:
+        pool = _process_pools.get(key)
+        if pool is None or getattr(pool, "_broken", False):
+            # spawn rather than fork: the API process runs worker threads
+            pool = _process_pools[key] = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        return pool
+
+
+def shutdown_pools():
+    for pool in POOLS.values():
+        pool.shutdown()
+    with _process_lock:
+        for pool in _process_pools.values():
+            # Queued work is dropped; running tasks finish so workers exit cleanly
+            pool.shutdown(wait=True, cancel_futures=True)
+        _process_pools.clear()
@@ -0,0 +1,131 @@
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from utils.job_index import JobIndex, normalize_search
+
+CRAWL_WORKERS = int(os.getenv("CRAWL_WORKERS", "4"))
+CRAWL_PAGES = int(os.getenv("CRAWL_PAGES", "3"))
+CRAWL_JOB_WORKERS = int(os.getenv("CRAWL_JOB_WORKERS", "1"))  # crawls run at once, beside the analysis workers
+
+DONE, FAILED, SKIPPED = "done", "failed", "skipped"
+
+
+class JobCrawler:
+    """Scrapes many (keyword, location) searches into the job index on a bounded thread pool
+
+    Politeness is enforced per domain by the scrapers' shared rate limiter,
+    so adding workers raises throughput only up to what each site allows.
+    Every finished target is checkpointed under the crawl id; running the
+    same crawl id again skips the targets that already succeeded.
+    """
+
+    def __init__(self, index: JobIndex, get_scraper: Callable, workers: int = CRAWL_WORKERS,
+                 pages: int = CRAWL_PAGES):
+        self.index = index
+        self.get_scraper = get_scraper
+        self.workers = workers
+        self.pages = pages
+        self._stopping = threading.Event()
+        self._lock = threading.Lock()
+        self.running = 0
+        self.crawls = 0
+        self.targets_crawled = 0
+        self.jobs_scraped = 0
+
+    def crawl_target(self, keyword: str, location: str, pages: Optional[int] = None) -> Dict:
+        """Scrape one search into the index and return its throughput stats"""
+        started = time.perf_counter()
+        stats = {"keyword": keyword, "location": location}
+        try:
+            jobs = self.get_scraper().scrape_naukri_jobs(keyword, location, pages or self.pages)
+            counts = self.index.upsert(jobs)
+            self.index.record_search(keyword, location, len(jobs))
+            stats.update(status=DONE, jobs=len(jobs), **counts)
+        except Exception as e:
+            self.index.record_search(keyword, location, 0, error=str(e))
+            stats.update(status=FAILED, jobs=0, error=str(e))
+        seconds = time.perf_counter() - started
+        stats["seconds"] = round(seconds, 2)
+        stats["jobs_per_second"] = round(stats["jobs"] / seconds, 2) if seconds else 0.0
+        return stats
+
+    def crawl(self, targets: Iterable[Tuple[str, str]], crawl_id: Optional[str] = None,
+              pages: Optional[int] = None, progress: Optional[Callable] = None) -> Dict:
+        """Crawl every target once; pass the same ``crawl_id`` to resume an interrupted crawl"""
+        crawl_id = crawl_id or uuid.uuid4().hex
+        unique = list(dict.fromkeys(normalize_search(keyword, location) for keyword, location in targets))
+        checkpoint = self.index.crawl_targets(crawl_id)
+        results: List[Dict] = [
+            {**checkpoint[target], "status": SKIPPED}
+            for target in unique if checkpoint.get(target, {}).get("status") == DONE
+        ]
+        pending = [target for target in unique if checkpoint.get(target, {}).get("status") != DONE]
+
+        started = time.perf_counter()
+        with self._lock:
+            self.running += 1
+            self.crawls += 1
+        try:
+            if pending:
+                with ThreadPoolExecutor(max_workers=min(self.workers, len(pending)),
+                                        thread_name_prefix="crawl") as executor:
+                    futures = {
+                        executor.submit(self._run_target, keyword, location, pages): (keyword, location)
+                        for keyword, location in pending
+                    }
+                    for future in as_completed(futures):
+                        stats = future.result()
+                        if stats is None:
+                            continue  # stopped before it started; left for the next run
+                        self.index.save_crawl_target(crawl_id, stats)
+                        results.append(stats)
+                        with self._lock:
+                            self.targets_crawled += 1
+                            self.jobs_scraped += stats["jobs"]
+                        if progress:
+                            progress("crawling", completed=len(results), total=len(unique),
+                                     keyword=stats["keyword"], location=stats["location"], status=stats["status"])
+        finally:
+            with self._lock:
+                self.running -= 1
+
+        seconds = time.perf_counter() - started
+        crawled = [stats for stats in results if stats["status"] != SKIPPED]
+        total_jobs = sum(stats["jobs"] for stats in crawled)
+        return {
+            "crawl_id": crawl_id,
+            "targets": results,
+            "crawled": len(crawled),
+            "resumed": len(results) - len(crawled),
+            "failed": sum(stats["status"] == FAILED for stats in crawled),
+            "remaining": len(unique) - len(results),
+            "jobs": total_jobs,
+            "seconds": round(seconds, 2),
+            "jobs_per_second": round(total_jobs / seconds, 2) if seconds else 0.0,
+        }
+
+    def _run_target(self, keyword: str, location: str, pages: Optional[int]) -> Optional[Dict]:
+        if self._stopping.is_set():
+            return None
+        return self.crawl_target(keyword, location, pages)
+
+    def start(self):
+        self._stopping.clear()
+
+    def stop(self):
+        """Let in-flight targets finish and skip the rest; their crawl can be resumed later"""
+        self._stopping.set()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "running": self.running,
+                "crawls": self.crawls,
+                "targets_crawled": self.targets_crawled,
+                "jobs_scraped": self.jobs_scraped,
+            }
@@ -0,0 +1,383 @@
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from utils.sqlite_local import ThreadLocalSQLite
+
+JOB_INDEX_DB = os.getenv("JOB_INDEX_DB", os.path.join("temp", "job_index.db"))
+JOB_REFRESH_INTERVAL = int(os.getenv("JOB_REFRESH_INTERVAL", "3600"))
+JOB_REFRESH_MAX_AGE = int(os.getenv("JOB_REFRESH_MAX_AGE", str(6 * 3600)))
+# Searches kept fresh even if nobody asked for them, e.g. "python developer:bangalore,data scientist:pune"
+JOB_REFRESH_TARGETS = os.getenv("JOB_REFRESH_TARGETS", "")
+JOB_REFRESH_RETRY_AFTER = int(os.getenv("JOB_REFRESH_RETRY_AFTER", "900"))  # back-off after a failed scrape
+JOB_SEARCH_TTL = int(os.getenv("JOB_SEARCH_TTL", str(7 * 24 * 3600)))  # forget searches nobody asked for since
+JOB_MAX_PAGE_SIZE = 100
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    company TEXT NOT NULL,
+    location TEXT NOT NULL,
+    experience TEXT,
+    exp_min INTEGER,
+    exp_max INTEGER,
+    salary TEXT,
+    skills TEXT,
+    posted_date TEXT,
+    job_url TEXT,
+    description TEXT,
+    job_type TEXT,
+    remote TEXT,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_last_seen ON jobs (last_seen);
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+    title, company, location, skills, description,
+    content='jobs', content_rowid='rowid', tokenize='unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS jobs_ai AFTER INSERT ON jobs BEGIN
+    INSERT INTO jobs_fts (rowid, title, company, location, skills, description)
+    VALUES (new.rowid, new.title, new.company, new.location, new.skills, new.description);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_ad AFTER DELETE ON jobs BEGIN
+    INSERT INTO jobs_fts (jobs_fts, rowid, title, company, location, skills, description)
+    VALUES ('delete', old.rowid, old.title, old.company, old.location, old.skills, old.description);
+END;
+CREATE TRIGGER IF NOT EXISTS jobs_au AFTER UPDATE ON jobs BEGIN
+    INSERT INTO jobs_fts (jobs_fts, rowid, title, company, location, skills, description)
+    VALUES ('delete', old.rowid, old.title, old.company, old.location, old.skills, old.description);
+    INSERT INTO jobs_fts (rowid, title, company, location, skills, description)
+    VALUES (new.rowid, new.title, new.company, new.location, new.skills, new.description);
+END;
+CREATE TABLE IF NOT EXISTS searches (
+    keyword TEXT NOT NULL,
+    location TEXT NOT NULL,
+    refreshed_at REAL,
+    job_count INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    failed_at REAL,
+    last_requested_at REAL,
+    PRIMARY KEY (keyword, location)
+);
+CREATE TABLE IF NOT EXISTS crawl_targets (
+    crawl_id TEXT NOT NULL,
+    keyword TEXT NOT NULL,
+    location TEXT NOT NULL,
+    status TEXT NOT NULL,
+    jobs INTEGER NOT NULL DEFAULT 0,
+    inserted INTEGER NOT NULL DEFAULT 0,
+    updated INTEGER NOT NULL DEFAULT 0,
+    seconds REAL,
+    error TEXT,
+    finished_at REAL NOT NULL,
+    PRIMARY KEY (crawl_id, keyword, location)
+);
+"""
+
+# Columns added to the searches table after its first release
+SEARCH_COLUMNS = {"failed_at": "REAL", "last_requested_at": "REAL"}
+
+JOB_COLUMNS = ("id", "title", "company", "location", "experience", "salary", "skills", "posted_date",
+               "job_url", "description", "job_type", "remote")
+
+_RANGE = re.compile(r"(\d+)\s*-\s*(\d+)")
+_NUMBER = re.compile(r"(\d+)")
+_WORD = re.compile(r"\w+")
+
+
+def experience_range(text: str) -> Tuple[Optional[int], Optional[int]]:
+    """"2-5 Yrs" -> (2, 5), "5+ years" -> (5, None), anything else -> (None, None)"""
+    if not text:
+        return None, None
+    match = _RANGE.search(text)
+    if match:
+        return int(match.group(1)), int(match.group(2))
+    match = _NUMBER.search(text)
+    if match:
+        low = int(match.group(1))
+        return low, None if "+" in text else low
+    return None, None
+
+
+def normalize_search(keyword: str, location: str) -> Tuple[str, str]:
+    return " ".join(keyword.lower().split()), " ".join(location.lower().split())
+
+
+def fts_query(keyword: str) -> str:
+    """Every word must match, as a prefix; quoting keeps user input out of FTS syntax"""
+    return " ".join(f'"{word}"*' for word in _WORD.findall(keyword.lower()))
+
+
+class JobIndex:
+    """Local SQLite/FTS5 store of scraped jobs, keyed by stable content-hash ids"""
+
+    def __init__(self, db_path: str = JOB_INDEX_DB):
+        self.db_path = db_path
+        self._db = ThreadLocalSQLite(db_path, SCHEMA)
+        self._migrate()
+
+    def _migrate(self):
+        conn = self._conn()
+        existing = {row["name"] for row in conn.execute("PRAGMA table_info(searches)")}
+        for column, kind in SEARCH_COLUMNS.items():
+            if column not in existing:
+                conn.execute(f"ALTER TABLE searches ADD COLUMN {column} {kind}")
+        conn.execute("UPDATE searches SET last_requested_at = COALESCE(refreshed_at, ?) WHERE last_requested_at IS NULL",
+                     (time.time(),))
+
+    def _conn(self) -> sqlite3.Connection:
+        return self._db.connection()
+
+    # --- Writes ---
+    def upsert(self, jobs: List[Dict]) -> Dict[str, int]:
+        """Insert new jobs and refresh known ones; returns counts of each"""
+        now = time.time()
+        conn = self._conn()
+        inserted = updated = 0
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for job in jobs:
+                exp_min, exp_max = experience_range(job.get("experience", ""))
+                values = (
+                    job["id"], job["title"], job["company"], job.get("location", ""), job.get("experience", ""),
+                    exp_min, exp_max, job.get("salary", ""), ", ".join(job.get("skills") or []),
+                    job.get("posted_date", ""), job.get("job_url", ""), job.get("description", ""),
+                    job.get("job_type", ""), job.get("remote", ""),
+                )
+                exists = conn.execute("SELECT 1 FROM jobs WHERE id = ?", (job["id"],)).fetchone()
+                if exists:
+                    conn.execute(
+                        "UPDATE jobs SET title = ?, company = ?, location = ?, experience = ?, exp_min = ?, exp_max = ?,"
+                        " salary = ?, skills = ?, posted_date = ?, job_url = ?, description = ?, job_type = ?,"
+                        " remote = ?, last_seen = ? WHERE id = ?",
+                        values[1:] + (now, job["id"]),
+                    )
+                    updated += 1
+                else:
+                    conn.execute(
+                        "INSERT INTO jobs (id, title, company, location, experience, exp_min, exp_max, salary, skills,"
+                        " posted_date, job_url, description, job_type, remote, first_seen, last_seen)"
+                        " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        values + (now, now),
+                    )
+                    inserted += 1
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return {"inserted": inserted, "updated": updated}
+
+    def record_search(self, keyword: str, location: str, job_count: int = 0, error: Optional[str] = None):
+        """Store the outcome of a scrape; a failure keeps the last good ``refreshed_at``"""
+        keyword, location = normalize_search(keyword, location)
+        now = time.time()
+        if error is None:
+            self._conn().execute(
+                "INSERT INTO searches (keyword, location, refreshed_at, job_count, last_requested_at)"
+                " VALUES (?, ?, ?, ?, ?) ON CONFLICT (keyword, location) DO UPDATE SET"
+                " refreshed_at = excluded.refreshed_at, job_count = excluded.job_count, error = NULL, failed_at = NULL",
+                (keyword, location, now, job_count, now),
+            )
+        else:
+            self._conn().execute(
+                "INSERT INTO searches (keyword, location, error, failed_at, last_requested_at) VALUES (?, ?, ?, ?, ?)"
+                " ON CONFLICT (keyword, location) DO UPDATE SET error = excluded.error, failed_at = excluded.failed_at",
+                (keyword, location, error, now, now),
+            )
+
+    def track_search(self, keyword: str, location: str):
+        """Remember a search so the refresher keeps it fresh, without marking it refreshed
+
+        Every call counts as a request; searches nobody requests for
+        JOB_SEARCH_TTL seconds are dropped by ``prune``.
+        """
+        keyword, location = normalize_search(keyword, location)
+        self._conn().execute(
+            "INSERT INTO searches (keyword, location, last_requested_at) VALUES (?, ?, ?)"
+            " ON CONFLICT (keyword, location) DO UPDATE SET last_requested_at = excluded.last_requested_at",
+            (keyword, location, time.time()),
+        )
+
+    def save_crawl_target(self, crawl_id: str, stats: Dict):
+        """Checkpoint one finished target so an interrupted crawl can resume after it"""
+        self._conn().execute(
+            "INSERT OR REPLACE INTO crawl_targets (crawl_id, keyword, location, status, jobs, inserted, updated,"
+            " seconds, error, finished_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (crawl_id, stats["keyword"], stats["location"], stats["status"], stats.get("jobs", 0),
+             stats.get("inserted", 0), stats.get("updated", 0), stats.get("seconds"), stats.get("error"),
+             time.time()),
+        )
+
+    def crawl_targets(self, crawl_id: str) -> Dict[Tuple[str, str], Dict]:
+        rows = self._conn().execute(
+            "SELECT keyword, location, status, jobs, inserted, updated, seconds, error FROM crawl_targets"
+            " WHERE crawl_id = ?", (crawl_id,)
+        ).fetchall()
+        return {(row["keyword"], row["location"]): dict(row) for row in rows}
+
+    def prune(self, max_age: int, search_ttl: int = JOB_SEARCH_TTL):
+        """Drop jobs no refresh has seen and crawl checkpoints older than ``max_age`` seconds,
+        and searches not requested within ``search_ttl`` seconds"""
+        now = time.time()
+        cutoff = now - max_age
+        conn = self._conn()
+        conn.execute("DELETE FROM crawl_targets WHERE finished_at < ?", (cutoff,))
+        conn.execute("DELETE FROM searches WHERE last_requested_at < ?", (now - search_ttl,))
+        return conn.execute("DELETE FROM jobs WHERE last_seen < ?", (cutoff,)).rowcount
+
+    # --- Reads ---
+    def search_refreshed_at(self, keyword: str, location: str) -> Optional[float]:
+        keyword, location = normalize_search(keyword, location)
+        row = self._conn().execute(
+            "SELECT refreshed_at FROM searches WHERE keyword = ? AND location = ?", (keyword, location)
+        ).fetchone()
+        return row["refreshed_at"] if row else None
+
+    def stale_searches(self, max_age: int, retry_after: int = JOB_REFRESH_RETRY_AFTER) -> List[Tuple[str, str]]:
+        """Searches due for a scrape, skipping those that failed less than ``retry_after`` seconds ago"""
+        now = time.time()
+        rows = self._conn().execute(
+            "SELECT keyword, location FROM searches WHERE (refreshed_at IS NULL OR refreshed_at < ?)"
+            " AND (failed_at IS NULL OR failed_at < ?) ORDER BY refreshed_at IS NOT NULL, refreshed_at",
+            (now - max_age, now - retry_after),
+        ).fetchall()
+        return [(row["keyword"], row["location"]) for row in rows]
+
+    def _filters(self, keyword: str, location: str, experience: str, job_type: str):
+        where, params = [], []
+        match = fts_query(keyword)
+        if match:
+            where.append("jobs_fts MATCH ?")
+            params.append(match)
+        if location.strip():
+            where.append("jobs.location LIKE ?")
+            params.append(f"%{location.strip()}%")
+        if job_type and job_type.lower() != "all":
+            where.append("LOWER(jobs.job_type) = ?")
+            params.append(job_type.lower())
+        if experience and experience.lower() != "any":
+            low, high = experience_range(experience)
+            if low is not None:
+                # Keep listings whose range overlaps the requested one, and those with no stated range
+                where.append("(jobs.exp_min IS NULL OR (COALESCE(jobs.exp_max, 99) >= ? AND jobs.exp_min <= ?))")
+                params.extend([low, high if high is not None else 99])
+
+        from_sql = "jobs JOIN jobs_fts ON jobs_fts.rowid = jobs.rowid" if match else "jobs"
+        where_sql = f"WHERE {' AND '.join(where)}" if where else ""
+        order_sql = "bm25(jobs_fts), jobs.last_seen DESC" if match else "jobs.last_seen DESC"
+        return from_sql, where_sql, order_sql, params
+
+    def query(self, keyword: str = "", location: str = "", experience: str = "", job_type: str = "",
+              page: int = 1, limit: int = 20) -> Dict:
+        """Filtered, paginated search; keyword matches are ranked by bm25, the rest by recency"""
+        limit = max(1, min(limit, JOB_MAX_PAGE_SIZE))
+        page = max(1, page)
+        from_sql, where_sql, order_sql, params = self._filters(keyword, location, experience, job_type)
+
+        conn = self._conn()
+        total = conn.execute(f"SELECT COUNT(*) FROM {from_sql} {where_sql}", params).fetchone()[0]
+        rows = conn.execute(
+            f"SELECT jobs.* FROM {from_sql} {where_sql} ORDER BY {order_sql} LIMIT ? OFFSET ?",
+            params + [limit, (page - 1) * limit],
+        ).fetchall()
+
+        return {"jobs": [self._row_to_job(row) for row in rows], "total": total, "page": page, "limit": limit}
+
+    def candidates(self, keyword: str = "", location: str = "", experience: str = "", job_type: str = "",
+                   limit: int = 1000) -> List[Dict]:
+        """Unpaginated filtered jobs, e.g. as the pool to rank a resume against"""
+        from_sql, where_sql, order_sql, params = self._filters(keyword, location, experience, job_type)
+        rows = self._conn().execute(
+            f"SELECT jobs.* FROM {from_sql} {where_sql} ORDER BY {order_sql} LIMIT ?", params + [limit]
+        ).fetchall()
+        return [self._row_to_job(row) for row in rows]
+
+    def _row_to_job(self, row: sqlite3.Row) -> Dict:
+        job = {column: row[column] for column in JOB_COLUMNS}
+        job["skills"] = row["skills"].split(", ") if row["skills"] else []
+        return job
+
+    def stats(self) -> Dict:
+        conn = self._conn()
+        jobs = conn.execute("SELECT COUNT(*), MAX(last_seen) FROM jobs").fetchone()
+        searches = conn.execute(
+            "SELECT COUNT(*), SUM(refreshed_at IS NULL), SUM(error IS NOT NULL) FROM searches"
+        ).fetchone()
+        return {
+            "jobs": jobs[0],
+            "last_seen": jobs[1],
+            "searches": searches[0],
+            "never_refreshed": searches[1] or 0,
+            "failing": searches[2] or 0,
+        }
+
+
+class JobIndexRefresher:
+    """Background thread that re-crawls tracked searches once they are older than ``max_age``"""
+
+    def __init__(self, index: JobIndex, crawler, interval: int = JOB_REFRESH_INTERVAL,
+                 max_age: int = JOB_REFRESH_MAX_AGE):
+        self.index = index
+        self.crawler = crawler
+        self.interval = interval
+        self.max_age = max_age
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.last_run: Optional[float] = None
+        self.last_error: Optional[str] = None
+
+    def request(self, keyword: str, location: str, refresh: bool = True):
+        """Track a search as requested now, and wake the refresher if it needs scraping"""
+        self.index.track_search(keyword, location)
+        if refresh:
+            self._wakeup.set()
+
+    def track_targets(self):
+        """Count the configured JOB_REFRESH_TARGETS as requested, so they never expire"""
+        for target in JOB_REFRESH_TARGETS.split(","):
+            if ":" in target:
+                keyword, location = target.split(":", 1)
+                self.index.track_search(keyword, location)
+
+    def run_once(self):
+        self.track_targets()
+        stale = self.index.stale_searches(self.max_age)
+        if stale:
+            summary = self.crawler.crawl(stale, crawl_id=f"refresh-{int(time.time())}")
+            print(f"Refreshed {summary['crawled']} job searches in {summary['seconds']}s, {summary['failed']} failed")
+        self.index.prune(self.max_age * 4)
+        self.last_run = time.time()
+        self.last_error = None
+
+    def _loop(self):
+        while not self._stopping.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                # e.g. "database is locked"; the next wake-up retries
+                self.last_error = f"{type(e).__name__}: {e}"
+                print(f"⚠️ Job index refresh failed: {self.last_error}")
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+
+    def start(self):
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._loop, name="job-index-refresher", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopping.set()
+        self._wakeup.set()
+
+    def stats(self) -> Dict:
+        return {"interval": self.interval, "max_age": self.max_age, "last_run": self.last_run,
+                "last_error": self.last_error, "running": bool(self._thread and self._thread.is_alive())}
+
+
+job_index = JobIndex()
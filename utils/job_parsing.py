@@ -0,0 +1,112 @@
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+from utils.result_cache import text_digest
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+NAUKRI_BASE_URL = "https://www.naukri.com/"
+
+# Card and field selectors for the classic (jobTuple) and current (srp-jobtuple) result markup
+CARD_SELECTOR = "article.jobTuple, div.jobTuple, div.srp-jobtuple-wrapper, div.cust-job-tuple"
+FIELD_SELECTORS = {
+    "title": "a.title",
+    "company": ".subTitle, a.comp-name",
+    "location": ".locWdth, .loc-wrap .locWdth, span.loc",
+    "experience": ".expwdth, span.exp",
+    "salary": ".salary, span.sal",
+    "skills": "ul.tags, ul.tags-gt",
+    "posted": ".type.br2.fleft.grey, span.job-post-day",
+}
+NEXT_PAGE_SELECTOR = "a.fright.fs14.btn-secondary.br2"
+# Markers of the client-rendered shell served when results need JavaScript
+JS_SHELL_MARKERS = ("id=\"root\"", "id='root'", "enable javascript", "window.__INITIAL_STATE__")
+
+
+def naukri_search_url(keyword: str, location: str, page: int = 1) -> str:
+    url = f"{NAUKRI_BASE_URL}{keyword.replace(' ', '-')}-jobs-in-{location.lower()}"
+    return url if page <= 1 else f"{url}-{page}"
+
+
+def job_id(title: str, company: str, location: str) -> str:
+    """Stable id from the normalized listing identity, the same in every process and run"""
+    parts = [" ".join(part.lower().split()) for part in (title, company, location)]
+    return text_digest(*parts)[:16]
+
+
+def make_job_record(title: str, job_url: str, company: str, location: str, experience: str,
+                    salary: str = "", skills: str = "", posted: str = "") -> Dict:
+    """Job dict shared by every scraping engine"""
+    return {
+        "id": job_id(title, company, location),
+        "title": title,
+        "company": company,
+        "location": location,
+        "experience": experience,
+        "salary": salary or "Not disclosed",
+        "skills": skills.split(', ') if skills else [],
+        "posted_date": posted or "Recently",
+        "job_url": job_url,
+        "description": f"Looking for {title} with experience in {skills}. Join {company} team.",
+        "job_type": "Full-time",
+        "remote": "hybrid" if "remote" in title.lower() else "office"
+    }
+
+
+def _text(card, selector: str) -> str:
+    element = card.select_one(selector)
+    return element.get_text(" ", strip=True) if element else ""
+
+
+def _skills(card) -> str:
+    element = card.select_one(FIELD_SELECTORS["skills"])
+    if element is None:
+        return ""
+    items = [li.get_text(strip=True) for li in element.find_all("li")]
+    return ", ".join(item for item in items if item) if items else element.get_text(", ", strip=True)
+
+
+def parse_naukri_listing(html: str, page_url: str = NAUKRI_BASE_URL) -> Tuple[List[Dict], Optional[str], bool]:
+    """Parse one results page into (jobs, next_page_url, needs_js)
+
+    ``needs_js`` is True when the page has no job cards and looks like a
+    client-rendered shell, i.e. only a real browser will see the results.
+    """
+    soup = BeautifulSoup(html, HTML_PARSER)
+    jobs = []
+    for card in soup.select(CARD_SELECTOR):
+        if card.select_one(CARD_SELECTOR) is not None:
+            continue  # a wrapper around another card; parse the inner one
+        title_link = card.select_one(FIELD_SELECTORS["title"])
+        if title_link is None:
+            continue
+        title = title_link.get_text(" ", strip=True)
+        company = _text(card, FIELD_SELECTORS["company"])
+        location = _text(card, FIELD_SELECTORS["location"])
+        if not (title and company):
+            continue
+        jobs.append(make_job_record(
+            title=title,
+            job_url=urljoin(page_url, title_link.get("href", "")),
+            company=company,
+            location=location,
+            experience=_text(card, FIELD_SELECTORS["experience"]),
+            salary=_text(card, FIELD_SELECTORS["salary"]),
+            skills=_skills(card),
+            posted=_text(card, FIELD_SELECTORS["posted"]),
+        ))
+
+    next_link = soup.select_one(NEXT_PAGE_SELECTOR)
+    next_url = None
+    if next_link is not None and "disabled" not in (next_link.get("class") or []) and next_link.get("href"):
+        next_url = urljoin(page_url, next_link["href"])
+
+    lowered = html.lower()
+    needs_js = not jobs and any(marker.lower() in lowered for marker in JS_SHELL_MARKERS)
+    return jobs, next_url, needs_js
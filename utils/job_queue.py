@@ -0,0 +1,246 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import traceback
+import uuid
+from typing import Callable, Dict, List, Optional
+
+from utils.executors import PoolSaturated
+from utils.sqlite_local import ThreadLocalSQLite
+
+JOBS_DB = os.getenv("JOBS_DB", os.path.join("temp", "jobs.db"))
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+JOB_RETENTION_SECONDS = int(os.getenv("JOB_RETENTION_SECONDS", str(24 * 3600)))
+JOB_MAX_QUEUED = int(os.getenv("JOB_MAX_QUEUED", "20"))  # per lane; further submissions get a 503
+
+QUEUED, RUNNING, SUCCEEDED, FAILED = "queued", "running", "succeeded", "failed"
+FINISHED = (SUCCEEDED, FAILED)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    status TEXT NOT NULL,
+    stage TEXT,
+    payload TEXT NOT NULL,
+    result TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_status_created ON jobs (status, created_at);
+CREATE TABLE IF NOT EXISTS job_events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    data TEXT,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS job_events_job ON job_events (job_id, id);
+"""
+
+# handler(payload, progress) -> JSON-serializable result
+JobHandler = Callable[[Dict, Callable], Dict]
+
+
+DEFAULT_LANE = "default"
+
+
+class JobQueue:
+    """Durable job queue on a local SQLite file, drained by pools of worker threads
+
+    Each job kind belongs to a lane with its own workers, so long batch
+    work (e.g. crawls) never holds the workers interactive jobs need.
+    """
+
+    def __init__(self, db_path: str = JOBS_DB, workers: int = JOB_WORKERS, max_queued: int = JOB_MAX_QUEUED):
+        self.db_path = db_path
+        self.workers = workers
+        self.max_queued = max_queued
+        self._handlers: Dict[str, JobHandler] = {}
+        self._lanes: Dict[str, int] = {DEFAULT_LANE: workers}
+        self._lane_kinds: Dict[str, List[str]] = {DEFAULT_LANE: []}
+        self._db = ThreadLocalSQLite(db_path, SCHEMA)
+        self._wakeup = threading.Condition()
+        self._stopping = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def _conn(self) -> sqlite3.Connection:
+        return self._db.connection()
+
+    def add_lane(self, lane: str, workers: int):
+        self._lanes[lane] = workers
+        self._lane_kinds.setdefault(lane, [])
+
+    def register(self, kind: str, handler: JobHandler, lane: str = DEFAULT_LANE):
+        if lane not in self._lanes:
+            raise ValueError(f"Unknown job lane {lane}")
+        self._handlers[kind] = handler
+        for kinds in self._lane_kinds.values():
+            if kind in kinds:
+                kinds.remove(kind)
+        self._lane_kinds[lane].append(kind)
+
+    def _lane(self, kind: str) -> str:
+        for lane, kinds in self._lane_kinds.items():
+            if kind in kinds:
+                return lane
+        raise ValueError(f"No handler registered for job kind {kind}")
+
+    # --- Producer side ---
+    def check_capacity(self, kind: str):
+        """Raise PoolSaturated when ``kind``'s lane already has ``max_queued`` jobs waiting
+
+        Call it before accepting a large upload, so a full queue is refused
+        before the body is stored.
+        """
+        kinds = self._lane_kinds[self._lane(kind)]
+        queued = self._conn().execute(
+            f"SELECT COUNT(*) FROM jobs WHERE status = ? AND kind IN ({', '.join('?' * len(kinds))})",
+            (QUEUED, *kinds),
+        ).fetchone()[0]
+        if queued >= self.max_queued:
+            raise PoolSaturated("job queue")
+
+    def submit(self, kind: str, payload: Dict) -> str:
+        self.check_capacity(kind)
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        conn = self._conn()
+        conn.execute(
+            "INSERT INTO jobs (id, kind, status, stage, payload, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (job_id, kind, QUEUED, QUEUED, json.dumps(payload), now, now),
+        )
+        self._add_event(conn, job_id, QUEUED, {})
+        with self._wakeup:
+            self._wakeup.notify_all()  # waiting workers may belong to other lanes
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        row = self._conn().execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        return {
+            "id": row["id"],
+            "kind": row["kind"],
+            "status": row["status"],
+            "stage": row["stage"],
+            "result": json.loads(row["result"]) if row["result"] else None,
+            "error": row["error"],
+            "created_at": row["created_at"],
+            "updated_at": row["updated_at"],
+        }
+
+    def events(self, job_id: str, after_id: int = 0) -> List[Dict]:
+        rows = self._conn().execute(
+            "SELECT id, stage, data, created_at FROM job_events WHERE job_id = ? AND id > ? ORDER BY id",
+            (job_id, after_id),
+        ).fetchall()
+        return [
+            {"id": row["id"], "stage": row["stage"], "created_at": row["created_at"],
+             **(json.loads(row["data"]) if row["data"] else {})}
+            for row in rows
+        ]
+
+    def stats(self) -> Dict:
+        rows = self._conn().execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status").fetchall()
+        counts = {row["status"]: row["n"] for row in rows}
+        return {"workers": dict(self._lanes), **{status: counts.get(status, 0) for status in (QUEUED, RUNNING, SUCCEEDED, FAILED)}}
+
+    # --- Worker side ---
+    def _add_event(self, conn: sqlite3.Connection, job_id: str, stage: str, data: Dict):
+        conn.execute(
+            "INSERT INTO job_events (job_id, stage, data, created_at) VALUES (?, ?, ?, ?)",
+            (job_id, stage, json.dumps(data) if data else None, time.time()),
+        )
+
+    def _claim(self, lane: str = DEFAULT_LANE) -> Optional[sqlite3.Row]:
+        """Oldest queued job of one of ``lane``'s kinds, marked running"""
+        kinds = self._lane_kinds[lane]
+        if not kinds:
+            return None
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                f"SELECT * FROM jobs WHERE status = ? AND kind IN ({', '.join('?' * len(kinds))})"
+                " ORDER BY created_at LIMIT 1", (QUEUED, *kinds)
+            ).fetchone()
+            if row is not None:
+                conn.execute(
+                    "UPDATE jobs SET status = ?, stage = ?, updated_at = ? WHERE id = ?",
+                    (RUNNING, "starting", time.time(), row["id"]),
+                )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return row
+
+    def _progress(self, job_id: str) -> Callable:
+        def progress(stage: str, **data):
+            conn = self._conn()
+            conn.execute("UPDATE jobs SET stage = ?, updated_at = ? WHERE id = ?", (stage, time.time(), job_id))
+            self._add_event(conn, job_id, stage, data)
+        return progress
+
+    def _finish(self, job_id: str, status: str, result: Optional[Dict] = None, error: Optional[str] = None):
+        conn = self._conn()
+        conn.execute(
+            "UPDATE jobs SET status = ?, stage = ?, result = ?, error = ?, updated_at = ? WHERE id = ?",
+            (status, status, json.dumps(result) if result is not None else None, error, time.time(), job_id),
+        )
+        self._add_event(conn, job_id, status, {"error": error} if error else {})
+
+    def _run_one(self, row: sqlite3.Row):
+        job_id = row["id"]
+        handler = self._handlers.get(row["kind"])
+        if handler is None:
+            self._finish(job_id, FAILED, error=f"No handler registered for job kind {row['kind']}")
+            return
+        try:
+            result = handler(json.loads(row["payload"]), self._progress(job_id))
+            self._finish(job_id, SUCCEEDED, result=result)
+        except Exception as e:
+            traceback.print_exc()
+            self._finish(job_id, FAILED, error=str(e))
+
+    def _worker(self, lane: str):
+        while not self._stopping.is_set():
+            try:
+                row = self._claim(lane)
+            except sqlite3.OperationalError as e:
+                print(f"Job queue claim failed: {e}")
+                row = None
+            if row is None:
+                with self._wakeup:
+                    self._wakeup.wait(timeout=1.0)
+                continue
+            self._run_one(row)
+
+    def start(self):
+        """Requeue jobs interrupted by a restart, prune old ones, and start the workers"""
+        conn = self._conn()
+        conn.execute("UPDATE jobs SET status = ?, stage = ? WHERE status = ?", (QUEUED, QUEUED, RUNNING))
+        cutoff = time.time() - JOB_RETENTION_SECONDS
+        conn.execute("DELETE FROM job_events WHERE job_id IN (SELECT id FROM jobs WHERE updated_at < ? AND status IN (?, ?))",
+                     (cutoff, SUCCEEDED, FAILED))
+        conn.execute("DELETE FROM jobs WHERE updated_at < ? AND status IN (?, ?)", (cutoff, SUCCEEDED, FAILED))
+
+        self._stopping.clear()
+        for lane, workers in self._lanes.items():
+            for i in range(workers):
+                thread = threading.Thread(target=self._worker, args=(lane,), name=f"job-{lane}-{i}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def stop(self):
+        self._stopping.set()
+        with self._wakeup:
+            self._wakeup.notify_all()
+        self._threads.clear()
+
+
+job_queue = JobQueue()
@@ -1,67 +1,121 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import time
-import random
-from typing import List, Dict
-from webdriver_manager.chrome import ChromeDriverManager
+import json
+import os
+from typing import List, Dict, Optional
+
+from utils.browser_pool import BrowserPool, browser_pool, create_chrome_driver
+from utils.job_parsing import CARD_SELECTOR, FIELD_SELECTORS, make_job_record, naukri_search_url
+from utils.job_scraper_http import JobScraperHTTP, NeedsBrowser
+from utils.rate_limit import scrape_limiter
+
+JOB_SCRAPER_ENGINE = os.getenv("JOB_SCRAPER_ENGINE", "auto")
+JOB_SCRAPER_BULK_DOM = os.getenv("JOB_SCRAPER_BULK_DOM", "true").lower() in ("1", "true", "yes")
+
+# Reads every card on the page in the browser and hands back one JSON array,
+# using the same selectors as the HTTP parser so both engines agree
+EXTRACT_CARDS_JS = """
+const [cardSelector, fields] = arguments;
+const cards = Array.from(document.querySelectorAll(cardSelector))
+    .filter(card => !card.querySelector(cardSelector));
+const text = (card, selector) => {
+    const el = card.querySelector(selector);
+    return el ? el.innerText.trim() : "";
+};
+return JSON.stringify(cards.map(card => {
+    const link = card.querySelector(fields.title);
+    const tags = card.querySelector(fields.skills);
+    let skills = "";
+    if (tags) {
+        const items = Array.from(tags.querySelectorAll("li")).map(li => li.innerText.trim()).filter(Boolean);
+        skills = items.length ? items.join(", ") : tags.innerText.trim();
+    }
+    return {
+        title: link ? link.innerText.trim() : "",
+        job_url: link ? link.href : "",
+        company: text(card, fields.company),
+        location: text(card, fields.location),
+        experience: text(card, fields.experience),
+        salary: text(card, fields.salary),
+        skills: skills,
+        posted: text(card, fields.posted),
+    };
+}));
+"""
 
 
 class JobScraperSelenium:
-    def __init__(self, driver_path: str = None):
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")  
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--log-level=3")
-
-        # Use ChromeDriverManager if no path provided
-        if driver_path:
-            self.driver = webdriver.Chrome(service=Service(driver_path), options=chrome_options)
-        else:
-            self.driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
-
-        self.wait = WebDriverWait(self.driver, 10)
+    def __init__(self, driver_path: str = None, pool: Optional[BrowserPool] = None,
+                 bulk_extract: bool = JOB_SCRAPER_BULK_DOM):
+        # Browsers come from a shared pool so parallel searches reuse warm sessions
+        if pool is None:
+            pool = BrowserPool(factory=lambda: create_chrome_driver(driver_path)) if driver_path else browser_pool
+        self.pool = pool
+        self.bulk_extract = bulk_extract
 
     def scrape_naukri_jobs(self, keyword: str = "python developer", location: str = "bangalore",
                            pages: int = 3) -> List[Dict]:
         jobs = []
-        try:
-            search_url = f"https://www.naukri.com/{keyword.replace(' ', '-')}-jobs-in-{location.lower()}"
-            self.driver.get(search_url)
-
-            for page in range(pages):
-                self.wait.until(EC.presence_of_all_elements_located((By.CLASS_NAME, 'jobTuple')))
-                job_cards = self.driver.find_elements(By.CLASS_NAME, 'jobTuple')
-
-                for card in job_cards:
+        with self.pool.session() as session:
+            driver = session.driver
+            wait = WebDriverWait(driver, 10)
+            try:
+                search_url = naukri_search_url(keyword, location)
+                scrape_limiter.wait(search_url)
+                driver.get(search_url)
+                session.mark_page()
+
+                for page in range(pages):
+                    wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, CARD_SELECTOR)))
+                    jobs.extend(self.extract_page_jobs(driver))
+
+                    # Go to next page
                     try:
-                        job_data = self.extract_job_data(card)
-                        if job_data:
-                            jobs.append(job_data)
+                        next_button = driver.find_element(By.XPATH, '//a[@class="fright fs14 btn-secondary br2"]')
+                        if "disabled" in next_button.get_attribute("class"):
+                            break
+                        scrape_limiter.wait(search_url)
+                        old_card = driver.find_element(By.CSS_SELECTOR, CARD_SELECTOR)
+                        next_button.click()
+                        session.mark_page()
+                        # The current cards go stale once the next page replaces them;
+                        # the wait at the top of the loop then sees only the new ones
+                        wait.until(EC.staleness_of(old_card))
+                    except TimeoutException:
+                        print(f"Page {page + 2} did not load; keeping the first {page + 1}")
+                        break
                     except Exception as e:
-                        print(f"Error parsing job card: {e}")
-
-                # Go to next page
-                try:
-                    next_button = self.driver.find_element(By.XPATH, '//a[@class="fright fs14 btn-secondary br2"]')
-                    if "disabled" in next_button.get_attribute("class"):
+                        print("No next button or end of pagination:", e)
                         break
-                    next_button.click()
-                    time.sleep(random.uniform(2, 4))
-                except Exception as e:
-                    print("No next button or end of pagination:", e)
-                    break
 
-        except Exception as e:
-            print(f"Error during scraping: {e}")
+            except Exception as e:
+                print(f"Error during scraping: {e}")
+                session.broken = not session.healthy()
 
-        self.driver.quit()
+        # The driver goes back to the pool instead of being quit
         return jobs[:50]  # Limit to 50 jobs
 
+    def extract_page_jobs(self, driver) -> List[Dict]:
+        """All job cards on the current page, read in one execute_script round-trip when possible"""
+        if self.bulk_extract:
+            try:
+                cards = json.loads(driver.execute_script(EXTRACT_CARDS_JS, CARD_SELECTOR, FIELD_SELECTORS))
+                return [make_job_record(**fields) for fields in cards if fields["title"] and fields["company"]]
+            except Exception as e:
+                print(f"Bulk extraction failed, reading cards one by one: {e}")
+
+        jobs = []
+        for card in driver.find_elements(By.CSS_SELECTOR, CARD_SELECTOR):
+            try:
+                job_data = self.extract_job_data(card)
+                if job_data:
+                    jobs.append(job_data)
+            except Exception as e:
+                print(f"Error parsing job card: {e}")
+        return jobs
+
     def extract_job_data(self, card) -> Dict:
         try:
             title = card.find_element(By.CLASS_NAME, "title").text
@@ -69,36 +123,64 @@ class JobScraperSelenium:
             company = card.find_element(By.CLASS_NAME, "subTitle").text
             location = card.find_element(By.CLASS_NAME, "locWdth").text
             experience = card.find_element(By.CLASS_NAME, "expwdth").text
-            salary = card.find_element(By.CLASS_NAME, "salary").text if self.safe_find(card, "salary") else "Not disclosed"
-            skills = card.find_element(By.CLASS_NAME, "tags").text if self.safe_find(card, "tags") else ""
-            posted = card.find_element(By.CLASS_NAME, "type br2 fleft grey").text if self.safe_find(card, "type br2 fleft grey") else "Recently"
-
-            return {
-                "id": hash(title + company + location) % 10000,
-                "title": title,
-                "company": company,
-                "location": location,
-                "experience": experience,
-                "salary": salary,
-                "skills": skills.split(', ') if skills else [],
-                "posted_date": posted,
-                "job_url": job_url,
-                "description": f"Looking for {title} with experience in {skills}. Join {company} team.",
-                "job_type": "Full-time",
-                "remote": "hybrid" if "remote" in title.lower() else "office"
-            }
+            salary = self.safe_text(card, ".salary") or "Not disclosed"
+            skills = self.safe_text(card, ".tags")
+            posted = self.safe_text(card, ".type.br2.fleft.grey") or "Recently"
+
+            return make_job_record(title, job_url, company, location, experience, salary, skills, posted)
         except Exception as e:
             print("Extraction failed:", e)
             return None
 
-    def safe_find(self, element, class_name: str):
-        try:
-            element.find_element(By.CLASS_NAME, class_name)
-            return True
-        except:
-            return False
+    def safe_text(self, element, css_selector: str) -> str:
+        """Text of an optional child, found with a single round-trip ("" when absent)"""
+        found = element.find_elements(By.CSS_SELECTOR, css_selector)
+        return found[0].text if found else ""
 
 
+class JobScraper:
+    """Job search front end: plain HTTP first, a pooled browser only when the page needs JS
 
-# Add alias for backward compatibility
-JobScraper = JobScraperSelenium
+    ``engine`` is "auto" (default), "http" or "selenium"; JOB_SCRAPER_ENGINE
+    sets it per deployment.
+    """
+
+    def __init__(self, engine: str = JOB_SCRAPER_ENGINE, driver_path: str = None,
+                 pool: Optional[BrowserPool] = None):
+        if engine not in ("auto", "http", "selenium"):
+            raise ValueError(f"Unknown scraper engine: {engine}")
+        self.engine = engine
+        self.http = JobScraperHTTP()
+        self.selenium = JobScraperSelenium(driver_path, pool)
+        self.pool = self.selenium.pool
+        self.http_searches = 0
+        self.browser_searches = 0
+        self.fallbacks = 0
+
+    def scrape_naukri_jobs(self, keyword: str = "python developer", location: str = "bangalore",
+                           pages: int = 3) -> List[Dict]:
+        if self.engine != "selenium":
+            try:
+                jobs = self.http.scrape_naukri_jobs(keyword, location, pages)
+                self.http_searches += 1
+                return jobs
+            except NeedsBrowser as e:
+                if self.engine == "http":
+                    raise
+                self.fallbacks += 1
+                print(f"Falling back to browser scraping: {e}")
+        self.browser_searches += 1
+        return self.selenium.scrape_naukri_jobs(keyword, location, pages)
+
+    def stats(self) -> Dict:
+        return {
+            "engine": self.engine,
+            "http_searches": self.http_searches,
+            "browser_searches": self.browser_searches,
+            "fallbacks": self.fallbacks,
+            "browsers": self.pool.stats(),
+        }
+
+    def close(self):
+        self.http.close()
+        self.pool.close()
@@ -0,0 +1,102 @@
+import asyncio
+import os
+import threading
+from typing import Dict, List, Optional
+
+import httpx
+
+from utils.job_parsing import naukri_search_url, parse_naukri_listing
+from utils.rate_limit import scrape_limiter
+
+JOB_HTTP_TIMEOUT = float(os.getenv("JOB_HTTP_TIMEOUT", "15"))
+JOB_HTTP_MAX_CONNECTIONS = int(os.getenv("JOB_HTTP_MAX_CONNECTIONS", "10"))
+JOB_HTTP_USER_AGENT = os.getenv(
+    "JOB_HTTP_USER_AGENT",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0 Safari/537.36",
+)
+
+
+class NeedsBrowser(Exception):
+    """The listing could not be read over plain HTTP (JS-rendered page, blocked or failed request)"""
+
+
+class JobScraperHTTP:
+    """Browser-free scraping engine: pooled async HTTP fetches parsed with BeautifulSoup
+
+    The httpx client lives on a private event loop thread so its connection
+    pool is reused across calls from worker threads.
+    """
+
+    def __init__(self, timeout: float = JOB_HTTP_TIMEOUT, max_connections: int = JOB_HTTP_MAX_CONNECTIONS):
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._lock = threading.Lock()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="job-http-loop", daemon=True).start()
+                self._loop = loop
+            return self._loop
+
+    def _get_client(self) -> httpx.AsyncClient:
+        # Only called on the private loop, so no locking is needed
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                follow_redirects=True,
+                headers={"User-Agent": JOB_HTTP_USER_AGENT, "Accept-Language": "en-US,en;q=0.9"},
+                limits=httpx.Limits(max_connections=self.max_connections,
+                                    max_keepalive_connections=self.max_connections),
+            )
+        return self._client
+
+    async def _fetch(self, url: str) -> str:
+        await scrape_limiter.wait_async(url)
+        try:
+            response = await self._get_client().get(url)
+        except httpx.HTTPError as e:
+            raise NeedsBrowser(f"request failed for {url}: {e}")
+        if response.status_code in (403, 429) or response.status_code >= 500:
+            raise NeedsBrowser(f"{url} returned {response.status_code}")
+        response.raise_for_status()
+        return response.text
+
+    async def _search(self, keyword: str, location: str, pages: int) -> List[Dict]:
+        first_url = naukri_search_url(keyword, location)
+        jobs, next_url, needs_js = parse_naukri_listing(await self._fetch(first_url), first_url)
+        if needs_js:
+            raise NeedsBrowser(f"{first_url} is rendered client-side")
+        if pages <= 1 or next_url is None:
+            return jobs
+
+        # Result pages are addressable by URL, so fetch the rest concurrently
+        urls = [naukri_search_url(keyword, location, page) for page in range(2, pages + 1)]
+        pages_html = await asyncio.gather(*(self._fetch(url) for url in urls), return_exceptions=True)
+        for url, html in zip(urls, pages_html):
+            if isinstance(html, Exception):
+                print(f"Skipping {url}: {html}")
+                continue
+            page_jobs, _, _ = parse_naukri_listing(html, url)
+            if not page_jobs:
+                break
+            jobs.extend(page_jobs)
+        return jobs
+
+    def scrape_naukri_jobs(self, keyword: str = "python developer", location: str = "bangalore",
+                           pages: int = 3) -> List[Dict]:
+        future = asyncio.run_coroutine_threadsafe(self._search(keyword, location, pages), self._ensure_loop())
+        return future.result()[:50]  # Limit to 50 jobs
+
+    def close(self):
+        with self._lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+        if self._client is not None:
+            asyncio.run_coroutine_threadsafe(self._client.aclose(), loop).result(timeout=5)
+            self._client = None
+        loop.call_soon_threadsafe(loop.stop)
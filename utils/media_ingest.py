@@ -0,0 +1,209 @@
+import json
+import os
+import subprocess
+import threading
+from typing import Dict, Iterator, Optional, Union
+
+import numpy as np
+
+from utils.result_cache import file_digest
+
+SAMPLE_RATE = 16000
+
+
+def _run(cmd, what: str) -> bytes:
+    try:
+        proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"{cmd[0]} not found. Please install ffmpeg and add it to your PATH.")
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"{cmd[0]} failed to {what}: {e.stderr.decode(errors='ignore').strip()[-500:]}")
+    return proc.stdout
+
+
+def probe_media(path: str) -> Dict:
+    """Read container and stream metadata with a single ffprobe call"""
+    out = _run([
+        "ffprobe", "-v", "error",
+        "-show_entries",
+        "format=duration:stream=codec_type,duration,avg_frame_rate,width,height"
+        ":stream_tags=rotate:stream_side_data=rotation",
+        "-of", "json", path
+    ], "probe the media")
+    info = json.loads(out or b"{}")
+
+    audio = next((s for s in info.get("streams", []) if s.get("codec_type") == "audio"), None)
+    video = next((s for s in info.get("streams", []) if s.get("codec_type") == "video"), None)
+
+    def _float(value, default=0.0):
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return default
+
+    fps = 0.0
+    if video and video.get("avg_frame_rate", "0/0") != "0/0":
+        num, _, den = video["avg_frame_rate"].partition("/")
+        fps = _float(num) / (_float(den, 1.0) or 1.0)
+
+    # Phone recordings are often stored sideways with a rotation flag that
+    # ffmpeg applies on decode, which swaps the decoded width and height
+    rotation = 0
+    if video:
+        rotation = _float(video.get("tags", {}).get("rotate"))
+        for side_data in video.get("side_data_list", []):
+            rotation = rotation or _float(side_data.get("rotation"))
+    width = int(video.get("width", 0)) if video else 0
+    height = int(video.get("height", 0)) if video else 0
+    if int(abs(rotation)) % 180 == 90:
+        width, height = height, width
+
+    return {
+        "duration": _float(info.get("format", {}).get("duration")),
+        "audio_duration": _float(audio.get("duration")) if audio else 0.0,
+        "has_audio": audio is not None,
+        "has_video": video is not None,
+        "fps": fps,
+        "width": width,
+        "height": height,
+    }
+
+
+class MediaBundle:
+    """An upload probed once, with its audio decoded once into 16 kHz mono PCM
+
+    Consumers share the same bundle: transcription reads ``audio``, speech
+    scoring reads ``duration`` and posture scoring iterates ``frames()``,
+    so nobody goes back to ffmpeg or the disk for the same data.
+    """
+
+    def __init__(self, path: str, digest: Optional[str] = None):
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Video file not found: {path}")
+        self.path = path
+        self.info = probe_media(path)
+        self._digest = digest
+        self._audio: Optional[np.ndarray] = None
+        self._audio_lock = threading.Lock()
+
+    @property
+    def digest(self) -> str:
+        """sha256 of the uploaded file, used as the cache key for its results"""
+        if self._digest is None:
+            self._digest = file_digest(self.path)
+        return self._digest
+
+    @property
+    def audio(self) -> np.ndarray:
+        """Mono float32 PCM at 16 kHz, decoded on first access and kept in memory"""
+        with self._audio_lock:
+            if self._audio is None:
+                if not self.info["has_audio"]:
+                    self._audio = np.zeros(0, dtype=np.float32)
+                else:
+                    raw = _run([
+                        "ffmpeg", "-nostdin", "-v", "error", "-i", self.path,
+                        "-vn", "-ac", "1", "-ar", str(SAMPLE_RATE),
+                        "-f", "s16le", "-"
+                    ], "convert the audio")
+                    self._audio = np.frombuffer(raw, np.int16).astype(np.float32) / 32768.0
+            return self._audio
+
+    @property
+    def duration(self) -> float:
+        """Audio length in seconds (falls back to the container duration)"""
+        if self._audio is not None:
+            return len(self._audio) / float(SAMPLE_RATE)
+        return self.info["audio_duration"] or self.info["duration"]
+
+    @property
+    def fps(self) -> float:
+        return self.info["fps"]
+
+    def frames(self, fps: float = 0, max_side: int = 0, keyframes_only: bool = False) -> Iterator[np.ndarray]:
+        """Yield decoded BGR video frames in order
+
+        ``fps`` samples frames at roughly that rate (0 keeps every frame),
+        ``max_side`` downscales so the longer side is at most that many pixels,
+        and ``keyframes_only`` asks the decoder to skip everything but I-frames.
+        """
+        if keyframes_only:
+            yield from self._keyframes(fps, max_side)
+            return
+
+        import cv2
+
+        cap = cv2.VideoCapture(self.path)
+        source_fps = self.fps or cap.get(cv2.CAP_PROP_FPS) or 0
+        step = source_fps / fps if fps and source_fps > fps else 1.0
+        next_index = 0.0
+        index = 0
+        try:
+            while cap.isOpened():
+                # grab() demuxes and decodes without the colour conversion and
+                # copy that retrieve() does, so skipped frames stay cheap
+                if not cap.grab():
+                    break
+                if index >= next_index:
+                    ret, frame = cap.retrieve()
+                    if not ret:
+                        break
+                    next_index += step
+                    yield downscale_frame(frame, max_side)
+                index += 1
+        finally:
+            cap.release()
+
+    def _keyframes(self, fps: float, max_side: int) -> Iterator[np.ndarray]:
+        width, height = _scaled_size(self.info["width"], self.info["height"], max_side)
+        if not width or not height:
+            return
+        filters = [f"scale={width}:{height}:flags=area"]
+        if fps:
+            filters.insert(0, f"fps={fps}")
+        proc = subprocess.Popen([
+            "ffmpeg", "-nostdin", "-v", "error",
+            "-skip_frame", "nokey", "-i", self.path,
+            "-an", "-vsync", "vfr", "-vf", ",".join(filters),
+            "-pix_fmt", "bgr24", "-f", "rawvideo", "-"
+        ], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        frame_bytes = width * height * 3
+        try:
+            while True:
+                raw = proc.stdout.read(frame_bytes)
+                if len(raw) < frame_bytes:
+                    break
+                yield np.frombuffer(raw, np.uint8).reshape(height, width, 3)
+        finally:
+            proc.stdout.close()
+            proc.kill()
+            proc.wait()
+
+
+def _scaled_size(width: int, height: int, max_side: int):
+    """Target size keeping aspect ratio, rounded to even numbers for ffmpeg"""
+    if max_side and max(width, height) > max_side:
+        scale = max_side / float(max(width, height))
+        width, height = int(width * scale), int(height * scale)
+    return width - width % 2, height - height % 2
+
+
+def downscale_frame(frame: np.ndarray, max_side: int) -> np.ndarray:
+    if not max_side or max(frame.shape[:2]) <= max_side:
+        return frame
+    import cv2
+
+    height, width = frame.shape[:2]
+    scale = max_side / float(max(width, height))
+    return cv2.resize(frame, (int(width * scale), int(height * scale)), interpolation=cv2.INTER_AREA)
+
+
+def ingest_media(path: str, digest: Optional[str] = None) -> MediaBundle:
+    return MediaBundle(path, digest)
+
+
+def as_media(source: Union[str, MediaBundle]) -> MediaBundle:
+    """Accept either a file path or an already ingested bundle"""
+    if isinstance(source, MediaBundle):
+        return source
+    return MediaBundle(source)
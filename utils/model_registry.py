@@ -0,0 +1,198 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+
+# Defaults can be overridden per deployment without touching the code
+DEFAULT_MODEL_SIZE = os.getenv("WHISPER_MODEL", "base")
+DEFAULT_DEVICE = os.getenv("WHISPER_DEVICE", "")  # empty -> cuda if available, else cpu
+DEFAULT_COMPUTE_TYPE = os.getenv("WHISPER_COMPUTE_TYPE", "float32")
+MEMORY_BUDGET_MB = int(os.getenv("WHISPER_MEMORY_BUDGET_MB", "2048"))
+IDLE_TTL_SECONDS = int(os.getenv("WHISPER_IDLE_TTL", "1800"))
+
+ModelKey = Tuple[str, str, str]
+
+
+def _resolve_device(device: Optional[str]) -> str:
+    if device:
+        return device
+    if DEFAULT_DEVICE:
+        return DEFAULT_DEVICE
+    try:
+        import torch
+        return "cuda" if torch.cuda.is_available() else "cpu"
+    except Exception:
+        return "cpu"
+
+
+def _model_size_bytes(model) -> int:
+    """Approximate resident size of a torch model (parameters + buffers)"""
+    total = 0
+    for tensor in list(model.parameters()) + list(model.buffers()):
+        total += tensor.numel() * tensor.element_size()
+    return total
+
+
+class _Entry:
+    def __init__(self):
+        self.model = None
+        self.size_bytes = 0
+        self.last_used = time.monotonic()
+        self.in_use = 0
+        # Serializes loading of this key and inference on this model.
+        # Whisper installs kv-cache hooks on the shared decoder during
+        # transcribe(), so two calls on one model must not overlap.
+        self.load_lock = threading.Lock()
+        self.infer_lock = threading.Lock()
+
+
+class WhisperModelRegistry:
+    """Process-wide cache of Whisper models keyed by (size, device, compute_type)"""
+
+    def __init__(self, memory_budget_mb: int = MEMORY_BUDGET_MB, idle_ttl: int = IDLE_TTL_SECONDS):
+        self.memory_budget = memory_budget_mb * 1024 * 1024
+        self.idle_ttl = idle_ttl
+        self._entries: "OrderedDict[ModelKey, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.loads = 0
+        self.evictions = 0
+
+    def key(self, size: Optional[str] = None, device: Optional[str] = None,
+            compute_type: Optional[str] = None) -> ModelKey:
+        return (size or DEFAULT_MODEL_SIZE, _resolve_device(device), compute_type or DEFAULT_COMPUTE_TYPE)
+
+    def _load(self, key: ModelKey):
+        import whisper
+
+        size, device, compute_type = key
+        print(f"Loading Whisper model {size} on {device} ({compute_type})")
+        model = whisper.load_model(size, device=device)
+        if compute_type == "float16" and device != "cpu":
+            model = model.half()
+        return model
+
+    def _acquire(self, key: ModelKey) -> _Entry:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = _Entry()
+                self._entries[key] = entry
+            self._entries.move_to_end(key)
+            entry.in_use += 1
+
+        try:
+            with entry.load_lock:
+                if entry.model is None:
+                    entry.model = self._load(key)
+                    entry.size_bytes = _model_size_bytes(entry.model)
+                    self.loads += 1
+        except Exception:
+            with self._lock:
+                entry.in_use -= 1
+                if entry.model is None and entry.in_use == 0:
+                    self._entries.pop(key, None)
+            raise
+
+        with self._lock:
+            entry.last_used = time.monotonic()
+            self._evict_locked(keep=key)
+        return entry
+
+    def _release(self, entry: _Entry):
+        with self._lock:
+            entry.in_use -= 1
+            entry.last_used = time.monotonic()
+
+    def _evict_locked(self, keep: Optional[ModelKey] = None):
+        """Drop idle models past their TTL, then LRU models until under budget"""
+        now = time.monotonic()
+        evicted = False
+
+        for key, entry in list(self._entries.items()):
+            if key == keep or entry.in_use or entry.model is None:
+                continue
+            if self.idle_ttl and now - entry.last_used > self.idle_ttl:
+                del self._entries[key]
+                self.evictions += 1
+                evicted = True
+
+        total = sum(entry.size_bytes for entry in self._entries.values())
+        for key, entry in list(self._entries.items()):  # oldest first
+            if total <= self.memory_budget:
+                break
+            if key == keep or entry.in_use or entry.model is None:
+                continue
+            total -= entry.size_bytes
+            del self._entries[key]
+            self.evictions += 1
+            evicted = True
+
+        if evicted:
+            try:
+                import torch
+                if torch.cuda.is_available():
+                    torch.cuda.empty_cache()
+            except Exception:
+                pass
+
+    def get(self, size: Optional[str] = None, device: Optional[str] = None,
+            compute_type: Optional[str] = None):
+        """Return a loaded model, loading it on first use"""
+        entry = self._acquire(self.key(size, device, compute_type))
+        self._release(entry)
+        return entry.model
+
+    def transcribe(self, audio, size: Optional[str] = None, device: Optional[str] = None,
+                   compute_type: Optional[str] = None, **options) -> Dict:
+        """Run model.transcribe on a shared model; audio may be a path or a float32 array"""
+        key = self.key(size, device, compute_type)
+        options.setdefault("fp16", key[2] == "float16" and key[1] != "cpu")
+        entry = self._acquire(key)
+        try:
+            with entry.infer_lock:
+                return entry.model.transcribe(audio, **options)
+        finally:
+            self._release(entry)
+
+    def warm_up(self, sizes: Iterable[str], device: Optional[str] = None,
+                compute_type: Optional[str] = None):
+        for size in sizes:
+            try:
+                self.get(size, device, compute_type)
+            except Exception as e:
+                print(f"Whisper warm-up failed for {size}: {e}")
+
+    def evict_idle(self):
+        """Drop models unused for ``idle_ttl``; the API calls this periodically"""
+        with self._lock:
+            self._evict_locked()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "models": [
+                    {
+                        "size": key[0],
+                        "device": key[1],
+                        "compute_type": key[2],
+                        "loaded": entry.model is not None,
+                        "memory_mb": round(entry.size_bytes / (1024 * 1024), 1),
+                        "in_use": entry.in_use,
+                    }
+                    for key, entry in self._entries.items()
+                ],
+                "memory_budget_mb": self.memory_budget // (1024 * 1024),
+                "loads": self.loads,
+                "evictions": self.evictions,
+            }
+
+
+whisper_registry = WhisperModelRegistry()
+
+
+def warm_up_from_env():
+    """Preload the models listed in WHISPER_WARMUP (comma separated, e.g. "base,small")"""
+    sizes = [s.strip() for s in os.getenv("WHISPER_WARMUP", "").split(",") if s.strip()]
+    if sizes:
+        whisper_registry.warm_up(sizes)
@@ -1,14 +1,19 @@
+import asyncio
 import os
-import fitz  # PyMuPDF
-from fastapi import FastAPI, UploadFile, File, HTTPException
-from fastapi.responses import JSONResponse
-from tempfile import NamedTemporaryFile
+import random
+import time
+from typing import AsyncIterator, Awaitable, Dict, List, Optional, Tuple
+
 from dotenv import load_dotenv
 
+import groq
+import tiktoken
 from langchain.text_splitter import CharacterTextSplitter
 from langchain_core.prompts import PromptTemplate
 from langchain_groq import ChatGroq
-from langchain.chains.summarize import load_summarize_chain
+
+from utils.rate_limit import TokenBucket
+from utils.result_cache import result_cache, text_digest
 
 load_dotenv()
 
@@ -16,12 +21,19 @@ GROQ_API_KEY = os.getenv("GROQ_API_KEY")
 if not GROQ_API_KEY:
     raise ValueError("GROQ_API_KEY environment variable not set")
 
-llm = ChatGroq(
-    groq_api_key=GROQ_API_KEY,
-    model_name="llama3-8b-8192"
-)
+SUMMARY_MODEL = os.getenv("SUMMARY_MODEL", "llama3-8b-8192")
+SUMMARY_CHUNK_TOKENS = int(os.getenv("SUMMARY_CHUNK_TOKENS", "1500"))
+SUMMARY_CHUNK_OVERLAP = int(os.getenv("SUMMARY_CHUNK_OVERLAP", "200"))
+SUMMARY_TIMEOUT = float(os.getenv("SUMMARY_TIMEOUT", "60"))
+SUMMARY_CONCURRENCY = int(os.getenv("SUMMARY_CONCURRENCY", "4"))
+SUMMARY_RATE_PER_SECOND = float(os.getenv("SUMMARY_RATE_PER_SECOND", "0.5"))  # Groq free tier: 30 requests/min
+SUMMARY_BURST = int(os.getenv("SUMMARY_BURST", "4"))
+SUMMARY_MAX_RETRIES = int(os.getenv("SUMMARY_MAX_RETRIES", "5"))
+SUMMARY_REDUCE_TOKENS = int(os.getenv("SUMMARY_REDUCE_TOKENS", "3000"))
+SUMMARY_REDUCE_FANOUT = int(os.getenv("SUMMARY_REDUCE_FANOUT", "6"))  # average summaries per reduce call
 
-app = FastAPI()
+# Memoized LLM outputs, keyed by the exact input text
+MEMO_NAMESPACES = {"map": "summary_chunk", "reduce": "summary_reduce"}
 
 SUMMARY_PROMPT = PromptTemplate.from_template("""
 Summarize the following content clearly and concisely:
@@ -31,45 +43,246 @@ Summarize the following content clearly and concisely:
 Summary:
 """)
 
-def PDFSummarizer(file: UploadFile) -> str:
-    if not file.filename.endswith(".pdf"):
-        raise HTTPException(status_code=400, detail="Only PDF files are allowed.")
+# Every summarization in the process shares the provider's request budget
+llm_limiter = TokenBucket(SUMMARY_RATE_PER_SECOND, SUMMARY_BURST)
 
-    # Save uploaded PDF temporarily
-    with NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-        tmp.write(file.file.read())
-        tmp_path = tmp.name
 
+def retry_delay(error: Exception, attempt: int) -> Optional[float]:
+    """Back-off before retrying a rate-limited (429) or transient provider error; None if not retryable"""
+    if not isinstance(error, (groq.RateLimitError, groq.InternalServerError, groq.APIConnectionError)):
+        return None
+    backoff = min(30.0, 2.0 ** attempt) * random.uniform(0.5, 1.0)
+    response = getattr(error, "response", None)
     try:
-        # Extract text from PDF using PyMuPDF
-        text = ""
-        with fitz.open(tmp_path) as doc:
-            for page in doc:
-                text += page.get_text()
-
-        if not text.strip():
-            raise HTTPException(status_code=400, detail="No readable text found in PDF.")
-
-        # Split large text into chunks
-        splitter = CharacterTextSplitter.from_tiktoken_encoder(
-            chunk_size=1500,
-            chunk_overlap=200
+        retry_after = float(response.headers.get("retry-after", 0)) if response is not None else 0.0
+    except ValueError:
+        retry_after = 0.0
+    return max(retry_after, backoff)
+
+
+class SummaryRun:
+    """Concurrency gate and counters for one document's map-reduce"""
+
+    def __init__(self, concurrency: int):
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.llm_calls = 0
+        self.retries = 0
+        self.reduce_levels = 0
+        self.memo = {kind: {"hits": 0, "calls": 0} for kind in MEMO_NAMESPACES}
+
+    def count(self, kind: str, hit: bool):
+        self.memo[kind]["calls"] += 1
+        self.memo[kind]["hits"] += hit
+
+    def stats(self) -> Dict:
+        return {
+            "reduce_levels": self.reduce_levels,
+            "llm_calls": self.llm_calls,
+            "retries": self.retries,
+            "memo": {
+                kind: {**counts, "hit_ratio": round(counts["hits"] / counts["calls"], 3) if counts["calls"] else 0.0}
+                for kind, counts in self.memo.items()
+            },
+        }
+
+
+async def gather_or_cancel(calls: List[Awaitable]) -> List:
+    """asyncio.gather that cancels the remaining calls as soon as one fails"""
+    tasks = [asyncio.ensure_future(call) for call in calls]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
+class PDFSummarizer:
+    """Map-reduce summaries of extracted PDF text
+
+    The Groq client (and its keep-alive HTTP connection pool) and the
+    tokenizer-backed splitter are built once per process. Every map and
+    reduce output is memoized on disk by a hash of its input, so a new
+    version of a known document only sends changed chunks (and the
+    reduce groups above them) to the LLM. Chunk
+    summaries (map) run concurrently, bounded per document by
+    SUMMARY_CONCURRENCY and process-wide by the ``llm_limiter`` token
+    bucket; 429s and transient errors are retried with back-off. The
+    summaries are then reduced in groups of up to SUMMARY_REDUCE_TOKENS,
+    level by level, so wall-clock time grows with the tree depth rather
+    than the chunk count. The last reduce is streamed token by token.
+    """
+
+    def __init__(self, model_name: str = SUMMARY_MODEL):
+        self.llm = ChatGroq(
+            groq_api_key=GROQ_API_KEY,
+            model_name=model_name,
+            request_timeout=SUMMARY_TIMEOUT,
+            max_retries=0,  # retried here, through the shared rate limiter
         )
-        docs = splitter.create_documents([text])
-
-        # Create summarization chain
-        chain = load_summarize_chain(
-            llm=llm,
-            chain_type="map_reduce",
-            map_prompt=SUMMARY_PROMPT,
-            combine_prompt=SUMMARY_PROMPT
+        # Memo keys change with the model and the prompt
+        self.memo_salt = text_digest(model_name, SUMMARY_PROMPT.template)
+        self.encoding = tiktoken.get_encoding("gpt2")
+        self.splitter = CharacterTextSplitter.from_tiktoken_encoder(
+            chunk_size=SUMMARY_CHUNK_TOKENS,
+            chunk_overlap=SUMMARY_CHUNK_OVERLAP
         )
 
-        summary = chain.run(docs)
-        return summary.strip()
+    def split(self, text: str) -> List[str]:
+        return self.splitter.split_text(text)
+
+    def count_tokens(self, text: str) -> int:
+        return len(self.encoding.encode(text, disallowed_special=()))
+
+    def reduce_groups(self, summaries: List[str]) -> List[List[str]]:
+        """Consecutive summaries packed into reduce inputs of at most SUMMARY_REDUCE_TOKENS
+
+        Groups also end after any summary whose hash is 0 mod
+        SUMMARY_REDUCE_FANOUT, so boundaries depend on content rather than
+        position: an edit early in a document changes its own group, not
+        every group after it, and the rest stay memo hits. A group always
+        takes at least two summaries, so every level at least halves the
+        count.
+        """
+        groups, current, size = [], [], 0
+        for summary in summaries:
+            tokens = self.count_tokens(summary)
+            if len(current) >= 2 and size + tokens > SUMMARY_REDUCE_TOKENS:
+                groups.append(current)
+                current, size = [], 0
+            current.append(summary)
+            size += tokens
+            if len(current) >= 2 and int(text_digest(summary)[:8], 16) % SUMMARY_REDUCE_FANOUT == 0:
+                groups.append(current)
+                current, size = [], 0
+        if current:
+            groups.append(current)
+        return groups
+
+    async def back_off(self, error: Exception, attempt: int, run: SummaryRun) -> int:
+        """Sleep before the next attempt, or re-raise ``error`` if it is not worth retrying"""
+        delay = retry_delay(error, attempt)
+        if delay is None or attempt >= SUMMARY_MAX_RETRIES:
+            raise error
+        run.retries += 1
+        print(f"⏳ Summary call failed ({type(error).__name__}), retry {attempt + 1} in {delay:.1f}s")
+        await asyncio.sleep(delay)
+        return attempt + 1
+
+    async def recall(self, kind: str, text: str, run: SummaryRun) -> Tuple[str, Optional[str]]:
+        """Memo key for summarizing ``text`` and the stored summary, if any"""
+        key = text_digest(self.memo_salt, text)
+        summary = await asyncio.to_thread(result_cache.get, MEMO_NAMESPACES[kind], key)
+        run.count(kind, hit=summary is not None)
+        return key, summary
+
+    async def remember(self, kind: str, key: str, summary: str):
+        await asyncio.to_thread(result_cache.set, MEMO_NAMESPACES[kind], key, summary)
+
+    async def complete(self, kind: str, text: str, run: SummaryRun) -> str:
+        """One summary, from the memo or from a rate limited, retried LLM call"""
+        key, summary = await self.recall(kind, text, run)
+        if summary is not None:
+            return summary
+        prompt = SUMMARY_PROMPT.format(text=text)
+        async with run.semaphore:
+            attempt = 0
+            while True:
+                await llm_limiter.acquire_async()
+                try:
+                    message = await self.llm.ainvoke(prompt)
+                    run.llm_calls += 1
+                    break
+                except Exception as e:
+                    attempt = await self.back_off(e, attempt, run)
+        summary = message.content.strip()
+        await self.remember(kind, key, summary)
+        return summary
+
+    async def complete_stream(self, text: str, run: SummaryRun) -> AsyncIterator[str]:
+        """The final reduce in streaming mode; retried only until the first token arrives"""
+        key, summary = await self.recall("reduce", text, run)
+        if summary is not None:
+            yield summary
+            return
+        prompt = SUMMARY_PROMPT.format(text=text)
+        pieces = []
+        async with run.semaphore:
+            attempt = 0
+            while True:
+                await llm_limiter.acquire_async()
+                try:
+                    async for chunk in self.llm.astream(prompt):
+                        if chunk.content:
+                            pieces.append(chunk.content)
+                            yield chunk.content
+                    run.llm_calls += 1
+                    break
+                except Exception as e:
+                    if pieces:
+                        raise
+                    attempt = await self.back_off(e, attempt, run)
+        await self.remember("reduce", key, "".join(pieces).strip())
+
+    async def reduce(self, group: List[str], run: SummaryRun) -> str:
+        if len(group) == 1:
+            return group[0]
+        return await self.complete("reduce", "\n\n".join(group), run)
+
+    async def section(self, index: int, chunk: str, run: SummaryRun) -> Tuple[int, str]:
+        return index, await self.complete("map", chunk, run)
+
+    async def summarize_events(self, chunks: List[str],
+                               concurrency: int = SUMMARY_CONCURRENCY) -> AsyncIterator[Tuple[str, Dict]]:
+        """The map-reduce as (event, data) pairs
+
+        "section" for each chunk summary as soon as its call finishes,
+        "reduce" when an intermediate level starts, "token" for each piece
+        of the streamed final reduce, then "done" with the full summary
+        and stats.
+        """
+        started = time.perf_counter()
+        run = SummaryRun(concurrency)
+        tasks = [asyncio.ensure_future(self.section(i, chunk, run)) for i, chunk in enumerate(chunks)]
+        try:
+            summaries: List[str] = [""] * len(chunks)
+            for completed, next_section in enumerate(asyncio.as_completed(tasks), 1):
+                index, summary = await next_section
+                summaries[index] = summary
+                yield "section", {"index": index, "summary": summary, "completed": completed, "total": len(chunks)}
+
+            while len(summaries) > 1:
+                run.reduce_levels += 1
+                groups = self.reduce_groups(summaries)
+                if len(groups) > 1:
+                    yield "reduce", {"level": run.reduce_levels, "inputs": len(summaries), "groups": len(groups)}
+                    summaries = await gather_or_cancel([self.reduce(group, run) for group in groups])
+                    continue
+                pieces = []
+                async for piece in self.complete_stream("\n\n".join(groups[0]), run):
+                    pieces.append(piece)
+                    yield "token", {"text": piece}
+                summaries = ["".join(pieces).strip()]
+
+            yield "done", {
+                "summary": summaries[0] if summaries else "",
+                "stats": {
+                    "chunks": len(chunks),
+                    **run.stats(),
+                    "seconds": round(time.perf_counter() - started, 2),
+                },
+            }
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def summarize(self, chunks: List[str], concurrency: int = SUMMARY_CONCURRENCY) -> Dict:
+        """Summary of pre-split ``chunks`` plus stats about the map-reduce that produced it"""
+        result = None
+        async for event, data in self.summarize_events(chunks, concurrency):
+            if event == "done":
+                result = data
+        return result
 
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
 
-    finally:
-        os.remove(tmp_path)
+pdf_summarizer = PDFSummarizer()
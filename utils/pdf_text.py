@@ -0,0 +1,60 @@
+import os
+from typing import Iterator, List, Optional
+
+from utils.executors import process_pool
+
+PDF_MAX_PAGES = int(os.getenv("PDF_MAX_PAGES", "500"))
+PDF_MAX_CHARS = int(os.getenv("PDF_MAX_CHARS", "2000000"))
+PDF_PARALLEL_MIN_PAGES = int(os.getenv("PDF_PARALLEL_MIN_PAGES", "64"))
+PDF_WORKERS = int(os.getenv("PDF_WORKERS", str(min(4, os.cpu_count() or 2))))
+
+
+def iter_pages(path: str, start: int = 0, stop: Optional[int] = None) -> Iterator[str]:
+    """Text of each page in ``[start, stop)``, one page in memory at a time"""
+    import fitz  # PyMuPDF; imported on first use to keep API startup fast
+
+    with fitz.open(path) as doc:
+        for number in range(start, min(stop if stop is not None else doc.page_count, doc.page_count)):
+            yield doc.load_page(number).get_text()
+
+
+def extract_range(path: str, start: int, stop: int, max_chars: int = PDF_MAX_CHARS) -> str:
+    """Pages ``[start, stop)`` joined, stopping once ``max_chars`` is reached"""
+    pages: List[str] = []
+    total = 0
+    for text in iter_pages(path, start, stop):
+        pages.append(text)
+        total += len(text) + 1
+        if total >= max_chars:
+            break
+    return "\n".join(pages)[:max_chars]
+
+
+def page_count(path: str) -> int:
+    import fitz
+
+    with fitz.open(path) as doc:
+        return doc.page_count
+
+
+def extract_text(path: str, max_pages: int = PDF_MAX_PAGES, max_chars: int = PDF_MAX_CHARS,
+                 parallel: bool = True) -> str:
+    """Text of a PDF's first ``max_pages`` pages, at most ``max_chars`` characters
+
+    Documents of PDF_PARALLEL_MIN_PAGES or more are split into page ranges
+    extracted in worker processes. Pass ``parallel=False`` when already
+    running inside a worker. Raises on unreadable files.
+    """
+    total_pages = page_count(path)
+    pages = min(total_pages, max_pages)
+    if total_pages > max_pages:
+        print(f"📄 {os.path.basename(path)}: extracting the first {max_pages} of {total_pages} pages")
+
+    if not parallel or PDF_WORKERS < 2 or pages < PDF_PARALLEL_MIN_PAGES:
+        return extract_range(path, 0, pages, max_chars)
+
+    step = -(-pages // PDF_WORKERS)
+    pool = process_pool("pdf_text", PDF_WORKERS)
+    futures = [pool.submit(extract_range, path, start, min(start + step, pages), max_chars)
+               for start in range(0, pages, step)]
+    return "\n".join(future.result() for future in futures)[:max_chars]
@@ -0,0 +1,92 @@
+import asyncio
+import os
+import random
+import threading
+import time
+from typing import Dict
+from urllib.parse import urlparse
+
+SCRAPE_RATE_PER_SECOND = float(os.getenv("SCRAPE_RATE_PER_SECOND", "0.5"))
+SCRAPE_BURST = int(os.getenv("SCRAPE_BURST", "2"))
+SCRAPE_JITTER_SECONDS = float(os.getenv("SCRAPE_JITTER_SECONDS", "1.0"))
+
+
+class TokenBucket:
+    """Thread-safe token bucket; ``reserve`` books a token and says how long to wait for it"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            # A negative balance is the queue of callers already waiting
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    async def acquire_async(self, tokens: float = 1.0):
+        delay = self.reserve(tokens)
+        if delay:
+            await asyncio.sleep(delay)
+
+
+class DomainRateLimiter:
+    """One token bucket per host, plus random jitter so requests don't arrive in lockstep"""
+
+    def __init__(self, rate: float = SCRAPE_RATE_PER_SECOND, burst: int = SCRAPE_BURST,
+                 jitter: float = SCRAPE_JITTER_SECONDS):
+        self.rate = rate
+        self.burst = burst
+        self.jitter = jitter
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+        self.waits = 0
+        self.wait_seconds = 0.0
+
+    @staticmethod
+    def domain(url_or_domain: str) -> str:
+        host = urlparse(url_or_domain).netloc if "://" in url_or_domain else url_or_domain
+        host = host.lower().split(":")[0]
+        return host[4:] if host.startswith("www.") else host
+
+    def _bucket(self, domain: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(domain)
+            if bucket is None:
+                bucket = self._buckets[domain] = TokenBucket(self.rate, self.burst)
+            return bucket
+
+    def reserve(self, url_or_domain: str) -> float:
+        delay = self._bucket(self.domain(url_or_domain)).reserve()
+        if self.jitter:
+            delay += random.uniform(0, self.jitter)
+        with self._lock:
+            self.waits += 1
+            self.wait_seconds += delay
+        return delay
+
+    def wait(self, url_or_domain: str):
+        time.sleep(self.reserve(url_or_domain))
+
+    async def wait_async(self, url_or_domain: str):
+        await asyncio.sleep(self.reserve(url_or_domain))
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "rate_per_second": self.rate,
+                "burst": self.burst,
+                "domains": sorted(self._buckets),
+                "waits": self.waits,
+                "avg_wait_seconds": round(self.wait_seconds / self.waits, 3) if self.waits else 0.0,
+            }
+
+
+# Shared by every scraping engine so concurrent crawls stay polite per site
+scrape_limiter = DomainRateLimiter()
@@ -0,0 +1,179 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, Optional
+
+CACHE_DIR = os.getenv("CACHE_DIR", os.path.join("temp", "cache"))
+CACHE_MEMORY_ENTRIES = int(os.getenv("CACHE_MEMORY_ENTRIES", "512"))
+CACHE_DISK_MAX_MB = int(os.getenv("CACHE_DISK_MAX_MB", "1024"))
+
+DAY = 24 * 3600
+# Per-namespace time-to-live in seconds
+DEFAULT_TTLS = {
+    "transcript": 30 * DAY,
+    "posture": 30 * DAY,
+    "analysis": 7 * DAY,
+    "youtube": 7 * DAY,
+    "summary": 30 * DAY,
+    "summary_chunk": 90 * DAY,
+    "summary_reduce": 30 * DAY,
+    "ats": 1 * DAY,
+}
+FALLBACK_TTL = int(os.getenv("CACHE_TTL_SECONDS", str(DAY)))
+
+
+def file_digest(path: str, chunk_size: int = 1024 * 1024) -> str:
+    """sha256 of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def text_digest(*parts: str) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8", errors="ignore"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Two-tier cache for JSON-serializable results: in-memory LRU in front of a disk store
+
+    Values are shared between callers, so treat anything returned by ``get``
+    as read-only.
+    """
+
+    def __init__(self, cache_dir: str = CACHE_DIR, memory_entries: int = CACHE_MEMORY_ENTRIES,
+                 disk_max_mb: int = CACHE_DISK_MAX_MB):
+        self.cache_dir = cache_dir
+        self.memory_entries = memory_entries
+        self.disk_max_bytes = disk_max_mb * 1024 * 1024
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_bytes: Optional[int] = None
+        self._counters = defaultdict(lambda: {"memory_hits": 0, "disk_hits": 0, "misses": 0, "writes": 0})
+
+    def _path(self, namespace: str, key: str) -> str:
+        return os.path.join(self.cache_dir, namespace, key[:2], f"{key}.json")
+
+    def _remember(self, full_key: str, expires: float, value: Any):
+        self._memory[full_key] = (expires, value)
+        self._memory.move_to_end(full_key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, namespace: str, key: str, default: Any = None) -> Any:
+        full_key = f"{namespace}:{key}"
+        now = time.time()
+
+        with self._lock:
+            entry = self._memory.get(full_key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._memory.move_to_end(full_key)
+                    self._counters[namespace]["memory_hits"] += 1
+                    return entry[1]
+                del self._memory[full_key]
+
+        path = self._path(namespace, key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            stored = None
+
+        with self._lock:
+            if stored is None or stored.get("expires", 0) <= now:
+                self._counters[namespace]["misses"] += 1
+                if stored is not None:
+                    self._remove_file(path)
+                return default
+            self._counters[namespace]["disk_hits"] += 1
+            self._remember(full_key, stored["expires"], stored["value"])
+
+        try:
+            os.utime(path)  # keeps disk eviction least-recently-used
+        except OSError:
+            pass
+        return stored["value"]
+
+    def set(self, namespace: str, key: str, value: Any, ttl: Optional[int] = None):
+        ttl = ttl if ttl is not None else DEFAULT_TTLS.get(namespace, FALLBACK_TTL)
+        expires = time.time() + ttl
+        payload = json.dumps({"expires": expires, "value": value}).encode("utf-8")
+
+        path = self._path(namespace, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+        try:
+            previous = os.path.getsize(path)
+        except OSError:
+            previous = 0
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._remember(f"{namespace}:{key}", expires, value)
+            self._counters[namespace]["writes"] += 1
+            if self._disk_bytes is not None:
+                self._disk_bytes += len(payload) - previous
+            self._enforce_disk_cap()
+
+    def _remove_file(self, path: str):
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+            if self._disk_bytes is not None:
+                self._disk_bytes -= size
+        except OSError:
+            pass
+
+    def _scan(self):
+        files = []
+        for root, _, names in os.walk(self.cache_dir):
+            for name in names:
+                if name.endswith(".json"):
+                    path = os.path.join(root, name)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    files.append((stat.st_mtime, stat.st_size, path))
+        return files
+
+    def _enforce_disk_cap(self):
+        if self._disk_bytes is None:
+            self._disk_bytes = sum(size for _, size, _ in self._scan())
+        if self._disk_bytes <= self.disk_max_bytes:
+            return
+        # Drop least recently used files until we are 10% under the cap
+        target = self.disk_max_bytes * 0.9
+        for _, _, path in sorted(self._scan()):
+            if self._disk_bytes <= target:
+                break
+            self._remove_file(path)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            namespaces = {}
+            for namespace, counts in self._counters.items():
+                lookups = counts["memory_hits"] + counts["disk_hits"] + counts["misses"]
+                hits = counts["memory_hits"] + counts["disk_hits"]
+                namespaces[namespace] = {**counts, "hit_ratio": round(hits / lookups, 3) if lookups else 0.0}
+            return {
+                "memory_entries": len(self._memory),
+                "memory_max_entries": self.memory_entries,
+                "disk_mb": round(self._disk_bytes / (1024 * 1024), 1) if self._disk_bytes is not None else None,
+                "disk_max_mb": self.disk_max_bytes // (1024 * 1024),
+                "namespaces": namespaces,
+            }
+
+
+result_cache = ResultCache()
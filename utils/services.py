@@ -0,0 +1,107 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+NOT_LOADED, LOADING, LOADED, FAILED = "not_loaded", "loading", "loaded", "failed"
+
+
+class ServiceUnavailable(Exception):
+    """Raised when a service failed to load; the API maps it to 503"""
+
+    def __init__(self, name: str, error: str):
+        super().__init__(f"{name} unavailable: {error}")
+        self.name = name
+        self.error = error
+
+
+class _Service:
+    def __init__(self, loader: Callable[[], Any]):
+        self.loader = loader
+        self.state = NOT_LOADED
+        self.value: Any = None
+        self.error: Optional[str] = None
+        self.load_seconds: Optional[float] = None
+        self.lock = threading.Lock()
+
+
+class ServiceRegistry:
+    """Named capabilities that are imported/constructed on first use
+
+    Heavy dependencies (Whisper/torch, MediaPipe, Selenium, LangChain) are
+    only paid for by the endpoints that need them, and a failed load is
+    remembered instead of retried on every request.
+    """
+
+    def __init__(self):
+        self._services: Dict[str, _Service] = {}
+
+    def register(self, name: str, loader: Callable[[], Any]):
+        self._services[name] = _Service(loader)
+
+    def get(self, name: str) -> Any:
+        service = self._services[name]
+        if service.state == LOADED:
+            return service.value
+        with service.lock:
+            if service.state == NOT_LOADED:
+                service.state = LOADING
+                start = time.perf_counter()
+                try:
+                    service.value = service.loader()
+                    service.state = LOADED
+                    print(f"{name} loaded")
+                except Exception as e:
+                    service.error = str(e)
+                    service.state = FAILED
+                    print(f"{name} failed: {e}")
+                service.load_seconds = round(time.perf_counter() - start, 3)
+        if service.state == FAILED:
+            raise ServiceUnavailable(name, service.error)
+        return service.value
+
+    def available(self, name: str) -> bool:
+        try:
+            self.get(name)
+            return True
+        except ServiceUnavailable:
+            return False
+
+    def reset(self, name: str):
+        """Forget a failed load so the next get() retries it"""
+        service = self._services[name]
+        with service.lock:
+            if service.state == FAILED:
+                service.state = NOT_LOADED
+                service.error = None
+
+    def warm_up(self, names: Optional[Iterable[str]] = None, background: bool = True, retry_failed: bool = False):
+        """Load services ahead of the first request, each in its own thread
+
+        With ``retry_failed``, services whose load failed earlier are
+        tried again, e.g. after a missing model or dependency was fixed.
+        """
+        names = list(names) if names is not None else list(self._services)
+        unknown = [name for name in names if name not in self._services]
+        if unknown:
+            raise KeyError(f"Unknown services: {', '.join(unknown)}")
+        if retry_failed:
+            for name in names:
+                self.reset(name)
+        threads = [
+            threading.Thread(target=self.available, args=(name,), name=f"warm-{name}", daemon=True)
+            for name in names
+        ]
+        for thread in threads:
+            thread.start()
+        if not background:
+            for thread in threads:
+                thread.join()
+
+    def status(self) -> Dict[str, Dict]:
+        return {
+            name: {"state": service.state, "error": service.error, "load_seconds": service.load_seconds}
+            for name, service in self._services.items()
+        }
+
+
+services = ServiceRegistry()
@@ -1,23 +1,8 @@
-import subprocess
-import os
-import tempfile
-import wave
-import contextlib
+from typing import Union
+from utils.media_ingest import MediaBundle, as_media
 
-def analyze_speech(video_path: str) -> int:
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as temp_audio:
-        temp_wav = temp_audio.name
-
-    subprocess.call([
-        "ffmpeg", "-y", "-i", video_path,
-        "-ac", "1", "-ar", "16000",
-        temp_wav
-    ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-
-    with contextlib.closing(wave.open(temp_wav, 'r')) as f:
-        frames = f.getnframes()
-        rate = f.getframerate()
-        duration = frames / float(rate)
+def analyze_speech(video_path: Union[str, MediaBundle]) -> int:
+    duration = as_media(video_path).duration
 
     if duration < 3:
         score = 40
@@ -28,6 +13,5 @@ def analyze_speech(video_path: str) -> int:
     else:
         score = 60
 
-    os.remove(temp_wav)
     print(score, "ye dekh le $$$$$$$$$$$$$$$")
     return score
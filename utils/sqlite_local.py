@@ -0,0 +1,30 @@
+import os
+import sqlite3
+import threading
+
+SQLITE_BUSY_TIMEOUT = 30  # seconds a writer waits for another connection's lock
+
+
+class ThreadLocalSQLite:
+    """One autocommit connection per thread to a WAL-mode SQLite file
+
+    WAL lets readers run alongside the single writer; transactions are
+    opened explicitly with BEGIN IMMEDIATE where they are needed.
+    """
+
+    def __init__(self, db_path: str, schema: str = ""):
+        self.db_path = db_path
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        if schema:
+            self.connection().executescript(schema)
+
+    def connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=SQLITE_BUSY_TIMEOUT, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
@@ -0,0 +1,91 @@
+import time
+from concurrent.futures import Executor, FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+
+class StageError(Exception):
+    """Raised when a stage fails; keeps the stage name for error reporting"""
+
+    def __init__(self, stage: str, error: Exception):
+        super().__init__(f"{stage} error: {error}")
+        self.stage = stage
+        self.error = error
+
+
+class StageGraph:
+    """Small DAG executor: stages run as soon as the stages they depend on finish
+
+    Each stage function is called with the results of its dependencies as
+    keyword arguments, so ``add("feedback", fn, deps=["transcript"])`` calls
+    ``fn(transcript=...)``.
+    """
+
+    def __init__(self):
+        self._stages: Dict[str, Tuple[Callable, Tuple[str, ...]]] = {}
+
+    def add(self, name: str, fn: Callable, deps: Iterable[str] = ()) -> "StageGraph":
+        deps = tuple(deps)
+        for dep in deps:
+            if dep not in self._stages:
+                raise ValueError(f"Stage {name} depends on unknown stage {dep}")
+        self._stages[name] = (fn, deps)
+        return self
+
+    def _timed(self, name: str, fn: Callable, kwargs: Dict, on_event: Optional[Callable]):
+        if on_event:
+            on_event(name, "started")
+        start = time.perf_counter()
+        try:
+            result = fn(**kwargs)
+        except Exception as e:
+            raise StageError(name, e) from e
+        elapsed = time.perf_counter() - start
+        if on_event:
+            on_event(name, "finished", elapsed)
+        return result, elapsed
+
+    def run(self, executor: Optional[Executor] = None, max_workers: Optional[int] = None,
+            on_event: Optional[Callable] = None) -> Tuple[Dict, Dict[str, float]]:
+        """Run every stage and return (results, timings in seconds)
+
+        ``on_event(stage, "started" | "finished", seconds=None)`` is called from
+        the worker threads and can be used to report progress. When a stage
+        fails, stages not yet started are skipped and running ones are waited
+        for before its StageError is raised.
+        """
+        own_executor = executor is None
+        if own_executor:
+            executor = ThreadPoolExecutor(max_workers=max_workers or len(self._stages) or 1,
+                                          thread_name_prefix="stage")
+
+        results: Dict = {}
+        timings: Dict[str, float] = {}
+        pending = dict(self._stages)
+        running = {}
+        start = time.perf_counter()
+
+        try:
+            while pending or running:
+                for name, (fn, deps) in list(pending.items()):
+                    if all(dep in results for dep in deps):
+                        kwargs = {dep: results[dep] for dep in deps}
+                        running[executor.submit(self._timed, name, fn, kwargs, on_event)] = name
+                        del pending[name]
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    results[name], timings[name] = future.result()
+        except Exception:
+            # Stages that already started cannot be interrupted; let them finish
+            # so a failed run never leaves work consuming CPU behind it
+            for future in running:
+                future.cancel()
+            wait(running)
+            raise
+        finally:
+            if own_executor:
+                executor.shutdown(wait=False)
+
+        timings["total"] = time.perf_counter() - start
+        return results, timings
@@ -0,0 +1,131 @@
+import asyncio
+import hashlib
+import json
+import os
+import uuid
+from pathlib import Path
+from typing import Dict, Optional
+
+from fastapi import HTTPException, UploadFile
+
+UPLOAD_DIR = os.getenv("UPLOAD_DIR", os.path.join("temp", "uploads"))
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+MAX_VIDEO_BYTES = int(os.getenv("MAX_VIDEO_MB", "500")) * 1024 * 1024
+MAX_PDF_BYTES = int(os.getenv("MAX_PDF_MB", "25")) * 1024 * 1024
+MAX_ZIP_BYTES = int(os.getenv("MAX_ZIP_MB", "200")) * 1024 * 1024
+MAX_BATCH_BYTES = int(os.getenv("MAX_BATCH_MB", "1024")) * 1024 * 1024
+FORM_OVERHEAD_BYTES = 1024 * 1024  # multipart boundaries and small text fields around a file
+
+
+class SavedUpload:
+    """An upload written to a unique temp path, with its size and sha256"""
+
+    def __init__(self, path: str, filename: str, size: int, sha256: str):
+        self.path = path
+        self.filename = filename
+        self.size = size
+        self.sha256 = sha256
+
+    def cleanup(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cleanup()
+
+
+def _too_large(max_bytes: int) -> HTTPException:
+    return HTTPException(status_code=413, detail=f"File too large (limit {max_bytes // (1024 * 1024)} MB)")
+
+
+async def save_upload(file: UploadFile, max_bytes: int, suffix: Optional[str] = None) -> SavedUpload:
+    """Stream an upload to disk in chunks, hashing it on the way
+
+    Memory use stays at one chunk whatever the upload size, and oversized
+    uploads are rejected with 413 as soon as the limit is crossed.
+    """
+    # Starlette knows the spooled size up front; reject before copying anything
+    if getattr(file, "size", None) and file.size > max_bytes:
+        raise _too_large(max_bytes)
+
+    filename = Path(file.filename or "upload").name
+    suffix = suffix if suffix is not None else Path(filename).suffix.lower()
+    os.makedirs(UPLOAD_DIR, exist_ok=True)
+    path = os.path.join(UPLOAD_DIR, f"{uuid.uuid4().hex}{suffix}")
+
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with open(path, "wb") as out:
+            while True:
+                chunk = await file.read(UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise _too_large(max_bytes)
+                digest.update(chunk)
+                await asyncio.to_thread(out.write, chunk)
+    except BaseException:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        raise
+
+    return SavedUpload(path, filename, size, digest.hexdigest())
+
+
+class UploadLimitMiddleware:
+    """Rejects request bodies over a per-route limit before they are parsed
+
+    ``save_upload`` only runs after the multipart parser has spooled the
+    whole body to disk. Here a declared Content-Length over the limit gets
+    413 before anything is read, and bodies without one are cut off with
+    413 as soon as the limit is crossed.
+    """
+
+    def __init__(self, app, limits: Dict[str, int]):
+        self.app = app
+        self.limits = {path: max_bytes + FORM_OVERHEAD_BYTES for path, max_bytes in limits.items()}
+
+    async def __call__(self, scope, receive, send):
+        limit = self.limits.get(scope["path"]) if scope["type"] == "http" else None
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        try:
+            declared = int(headers.get(b"content-length", b"0"))
+        except ValueError:
+            declared = 0
+        if declared > limit:
+            await self._reject(send, limit)
+            return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            received += len(message.get("body", b""))
+            if received > limit:
+                raise _too_large(limit - FORM_OVERHEAD_BYTES)
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+    async def _reject(self, send, limit: int):
+        body = json.dumps({"detail": _too_large(limit - FORM_OVERHEAD_BYTES).detail}).encode("utf-8")
+        await send({"type": "http.response.start", "status": 413, "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            (b"connection", b"close"),
+        ]})
+        await send({"type": "http.response.body", "body": body})
@@ -1,12 +1,14 @@
 import yt_dlp
-import whisper
 import os
 import tempfile
 from pathlib import Path
 import re
 from fpdf import FPDF
+from utils.model_registry import whisper_registry
+from utils.result_cache import result_cache, text_digest
 
 class YouTubeConverter:
+    @staticmethod
     def extract_video_id(url):
         """Extract video ID from YouTube URL"""
         patterns = [
@@ -62,8 +64,7 @@ class YouTubeConverter:
     def transcribe_audio_whisper(self, audio_path):
         """Transcribe audio using Whisper"""
         try:
-            model = whisper.load_model("base")
-            result = model.transcribe(audio_path)
+            result = whisper_registry.transcribe(audio_path)
 
             segments = [{
                 'start': seg['start'],
@@ -135,26 +136,44 @@ class YouTubeConverter:
         pdf.output(output_path)
         return output_path
 
-    def youtube_to_transcript(self, url):
+    def youtube_to_transcript(self, url, progress=None):
         """Main function to convert YouTube video to transcript"""
+        progress = progress or (lambda stage, **info: None)
         try:
+            try:
+                video_id = re.sub(r'[^A-Za-z0-9_-]', '', self.extract_video_id(url))
+            except ValueError:
+                # Other URL shapes (shorts, live, ...) are still handled by yt-dlp
+                video_id = text_digest(url)[:16]
+            final_path = os.path.join("public", "pdfs", f"{video_id}.pdf")
+
+            # Popular videos are converted once; the cached result points at their PDF
+            cached = result_cache.get("youtube", video_id)
+            if cached is not None and os.path.exists(final_path):
+                progress("cached")
+                return cached
+
             with tempfile.TemporaryDirectory() as temp_dir:
                 audio_output = os.path.join(temp_dir, "audio.%(ext)s")
+                progress("downloading")
                 video_info = self.download_youtube_audio(url, audio_output)
 
                 audio_path = video_info['audio_path']
+                progress("transcribing", duration=video_info['duration'])
                 transcript_data = self.transcribe_audio_whisper(audio_path)
 
-                final_path = os.path.join("public", "pdfs", "transcript.pdf")
+                progress("rendering")
                 os.makedirs(os.path.dirname(final_path), exist_ok=True)
                 self.generate_transcript_pdf(video_info, transcript_data, final_path)
 
-                return {
+                result = {
                     'video_info': video_info,
                     'transcript': transcript_data,
-                    "pdf_url": "/pdfs/transcript.pdf",
+                    "pdf_url": f"/pdfs/{video_id}.pdf",
                     'success': True
                 }
+                result_cache.set("youtube", video_id, result)
+                return result
 
         except Exception as e:
             return {